@@ -1,20 +1,264 @@
 # app.py - Version finale pour GitHub et Streamlit Cloud
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import os
+import sys
+import time
+import json
+import pickle
+import hashlib
+import tempfile
+import functools
+import importlib
+import importlib.util
+import shutil
+import glob
+import io
+import base64
+import inspect
+import subprocess
+import threading
+import uuid
+import asyncio
+import ssl
+import re
+import math
+import unicodedata
+import logging
+import sqlite3
+import atexit
+from datetime import date, datetime, timedelta
+from urllib.parse import urlsplit
+from collections import OrderedDict, namedtuple, Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+
+# =====================================================
+# IMPORTS DIFFÉRÉS
+# =====================================================
+@st.cache_resource(show_spinner=False)
+def _import_timings():
+    # Durée d'import de chaque module différé, pour le processus
+    return {}
+
+class _LazyModule:
+    """
+    Proxy de module : l'import réel n'a lieu qu'au premier accès à un attribut
+    """
+    def __init__(self, name, requires=()):
+        self._name = name
+        self._requires = requires
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            # Les dépendances optionnelles sont importées d'abord : plotly teste
+            # sys.modules et verrait un pandas à moitié importé par un autre thread
+            for dependency in self._requires:
+                importlib.import_module(dependency)
+            timings = _import_timings()
+            started = time.perf_counter()
+            self._module = importlib.import_module(self._name)
+            timings.setdefault(self._name, time.perf_counter() - started)
+        return getattr(self._module, attr)
+
+# pandas et plotly coûtent ~1s d'import : chargés seulement quand une page en a besoin
+pd = _LazyModule("pandas")
+px = _LazyModule("plotly.express", requires=("numpy", "pandas"))
+go = _LazyModule("plotly.graph_objects", requires=("numpy", "pandas"))
+np = _LazyModule("numpy")
+duckdb = _LazyModule("duckdb")
 
 # =====================================================
 # CONFIG
 # =====================================================
+# Titre provisoire : celui du profil est appliqué une fois le profil chargé
+# (set_page_config peut être rappelé après d'autres éléments depuis Streamlit 1.46)
 st.set_page_config(
-    page_title="Martin Alquier – Business Analyst",
+    page_title="Portfolio",
     page_icon="📊",
     layout="wide",
     initial_sidebar_state="expanded"
 )
 
+# =====================================================
+# CACHE DISQUE PARTAGÉ (MULTI-WORKERS)
+# =====================================================
+# Répertoire commun à tous les workers Streamlit d'une même machine
+CACHE_DIR = os.environ.get(
+    "PORTFOLIO_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "portfolio_cache")
+)
+
+# Version du code : invalide le cache disque à chaque déploiement
+# (la version des données, DATA_VERSION, est calculée après les données)
+with open(__file__, "rb") as _source:
+    CODE_VERSION = hashlib.sha256(_source.read()).hexdigest()[:12]
+
+# Fichiers gardés par espace du cache disque borné (figures : une par version des
+# données et combinaison de filtres, les versions remplacées sont supprimées)
+DISK_CACHE_FILES_KEPT = 256
+
+def _cache_key(*parts):
+    return hashlib.sha256(pickle.dumps(parts, protocol=4)).hexdigest()[:32]
+
+def _atomic_write(path, data):
+    """
+    Écrit un fichier de façon atomique (fichier temporaire puis os.replace)
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _prune_directory(directory, keep):
+    """
+    Ne garde que les `keep` fichiers les plus récemment utilisés d'un répertoire
+    """
+    try:
+        entries = sorted(os.scandir(directory), key=lambda entry: entry.stat().st_mtime, reverse=True)
+    except OSError:
+        return
+    for entry in entries[keep:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            # Déjà supprimé par un autre worker
+            pass
+
+def disk_cache(namespace, max_files=None):
+    """
+    Mémorise le résultat d'une fonction sur disque, partagé entre les workers.
+    Comme pour st.cache_data, les paramètres préfixés par « _ » (données déjà
+    identifiées par un autre paramètre de version) ne font pas partie de la clé.
+    Avec `max_files`, les fichiers les moins récemment lus de l'espace sont
+    supprimés après chaque écriture
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = [(name, value) for name, value in bound.arguments.items() if not name.startswith("_")]
+            key = _cache_key(CODE_VERSION, DATA_VERSION, func.__qualname__, arguments)
+            path = os.path.join(CACHE_DIR, namespace, f"{key}.pkl")
+            try:
+                with open(path, "rb") as f:
+                    result = pickle.load(f)
+                if max_files:
+                    # La date de modification sert d'ordre LRU pour l'élagage
+                    os.utime(path)
+                return result
+            except Exception:
+                pass
+            result = func(*args, **kwargs)
+            try:
+                _atomic_write(path, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+                if max_files:
+                    _prune_directory(os.path.dirname(path), max_files)
+            except OSError:
+                pass
+            return result
+        return wrapper
+    return decorator
+
+def _write_dataset(directory, df):
+    """
+    Sérialise un DataFrame : une colonne numérique = un fichier .npy mappable
+    """
+    tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(directory), suffix=".tmp")
+    manifest = {"columns": []}
+    for i, col in enumerate(df.columns):
+        if pd.api.types.is_numeric_dtype(df[col]):
+            filename = f"col_{i}.npy"
+            np.save(os.path.join(tmp_dir, filename), df[col].to_numpy())
+            manifest["columns"].append({"name": col, "kind": "numeric", "file": filename})
+        else:
+            manifest["columns"].append({"name": col, "kind": "values", "values": df[col].tolist()})
+    with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    try:
+        os.replace(tmp_dir, directory)
+    except OSError:
+        # Un autre worker a écrit le dataset en même temps
+        for filename in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, filename))
+        os.rmdir(tmp_dir)
+
+def frame_version(df):
+    """
+    Hash du contenu d'un DataFrame : version d'un dataset
+    """
+    return _cache_key(list(df.columns), pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+
+# Versions conservées par dataset : les plus anciennes sont supprimées. Un worker
+# qui lit encore une version supprimée garde ses pages mappées (POSIX)
+DATASET_VERSIONS_KEPT = int(os.environ.get("PORTFOLIO_DATASET_VERSIONS_KEPT", "3"))
+
+def _prune_datasets(name, keep=DATASET_VERSIONS_KEPT):
+    directories = [path for path in glob.glob(os.path.join(CACHE_DIR, "datasets", f"{name}-*"))
+                   if not path.endswith(".tmp")]
+    directories.sort(key=lambda path: os.path.getmtime(path) if os.path.exists(path) else 0, reverse=True)
+    for path in directories[keep:]:
+        shutil.rmtree(path, ignore_errors=True)
+
+def store_dataset(name, df):
+    """
+    Range un dataset en mémoire partagée et le relit : les colonnes numériques
+    sont mappées (mmap) et partagent leurs pages entre les workers
+    """
+    version = frame_version(df)
+    directory = os.path.join(CACHE_DIR, "datasets", f"{name}-{version}")
+    manifest_path = os.path.join(directory, "manifest.json")
+    if not os.path.exists(manifest_path):
+        os.makedirs(os.path.dirname(directory), exist_ok=True)
+        _write_dataset(directory, df)
+        _prune_datasets(name)
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    columns = {}
+    for col in manifest["columns"]:
+        if col["kind"] == "numeric":
+            columns[col["name"]] = np.load(os.path.join(directory, col["file"]), mmap_mode="r")
+        else:
+            columns[col["name"]] = col["values"]
+    return pd.DataFrame(columns, copy=False), version
+
+PROFILE_BUDGET_MB = float(os.environ.get("PORTFOLIO_PROFILE_BUDGET_MB", "16"))
+PROFILES_BUDGET_MB = float(os.environ.get("PORTFOLIO_PROFILES_BUDGET_MB", "256"))
+
+@st.cache_resource(show_spinner=False)
+def profile_store():
+    # Partitions = profils (PartitionedStore, plus bas) : un profil peu consulté est évincé en entier
+    return PartitionedStore(
+        partition_budget=PROFILE_BUDGET_MB * 1024 ** 2,
+        total_budget=PROFILES_BUDGET_MB * 1024 ** 2,
+        label="Profil"
+    )
+
+def profile_cache(func):
+    """
+    Cache mémoire partitionné par profil (à la place de st.cache_data, qui n'a
+    pas de plafond mémoire). Comme pour st.cache_data, les paramètres préfixés
+    par « _ » ne font pas partie de la clé
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        key = (func.__qualname__, DATA_VERSION,
+               _cache_key([(name, value) for name, value in bound.arguments.items() if not name.startswith("_")]))
+        return profile_store().get_or_build(PROFILE["slug"], key, lambda: func(*args, **kwargs))
+    return wrapper
+
 # =====================================================
 # FONCTIONS UTILITAIRES POUR LES IMAGES
 # =====================================================
@@ -52,8 +296,7 @@ def load_image(image_filename, alt_text="Image"):
 # =====================================================
 # CSS PERSONNALISÉ
 # =====================================================
-def load_custom_css():
-    st.markdown("""
+CUSTOM_CSS = """
     <style>
     /* Style général */
     .main {
@@ -279,20 +522,301 @@ def load_custom_css():
         }
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def load_custom_css():
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# =====================================================
+# LANGUES (FR / EN)
+# =====================================================
+# Le français est la langue source : les textes du code et des données servent
+# de clés aux catalogues locales/<langue>.json (texte source -> traduction)
+LOCALES_DIR = os.environ.get("PORTFOLIO_LOCALES_DIR",
+                             os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales"))
+LANGUAGES = {"fr": "🇫🇷 Français", "en": "🇬🇧 English"}
+DEFAULT_LANGUAGE = "fr"
+
+def _catalog_key(text):
+    # Espaces normalisés : les textes sur plusieurs lignes restent des clés stables
+    return " ".join(text.split())
+
+@st.cache_resource(show_spinner=False)
+def catalog(lang):
+    """
+    Catalogue d'une langue, chargé à sa première utilisation seulement. Le JSON
+    est compilé une fois en dictionnaire picklé (clés normalisées), partagé
+    entre les workers dans le cache disque
+    """
+    if lang == DEFAULT_LANGUAGE:
+        return {}
+    source = os.path.join(LOCALES_DIR, f"{lang}.json")
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return {}
+    path = os.path.join(CACHE_DIR, "locales", f"{lang}-{_cache_key(stat.st_mtime_ns, stat.st_size)}.pkl")
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        pass
+    with open(source, encoding="utf-8") as f:
+        compiled = {_catalog_key(text): translation for text, translation in json.load(f).items()}
+    try:
+        _atomic_write(path, pickle.dumps(compiled, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+    return compiled
+
+def requested_language():
+    lang = st.query_params.get("lang", DEFAULT_LANGUAGE)
+    return lang if lang in LANGUAGES else DEFAULT_LANGUAGE
+
+LANG = st.sidebar.selectbox("Langue", list(LANGUAGES), index=list(LANGUAGES).index(requested_language()),
+                            format_func=LANGUAGES.get, label_visibility="collapsed")
+if LANG != requested_language():
+    st.query_params["lang"] = LANG
+CATALOG = catalog(LANG)
+
+def _(text):
+    """
+    Traduction d'un texte source (français) ; le texte lui-même s'il n'est pas traduit
+    """
+    if not CATALOG or not isinstance(text, str):
+        return text
+    return CATALOG.get(_catalog_key(text), text)
+
+def translate(text, lang):
+    """
+    Traduction dans une langue donnée, hors de la langue de l'exécution courante
+    (préchauffage des caches par langue)
+    """
+    table = catalog(lang)
+    if not table or not isinstance(text, str):
+        return text
+    return table.get(_catalog_key(text), text)
+
+def translate_columns(df):
+    """
+    Copie d'un DataFrame aux en-têtes (colonnes et noms d'index) traduits, pour l'affichage
+    """
+    return df.rename(columns=_).rename_axis(index=_, columns=_)
+
+def translate_figure(fig, lang=None, categories=True):
+    """
+    Copie traduite d'une figure (titres, axes, légende et, si `categories`,
+    libellés des catégories) : la figure source, en cache, n'est pas reconstruite
+    """
+    table = catalog(lang or LANG)
+    if not table:
+        return fig
+    translate = lambda text: table.get(_catalog_key(text), text) if isinstance(text, str) else text
+    fig = go.Figure(fig)
+    if fig.layout.title.text:
+        fig.layout.title.text = translate(fig.layout.title.text)
+    if fig.layout.legend.title.text:
+        fig.layout.legend.title.text = translate(fig.layout.legend.title.text)
+    for axis in [*fig.select_xaxes(), *fig.select_yaxes()]:
+        if axis.title.text:
+            axis.title.text = translate(axis.title.text)
+    for trace in fig.data:
+        if trace.name:
+            trace.name = translate(trace.name)
+        if not categories:
+            continue
+        for attribute in ("x", "y", "theta", "text"):
+            values = getattr(trace, attribute, None)
+            if isinstance(values, str):
+                setattr(trace, attribute, translate(values))
+            elif isinstance(values, (list, tuple)) and values and all(isinstance(v, str) for v in values):
+                setattr(trace, attribute, [translate(v) for v in values])
+    return fig
+
+# =====================================================
+# MODE LÉGER (FAIBLE DÉBIT)
+# =====================================================
+LITE_THUMBNAIL_PX = 96
+BADGE_BYTES = 2048      # badge shields.io (image externe) : estimation
+PAGE_WEIGHT = {}        # catégorie -> [octets mode complet, octets mode léger], pour cette exécution
+FIGURE_SIZES_KEPT = 256
+# Les graphiques ne sont pesés que si l'estimation est affichée (interrupteur en bas de page)
+MEASURE_WEIGHT = st.session_state.get("page_weight_open", False)
+
+def lite_mode_requested():
+    """
+    ?lite=1, ou en-tête « Save-Data: on » envoyé par les navigateurs en économie de données
+    """
+    if "lite" in st.query_params:
+        return st.query_params["lite"] == "1"
+    context = getattr(st, "context", None)
+    headers = context.headers if context is not None else {}
+    return headers.get("Save-Data", "").lower() == "on"
+
+def weigh(category, full, lite):
+    totals = PAGE_WEIGHT.setdefault(category, [0, 0])
+    totals[0] += full
+    totals[1] += lite
+
+@st.cache_resource(show_spinner=False)
+def plotly_bundle_bytes():
+    # Chunk JavaScript Plotly du frontend Streamlit, téléchargé avec le premier graphique
+    pattern = os.path.join(os.path.dirname(st.__file__), "static", "static", "js", "PlotlyChart*.js")
+    return sum(os.path.getsize(path) for path in glob.glob(pattern))
+
+@st.cache_data(show_spinner=False)
+def thumbnail(path, size=LITE_THUMBNAIL_PX):
+    """
+    Miniature JPEG d'une image locale (None pour une image distante)
+    """
+    if not os.path.exists(path):
+        return None
+    from PIL import Image
+    with Image.open(path) as image:
+        image.thumbnail((size, size))
+        buffer = io.BytesIO()
+        image.convert("RGB").save(buffer, format="JPEG", quality=70, optimize=True)
+    return buffer.getvalue()
+
+def show_image(path, **kwargs):
+    """
+    st.image, en miniature en mode léger
+    """
+    data = thumbnail(path)
+    weigh("Images", os.path.getsize(path) if os.path.exists(path) else 0, len(data or b""))
+    if not LITE:
+        st.image(path, **kwargs)
+    elif data:
+        st.image(data, width=LITE_THUMBNAIL_PX)
 
-load_custom_css()
+def badge(markdown_image, label, url):
+    """
+    Markdown d'un badge shields.io, ou d'un simple lien texte en mode léger
+    """
+    link = f"[{label}]({url})"
+    weigh("Badges", BADGE_BYTES, len(link))
+    return link if LITE else f"{markdown_image}({url})"
+
+def contact_badges(contact):
+    """
+    Badges LinkedIn / GitHub / Email d'un bloc contact, sur trois colonnes
+    """
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if contact.get("linkedin"):
+            st.markdown(badge("[![LinkedIn](https://img.shields.io/badge/LinkedIn-0077B5?style=for-the-badge&logo=linkedin&logoColor=white)]", "LinkedIn", contact["linkedin"]))
+    with col2:
+        if contact.get("github"):
+            st.markdown(badge("[![GitHub](https://img.shields.io/badge/GitHub-100000?style=for-the-badge&logo=github&logoColor=white)]", "GitHub", contact["github"]))
+    with col3:
+        if contact.get("email"):
+            st.markdown(badge("[![Email](https://img.shields.io/badge/Email-D14836?style=for-the-badge&logo=gmail&logoColor=white)]", "Email", f"mailto:{contact['email']}"))
+
+def _trace_values(values):
+    # Tableaux typés de Plotly (« bdata » base64) après un aller-retour pickle
+    if isinstance(values, dict) and "bdata" in values:
+        array = np.frombuffer(base64.b64decode(values["bdata"]), dtype=values["dtype"])
+        shape = values.get("shape")
+        return array.reshape([int(n) for n in str(shape).split(",")]) if shape else array
+    return values
+
+def figure_summary(fig):
+    """
+    Résumé statique d'une figure : mini-courbe SVG par série numérique,
+    valeurs principales pour les séries catégorielles
+    """
+    rows = []
+    for trace in fig.data:
+        # Traces décoratives (bandes d'incertitude, arêtes) ignorées
+        if trace.hoverinfo == "skip":
+            continue
+        if trace.type == "heatmap":
+            z = np.asarray(_trace_values(trace.z), dtype=float)
+            rows.append(_("{rows}×{columns} valeurs, moyenne {mean:.1f}").format(rows=z.shape[0], columns=z.shape[1],
+                                                                                 mean=np.nanmean(z)))
+            continue
+        horizontal = getattr(trace, "orientation", None) == "h" or trace.type == "funnel"
+        if trace.type == "scatterpolar":
+            values, labels = trace.r, trace.theta
+        else:
+            values, labels = (trace.x, trace.y) if horizontal else (trace.y, trace.x)
+        labels = _trace_values(labels)
+        name = f"{trace.name} : " if trace.name else ""
+        if getattr(trace, "base", None) is not None or getattr(trace, "mode", None) == "markers+text":
+            # Frise (barres avec base) ou réseau : les libellés suffisent
+            items = list(dict.fromkeys(trace.text if trace.text is not None else labels))
+            rows.append(name + " · ".join(map(str, items[:8])) + (" …" if len(items) > 8 else ""))
+            continue
+        try:
+            values = np.asarray(_trace_values(values), dtype=float)
+        except (TypeError, ValueError):
+            continue
+        if labels is not None and len(values) <= 8 and all(isinstance(label, str) for label in labels):
+            # Entonnoir : ordre des étapes ; sinon valeurs décroissantes
+            order = range(len(values)) if trace.type == "funnel" else np.argsort(values)[::-1]
+            rows.append(name + " · ".join(f"{labels[i]} {values[i]:,.0f}" for i in order))
+        elif len(values) >= 2:
+            rows.append(f"{name}{sparkline_svg(values, width=160, height=28)} <b>{values[-1]:,.0f}</b>")
+    title = fig.layout.title.text or ""
+    return ('<div style="border:1px solid #eee;border-radius:8px;padding:0.5rem 0.8rem;margin-bottom:0.8rem;">'
+            + (f"<b>{title}</b><br>" if title else "") + "<br>".join(rows) + "</div>")
+
+@st.cache_resource(show_spinner=False)
+def _figure_sizes():
+    # Taille JSON par contenu de figure, partagée entre les sessions (LRU)
+    return OrderedDict()
+
+def chart_bytes(fig):
+    """
+    Figure JSON, plus le bundle Plotly pour le premier graphique de la page.
+    Sérialisée une fois par contenu de figure : les réexécutions relisent la taille
+    """
+    sizes, key = _figure_sizes(), _cache_key(fig.to_plotly_json())
+    if key not in sizes:
+        sizes[key] = len(fig.to_json())
+        while len(sizes) > FIGURE_SIZES_KEPT:
+            sizes.popitem(last=False)
+    sizes.move_to_end(key)
+    return sizes[key] + (0 if "Graphiques" in PAGE_WEIGHT else plotly_bundle_bytes())
+
+def plotly_chart(fig, **kwargs):
+    """
+    st.plotly_chart, remplacé par un résumé statique en mode léger. Les libellés
+    de catégories restent ceux de la source quand la sélection est renvoyée à l'app
+    """
+    fig = translate_figure(fig, categories=kwargs.get("on_select", "ignore") == "ignore")
+    if not LITE:
+        if MEASURE_WEIGHT:
+            weigh("Graphiques", chart_bytes(fig), len(figure_summary(fig)))
+        return st.plotly_chart(fig, **kwargs)
+    summary = figure_summary(fig)
+    if MEASURE_WEIGHT:
+        weigh("Graphiques", chart_bytes(fig), len(summary))
+    st.markdown(summary, unsafe_allow_html=True)
+    return None
+
+LITE = st.sidebar.toggle(_("⚡ Mode léger"), value=lite_mode_requested(),
+                         help=_("Sans graphiques interactifs ni images pleine taille, pour les connexions lentes"))
+weigh("CSS", len(CUSTOM_CSS), 0)
+if not LITE:
+    load_custom_css()
 
 # =====================================================
 # COMPOSANTS RÉUTILISABLES
 # =====================================================
-def kpi_card(title, value, subtitle="", color="#0f62fe", icon="📊", trend=None):
+def kpi_card(title, value, subtitle="", color="#0f62fe", icon="📊", trend=None, badge=None, sparkline="",
+             higher_is_better=True):
     trend_html = ""
     if trend:
-        trend_color = "#42be65" if trend > 0 else "#da1e28"
+        # La flèche suit le sens de la variation, la couleur dit si elle est favorable
+        trend_color = "#42be65" if (trend > 0) == higher_is_better else "#da1e28"
         trend_icon = "📈" if trend > 0 else "📉"
         trend_html = f'<span style="color:{trend_color};font-weight:600;"> {trend_icon} {abs(trend)}%</span>'
     
+    badge_html = ""
+    if badge:
+        badge_html = f'<span class="badge badge-warning" style="margin-left:auto;margin-bottom:0;">⚠️ {badge}</span>'
+    
     return f"""
     <div style="
         background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
@@ -306,14 +830,80 @@ def kpi_card(title, value, subtitle="", color="#0f62fe", icon="📊", trend=None
         <div style="display: flex; align-items: center; margin-bottom: 10px;">
             <span style="font-size: 1.5rem; margin-right: 10px;">{icon}</span>
             <h4 style="margin:0;color:#333;font-weight:600;">{title}</h4>
+            {badge_html}
         </div>
         <div style="display: flex; align-items: baseline;">
             <h2 style="margin:0;color:#111;">{value}</h2>
             {trend_html}
+        </div>
+        {f'<p style="margin:0.3rem 0 0;color:#666;font-size:0.85rem;">{subtitle}</p>' if subtitle else ""}
+        {sparkline}
         
     </div>
     """
 
+@profile_cache
+@disk_cache("cards")
+def experience_header_html(company, role, duration, location, company_color):
+    return f"""
+    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+        <div style="
+            width: 50px;
+            height: 50px;
+            border-radius: 10px;
+            background: {company_color};
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            margin-right: 15px;
+            color: white;
+            font-weight: bold;
+            font-size: 1.2rem;
+        ">
+            {company[0]}
+        </div>
+        <div>
+            <h3 style="color:#333;margin-bottom:0.2rem;">{company}</h3>
+            <p style="color:#666;margin:0;font-size:0.9rem;">
+            📍 {location} | ⏱️ {duration}
+            </p>
+        </div>
+    </div>
+    <h4 style="color:#667eea;margin-top:0;margin-bottom:1rem;">{role}</h4>
+    """
+
+@profile_cache
+@disk_cache("cards")
+def education_header_html(diploma, school, duration, location):
+    return f"""
+    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+        <div style="
+            width: 50px;
+            height: 50px;
+            border-radius: 50%;
+            background: linear-gradient(135deg, #42be65 0%, #00a854 100%);
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            margin-right: 15px;
+            color: white;
+            font-weight: bold;
+            font-size: 1.2rem;
+        ">
+            🎓
+        </div>
+        <div>
+            <h3 style="color:#333;margin-bottom:0.2rem;">{diploma}</h3>
+            <p style="color:#666;margin:0;font-size:0.9rem;">
+            🏫 {school} | 📍 {location}
+            </p>
+        </div>
+    </div>
+    <h4 style="color:#42be65;margin-top:0;margin-bottom:1rem;">
+    📅 {duration}
+    </h4>
+    """
+
 def experience_card_with_image(company, role, duration, description, image_filename, location="Paris, France", 
                                tags=None, achievements=None, company_color="#667eea"):
     
@@ -324,38 +914,15 @@ def experience_card_with_image(company, role, duration, description, image_filen
         col1, col2 = st.columns([4, 1])
         
         with col1:
-            st.markdown(f"""
-            <div style="display: flex; align-items: center; margin-bottom: 1rem;">
-                <div style="
-                    width: 50px;
-                    height: 50px;
-                    border-radius: 10px;
-                    background: {company_color};
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    margin-right: 15px;
-                    color: white;
-                    font-weight: bold;
-                    font-size: 1.2rem;
-                ">
-                    {company[0]}
-                </div>
-                <div>
-                    <h3 style="color:#333;margin-bottom:0.2rem;">{company}</h3>
-                    <p style="color:#666;margin:0;font-size:0.9rem;">
-                    📍 {location} | ⏱️ {duration}
-                    </p>
-                </div>
-            </div>
-            <h4 style="color:#667eea;margin-top:0;margin-bottom:1rem;">{role}</h4>
-            """, unsafe_allow_html=True)
+            # Fragment en cache par langue : ses arguments sont les textes traduits
+            st.markdown(experience_header_html(company, _(role), _(duration), _(location), company_color),
+                       unsafe_allow_html=True)
         
         with col2:
             # Cadre pour l'image
             # st.markdown('<div class="experience-image-frame">', unsafe_allow_html=True)
             try:
-                st.image(image_path, use_container_width=True)
+                show_image(image_path, use_container_width=True)
             except:
                 # Placeholder avec initiales de l'entreprise
                 st.markdown(f"""
@@ -383,29 +950,29 @@ def experience_card_with_image(company, role, duration, description, image_filen
             border-radius: 10px;
             margin: 1rem 0;
         ">
-            {description}
+            {_(description)}
         </div>
         """, unsafe_allow_html=True)
         
         # Tags
         if tags:
-            st.markdown("**🔧 Technologies & Compétences :**")
+            st.markdown(_("**🔧 Technologies & Compétences :**"))
             cols = st.columns(6)
             for i, tag in enumerate(tags):
                 with cols[i % 6]:
-                    st.markdown(f'<span class="badge badge-primary">{tag}</span>', unsafe_allow_html=True)
+                    st.markdown(f'<span class="badge badge-primary">{_(tag)}</span>', unsafe_allow_html=True)
         
         # Réalisations avec indicateurs
         if achievements:
-            with st.expander(f"🏆 Réalisations chez {company}", expanded=False):
+            with st.expander(_("🏆 Réalisations chez {company}").format(company=company), expanded=False):
                 for idx, achievement in enumerate(achievements):
                     col_a, col_b = st.columns([4, 1])
                     with col_a:
-                        st.markdown(f"**{achievement['title']}**")
-                        st.markdown(f"{achievement['description']}")
+                        st.markdown(f"**{_(achievement['title'])}**")
+                        st.markdown(_(achievement['description']))
                         if 'metrics' in achievement:
                             for metric in achievement['metrics']:
-                                st.markdown(f'<span class="badge badge-success">{metric}</span>', 
+                                st.markdown(f'<span class="badge badge-success">{_(metric)}</span>', 
                                           unsafe_allow_html=True)
                     with col_b:
                         if 'impact' in achievement:
@@ -436,40 +1003,14 @@ def education_card_with_image(diploma, school, duration, description, image_file
         col1, col2 = st.columns([4, 1])
         
         with col1:
-            st.markdown(f"""
-            <div style="display: flex; align-items: center; margin-bottom: 1rem;">
-                <div style="
-                    width: 50px;
-                    height: 50px;
-                    border-radius: 50%;
-                    background: linear-gradient(135deg, #42be65 0%, #00a854 100%);
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    margin-right: 15px;
-                    color: white;
-                    font-weight: bold;
-                    font-size: 1.2rem;
-                ">
-                    🎓
-                </div>
-                <div>
-                    <h3 style="color:#333;margin-bottom:0.2rem;">{diploma}</h3>
-                    <p style="color:#666;margin:0;font-size:0.9rem;">
-                    🏫 {school} | 📍 {location}
-                    </p>
-                </div>
-            </div>
-            <h4 style="color:#42be65;margin-top:0;margin-bottom:1rem;">
-            📅 {duration}
-            </h4>
-            """, unsafe_allow_html=True)
+            st.markdown(education_header_html(_(diploma), school, _(duration), _(location)),
+                       unsafe_allow_html=True)
         
         with col2:
             # Cadre pour le logo de l'école
             # st.markdown('<div class="education-image-frame">', unsafe_allow_html=True)
             try:
-                st.image(image_path, use_container_width=True)
+                show_image(image_path, use_container_width=True)
             except:
                 # Placeholder avec initiales de l'école
                 st.markdown(f"""
@@ -498,13 +1039,13 @@ def education_card_with_image(diploma, school, duration, description, image_file
             border-radius: 10px;
             margin: 1rem 0;
         ">
-            {description}
+            {_(description)}
         </div>
         """, unsafe_allow_html=True)
         
         # Spécialités
         if specialities:
-            st.markdown("**📚 Spécialités & Modules :**")
+            st.markdown(_("**📚 Spécialités & Modules :**"))
             cols = st.columns(4)
             for i, speciality in enumerate(specialities):
                 with cols[i % 4]:
@@ -517,18 +1058,18 @@ def education_card_with_image(diploma, school, duration, description, image_file
                         margin: 0.2rem;
                         border-left: 3px solid #42be65;
                     ">
-                        {speciality}
+                        {_(speciality)}
                     </div>
                     ''', unsafe_allow_html=True)
         
         # Distinctions
         if honors:
-            with st.expander("🏅 Distinctions & Projets académiques", expanded=False):
+            with st.expander(_("🏅 Distinctions & Projets académiques"), expanded=False):
                 for honor in honors:
                     col_a, col_b = st.columns([4, 1])
                     with col_a:
-                        st.markdown(f"**{honor['title']}**")
-                        st.markdown(f"{honor['description']}")
+                        st.markdown(f"**{_(honor['title'])}**")
+                        st.markdown(_(honor['description']))
                     with col_b:
                         st.markdown(f'''
                         <div style="
@@ -539,7 +1080,7 @@ def education_card_with_image(diploma, school, duration, description, image_file
                             font-weight: bold;
                             color: #92400e;
                         ">
-                            {honor.get('year', duration.split('-')[0])}
+                            {honor.get('year', parse_date_range(duration)[0].year)}
                         </div>
                         ''', unsafe_allow_html=True)
         
@@ -738,133 +1279,2517 @@ SKILLS_DATA = {
 }
 
 # =====================================================
-# GRAPHIQUES AMÉLIORÉS
+# DATES ET DURÉES
 # =====================================================
-def radar_competences():
-    skills = {
-        "Analyse Business": 90,
-        "Data Analysis": 85,
-        "KPI & Reporting": 90,
-        "Product / Agile": 80,
-        "IA & Innovation": 75,
-        "Stratégie": 85,
-        "Visualisation": 88
-    }
+FRENCH_MONTHS = {
+    "jan": 1, "janv": 1, "janvier": 1,
+    "fév": 2, "fev": 2, "févr": 2, "février": 2, "fevrier": 2,
+    "mar": 3, "mars": 3,
+    "avr": 4, "avril": 4,
+    "mai": 5,
+    "juin": 6,
+    "juil": 7, "juillet": 7,
+    "août": 8, "aout": 8,
+    "sep": 9, "sept": 9, "septembre": 9,
+    "oct": 10, "octobre": 10,
+    "nov": 11, "novembre": 11,
+    "déc": 12, "dec": 12, "décembre": 12, "decembre": 12
+}
+ONGOING_WORDS = {"présent", "present", "aujourd'hui", "en cours", "actuel"}
+DATE_PATTERN = re.compile(r"^(?:([a-zéû]+)\.?\s+)?((?:19|20)\d{2})$")
 
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(
-        r=list(skills.values()),
-        theta=list(skills.keys()),
-        fill="toself",
-        fillcolor="rgba(102, 126, 234, 0.6)",
-        line=dict(color="rgb(102, 126, 234)", width=2),
-        name="Compétences"
-    ))
+@st.cache_resource(show_spinner=False)
+def _date_range_cache():
+    # Mémo par chaîne, partagé par toutes les sessions du processus
+    return {}
 
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 100],
-                tickfont=dict(size=10)
-            ),
-            bgcolor="rgba(245, 247, 255, 0.5)"
-        ),
-        showlegend=False,
-        margin=dict(l=40, r=40, t=40, b=40),
-        height=300,
-        paper_bgcolor="rgba(0,0,0,0)"
-    )
+def _parse_date(text, is_end):
+    """
+    "Sept 2022" -> 1er septembre 2022, "2021" -> 1er janvier 2021. Une fin est
+    exclusive et inclut la période nommée : "Août 2022" -> 1er septembre 2022,
+    "2021" -> 1er janvier 2022
+    """
+    text = text.strip().lower()
+    if text in ONGOING_WORDS:
+        return None
+    match = DATE_PATTERN.match(text)
+    if not match or (match.group(1) is not None and match.group(1) not in FRENCH_MONTHS):
+        raise ValueError(f"Date non reconnue : {text!r}")
+    month_name, year = match.groups()
+    if month_name is None:
+        return date(int(year) + is_end, 1, 1)
+    month = FRENCH_MONTHS[month_name]
+    if is_end:
+        return date(int(year) + month // 12, month % 12 + 1, 1)
+    return date(int(year), month, 1)
 
-    return fig
+def parse_date_range(duration):
+    """
+    Convertit une durée en français ("Sept 2022 - Présent", "2021 - 2023") en
+    (début, fin) ; fin vaut None pour une période en cours. Mémorisé par chaîne
+    """
+    cache = _date_range_cache()
+    if duration not in cache:
+        parts = re.split(r"\s+[-–—à]\s+|\s*[-–—]\s*", duration.strip(), maxsplit=1)
+        start = _parse_date(parts[0], is_end=False)
+        end = _parse_date(parts[-1], is_end=True)
+        cache[duration] = (start, end)
+    return cache[duration]
 
-def create_revenue_chart():
-    df = pd.DataFrame({
-        "Mois": ["Jan", "Fév", "Mar", "Avr", "Mai", "Juin", "Juil", "Août", "Sep", "Oct", "Nov", "Déc"],
-        "Revenu": [180, 195, 210, 220, 240, 250, 260, 270, 280, 290, 300, 310],
-        "Coûts": [120, 115, 110, 115, 120, 125, 130, 135, 140, 145, 150, 155],
-        "Marge": [60, 80, 100, 105, 120, 125, 130, 135, 140, 145, 150, 155]
-    })
-    
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        x=df["Mois"],
-        y=df["Revenu"],
-        name="Revenu",
-        marker_color="#667eea"
-    ))
-    fig.add_trace(go.Scatter(
-        x=df["Mois"],
-        y=df["Marge"],
-        name="Marge",
-        line=dict(color="#42be65", width=3),
-        yaxis="y2"
-    ))
-    
-    fig.update_layout(
-        title="Évolution des revenus et marges",
-        xaxis_title="Mois",
-        yaxis_title="Revenu (K€)",
-        yaxis2=dict(
-            title="Marge (K€)",
-            overlaying="y",
-            side="right"
-        ),
-        height=400,
-        plot_bgcolor="rgba(245, 247, 255, 0.5)",
-        paper_bgcolor="rgba(0,0,0,0)"
+def total_years(durations, today=None):
+    """
+    Nombre d'années couvertes par l'union des périodes (chevauchements comptés une fois)
+    """
+    today = today or date.today()
+    intervals = sorted((start, end or today) for start, end in map(parse_date_range, durations))
+    total, current_start, current_end = 0, None, None
+    for start, end in intervals:
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += (current_end - current_start).days
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += (current_end - current_start).days
+    return total / 365.25
+
+@profile_cache
+def create_career_timeline(data_version, today, _experiences, _educations):
+    """
+    Frise chronologique des expériences et formations, à partir des périodes analysées
+    """
+    rows = []
+    for kind, items, label in [("Expérience", _experiences, "company"), ("Formation", _educations, "school")]:
+        for item in items:
+            start, end = parse_date_range(item["duration"])
+            rows.append({
+                "Élément": item[label] if kind == "Expérience" else item["diploma"],
+                "Type": kind,
+                "Début": start,
+                "Fin": end or today,
+                "Période": item["duration"]
+            })
+    fig = px.timeline(
+        pd.DataFrame(rows), x_start="Début", x_end="Fin", y="Élément", color="Type",
+        hover_data={"Période": True, "Début": False, "Fin": False},
+        color_discrete_map={"Expérience": "#667eea", "Formation": "#42be65"},
+        title="Frise chronologique du parcours"
     )
-    
+    fig.update_yaxes(autorange="reversed", title=None)
+    fig.update_layout(height=380, plot_bgcolor="rgba(245, 247, 255, 0.5)", paper_bgcolor="rgba(0,0,0,0)")
     return fig
 
 # =====================================================
-# SIDEBAR – PROFIL
+# SCORING DES COMPÉTENCES
 # =====================================================
-with st.sidebar:
-    # Photo de profil avec effet
-    profile_image = load_image("photo.jpeg", alt_text="Martin Alquier")
-    # st.markdown('<div class="profile-circle">', unsafe_allow_html=True)
-    st.image(profile_image, use_container_width=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-        <h3 style='text-align:center;margin-bottom:0;color:#333;'>Martin Alquier</h3>
-        <p style='text-align:center;color:#667eea;margin-top:4px;font-weight:600;'>
-        🎯 Business Analyst • Data & IA
-        </p>
-        <p style='text-align:center;color:#666;font-size:0.9rem;'>
-        Transforme la donnée en décisions mesurables
-        </p>
-    """, unsafe_allow_html=True)
-    
-    st.divider()
-    
-    # Navigation
-    st.markdown("### 🔍 Navigation")
-    page = st.radio(
-        "",
+# Axes du radar et mots-clés qui en apportent la preuve
+SKILL_AXES = {
+    "Analyse Business": ["Business", "KPI", "Marketing", "Finance", "CRM", "ROI"],
+    "Data Analysis": ["SQL", "Python", "Statistic", "Process Mining", "Econometrics", "Analytics", "Big Data"],
+    "KPI & Reporting": ["KPI", "Power BI", "DAX", "Report", "Dashboard", "Power Automate"],
+    "Product / Agile": ["Product", "Startup", "Project Management", "Scrum", "Agile", "MVP"],
+    "IA & Innovation": ["Machine Learning", "Deep Learning", "Mistral AI", "Scikit-learn", "Web3", "Blockchain", "NFT"],
+    "Stratégie": ["Strat", "Growth", "Entrepreneur", "Digital Transformation", "Levée", "Consult"],
+    "Visualisation": ["DataViz", "Visualization", "Tableau", "Power BI", "Dashboard", "Streamlit"]
+}
+
+# Compétences affichées sur la page Compétences et axe correspondant
+SKILL_METRICS = {
+    "Data Analysis": "Data Analysis",
+    "Business Strategy": "Stratégie",
+    "Data Visualization": "Visualisation",
+    "Machine Learning": "IA & Innovation"
+}
+
+# Poids par type de preuve (multiplié par la durée en années)
+EVIDENCE_WEIGHTS = {"tag": 1.0, "achievement": 0.5, "project": 0.5, "speciality": 0.3}
+SKILL_HALF_LIFE_YEARS = 3
+SKILL_SCALE = 3.0
+
+def _duration_years(duration, current_year):
+    """
+    Années de début et de fin (dernier jour inclus) et durée en années d'une durée texte
+    """
+    start, end = parse_date_range(duration)
+    end = end or date(current_year + 1, 1, 1)
+    return start.year, (end - timedelta(days=1)).year, (end - start).days / 365.25
+
+def _skill_evidence(experiences, educations, projects, current_year):
+    """
+    Preuves (texte, poids, année de début, année de fin) tirées des données
+    """
+    evidence = []
+    for exp in experiences:
+        start, end, years = _duration_years(exp["duration"], current_year)
+        years = max(years, 0.5)
+        for tag in exp["tags"]:
+            evidence.append((tag, EVIDENCE_WEIGHTS["tag"] * years, start, end))
+        for achievement in exp["achievements"]:
+            text = " ".join([achievement["title"], achievement["description"], *achievement.get("metrics", [])])
+            evidence.append((text, EVIDENCE_WEIGHTS["achievement"] * years, start, end))
+    for edu in educations:
+        start, end, years = _duration_years(edu["duration"], current_year)
+        years = max(years, 0.5)
+        for speciality in edu["specialities"]:
+            evidence.append((speciality, EVIDENCE_WEIGHTS["speciality"] * years, start, end))
+    for project in projects:
+        for tech in project["technologies"]:
+            evidence.append((tech, EVIDENCE_WEIGHTS["project"], current_year, current_year))
+    return evidence
+
+def _score_matrix(evidence, skills, as_of_year):
+    """
+    Scores 0-100 de chaque compétence à une date : matrice preuves × compétences
+    pondérée par la durée et l'ancienneté (demi-vie), en un produit matriciel
+    """
+    # Mot-clé reconnu en début de mot : "Git" ne correspond pas à "Digital"
+    patterns = [re.compile("|".join(r"\b" + re.escape(k) for k in keywords), re.IGNORECASE)
+                for keywords in skills.values()]
+    matches = np.array([[bool(p.search(text)) for p in patterns] for text, _, _, _ in evidence],
+                       dtype=float).reshape(len(evidence), len(patterns))
+    weights = np.array([weight for _, weight, _, _ in evidence])
+    starts = np.array([start for _, _, start, _ in evidence])
+    ends = np.minimum([end for _, _, _, end in evidence], as_of_year)
+    recency = 0.5 ** ((as_of_year - ends) / SKILL_HALF_LIFE_YEARS)
+    known = starts <= as_of_year
+    raw = (weights * recency * known) @ matches
+    return dict(zip(skills, np.round(100 * raw / (raw + SKILL_SCALE), 1).tolist()))
+
+@profile_cache
+@disk_cache("skills")
+def compute_skill_profile(data_version, current_year, _experiences, _educations, _projects, _skills_data):
+    """
+    Niveaux des axes du radar (aujourd'hui et il y a un an) et des compétences
+    techniques, calculés une fois par version des données
+    """
+    evidence = _skill_evidence(_experiences, _educations, _projects, current_year)
+    techniques = {skill: [skill] for skill in _skills_data.get("Techniques", [])}
+    return {
+        "axes": _score_matrix(evidence, SKILL_AXES, current_year),
+        "axes_last_year": _score_matrix(evidence, SKILL_AXES, current_year - 1),
+        "techniques": _score_matrix(evidence, techniques, current_year)
+    }
+
+def skill_profile():
+    return compute_skill_profile(DATA_VERSION, datetime.now().year,
+                                 EXPERIENCES, EDUCATIONS, PROJECTS, SKILLS_DATA)
+
+def skill_level(score):
+    if score >= 85:
+        return "Expert"
+    if score >= 70:
+        return "Avancé"
+    return "Intermédiaire"
+
+# =====================================================
+# GRAPHE DES TECHNOLOGIES
+# =====================================================
+LAYOUT_ITERATIONS = 300
+
+def technology_cooccurrence(experiences, projects):
+    """
+    Technologies, nombre d'occurrences et matrice de co-occurrence, obtenue
+    par le produit B.T @ B de la matrice d'incidence documents × technologies
+    """
+    documents = [exp["tags"] for exp in experiences] + [p["technologies"] for p in projects]
+    names = sorted({tech for doc in documents for tech in doc})
+    index = {name: i for i, name in enumerate(names)}
+    rows = [i for i, doc in enumerate(documents) for _ in doc]
+    cols = [index[tech] for doc in documents for tech in doc]
+    incidence = np.zeros((len(documents), len(names)))
+    incidence[rows, cols] = 1
+    cooccurrence = incidence.T @ incidence
+    counts = np.diag(cooccurrence).copy()
+    np.fill_diagonal(cooccurrence, 0)
+    return names, counts, cooccurrence
+
+def force_layout(weights, iterations=LAYOUT_ITERATIONS, seed=0):
+    """
+    Placement force-directed (Fruchterman-Reingold) : toutes les forces entre
+    paires de nœuds sont calculées en tableaux à chaque itération
+    """
+    n = len(weights)
+    positions = np.random.default_rng(seed).uniform(-1, 1, (n, 2))
+    k = np.sqrt(4.0 / max(n, 1))
+    temperature = 0.1
+    for _ in range(iterations):
+        delta = positions[:, None, :] - positions[None, :, :]
+        distance = np.maximum(np.linalg.norm(delta, axis=-1), 1e-3)
+        force = k ** 2 / distance ** 2 - weights * distance / k
+        # Légère gravité vers le centre : les composantes isolées restent proches
+        displacement = (delta * force[..., None]).sum(axis=1) - positions * k
+        length = np.maximum(np.linalg.norm(displacement, axis=-1, keepdims=True), 1e-9)
+        positions += displacement / length * np.minimum(length, temperature)
+        temperature *= 0.99
+    return positions
+
+@profile_cache
+@disk_cache("layouts")
+def technology_graph(data_version, _experiences, _projects):
+    """
+    Graphe et coordonnées calculés une fois par version des données et
+    conservés sur disque : le rendu ne relance jamais le placement
+    """
+    names, counts, cooccurrence = technology_cooccurrence(_experiences, _projects)
+    return names, counts, cooccurrence, force_layout(cooccurrence)
+
+@profile_cache
+def create_cooccurrence_chart(data_version):
+    names, counts, cooccurrence, positions = technology_graph(data_version, EXPERIENCES, PROJECTS)
+    fig = go.Figure()
+    # Une trace par poids d'arête (une trace Plotly n'a qu'une épaisseur)
+    sources, targets = np.nonzero(np.triu(cooccurrence))
+    for weight in np.unique(cooccurrence[sources, targets]):
+        selected = cooccurrence[sources, targets] == weight
+        xs, ys = [], []
+        for a, b in zip(sources[selected], targets[selected]):
+            xs += [positions[a, 0], positions[b, 0], None]
+            ys += [positions[a, 1], positions[b, 1], None]
+        fig.add_trace(go.Scatter(
+            x=xs, y=ys, mode="lines",
+            line=dict(width=1 + 2 * (weight - 1), color="rgba(102, 126, 234, 0.4)"),
+            hoverinfo="skip", showlegend=False
+        ))
+    fig.add_trace(go.Scatter(
+        x=positions[:, 0], y=positions[:, 1],
+        mode="markers+text",
+        text=names,
+        textposition="top center",
+        marker=dict(size=12 + 6 * counts, color="#667eea", line=dict(width=2, color="white")),
+        hovertemplate="%{text}<extra></extra>",
+        showlegend=False
+    ))
+    fig.update_layout(
+        title="Technologies utilisées ensemble",
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False),
+        height=500,
+        plot_bgcolor="rgba(245, 247, 255, 0.5)",
+        paper_bgcolor="rgba(0,0,0,0)"
+    )
+    return fig
+
+# =====================================================
+# MATCHING OFFRE D'EMPLOI (TF-IDF)
+# =====================================================
+STOPWORDS = set("""
+a au aux avec ce ces dans de des du elle en et eux il je la le les leur lui ma mais me meme mes moi mon
+ne nos notre nous on ou par pas pour qu que qui sa se ses son sur ta te tes toi ton tu un une vos votre
+vous d l j n s t y est sont etre avoir ont plus tres chez afin ainsi
+the and or of to in for on with at by from an as is are be this that will you your we our their it
+""".split())
+
+def tokenize(text):
+    """
+    Minuscules, sans accents, mots d'au moins deux caractères hors mots vides
+    """
+    text = unicodedata.normalize("NFKD", text.lower()).encode("ascii", "ignore").decode()
+    return [t for t in re.findall(r"[a-z0-9+#]+", text) if len(t) > 1 and t not in STOPWORDS]
+
+def portfolio_documents(experiences, educations, projects):
+    """
+    Éléments à classer (type, titre, texte) : expériences, réalisations, projets, formations
+    """
+    documents = []
+    for exp in experiences:
+        documents.append(("Expérience", f"{exp['role']} – {exp['company']}",
+                          " ".join([exp["role"], exp["description"], *exp["tags"]])))
+        for achievement in exp["achievements"]:
+            documents.append(("Réalisation", f"{achievement['title']} ({exp['company']})",
+                              " ".join([achievement["title"], achievement["description"],
+                                        *achievement.get("metrics", []), *exp["tags"]])))
+    for project in projects:
+        documents.append(("Projet", project["title"],
+                          " ".join([project["title"], project["description"], *project["technologies"]])))
+    for edu in educations:
+        documents.append(("Formation", edu["diploma"],
+                          " ".join([edu["diploma"], edu["description"], *edu["specialities"]])))
+    return documents
+
+class TfidfIndex:
+    """
+    Matrice TF-IDF des contenus du portfolio, stockée en CSR (indptr, indices,
+    data) aux lignes normalisées. Seul le vecteur de la requête est calculé
+    à chaque recherche ; le score est un produit scalaire creux vectorisé
+    """
+    def __init__(self, documents):
+        self.documents = documents
+        tokens = [tokenize(text) for _, _, text in documents]
+        vocabulary = sorted({t for doc in tokens for t in doc})
+        self.vocabulary = {term: i for i, term in enumerate(vocabulary)}
+        self.terms = np.array(vocabulary)
+        indptr, indices, counts = [0], [], []
+        for doc in tokens:
+            terms, doc_counts = np.unique([self.vocabulary[t] for t in doc], return_counts=True)
+            indices.extend(terms)
+            counts.extend(doc_counts)
+            indptr.append(len(indices))
+        self.indptr = np.array(indptr)
+        self.indices = np.array(indices, dtype=np.int64)
+        self.rows = np.repeat(np.arange(len(documents)), np.diff(self.indptr))
+        document_frequency = np.bincount(self.indices, minlength=len(self.vocabulary))
+        self.idf = np.log((1 + len(documents)) / (1 + document_frequency)) + 1
+        data = np.array(counts, dtype=float) * self.idf[self.indices]
+        norms = np.sqrt(np.bincount(self.rows, weights=data ** 2, minlength=len(documents)))
+        self.data = data / np.maximum(norms[self.rows], 1e-12)
+
+    def query_vector(self, text):
+        vector = np.zeros(len(self.vocabulary))
+        for token in tokenize(text):
+            index = self.vocabulary.get(token)
+            if index is not None:
+                vector[index] += 1
+        vector *= self.idf
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def search(self, text, limit=10):
+        """
+        Les `limit` éléments les plus proches du texte (similarité cosinus > 0)
+        avec leurs termes communs, et le nombre total d'éléments pertinents
+        """
+        vector = self.query_vector(text)
+        contributions = self.data * vector[self.indices]
+        scores = np.bincount(self.rows, weights=contributions, minlength=len(self.documents))
+        ranked = np.argsort(-scores, kind="stable")
+        relevant = int(np.count_nonzero(scores > 0))
+        results = []
+        for i in ranked[:min(limit, relevant)]:
+            kind, title, _ = self.documents[i]
+            segment = slice(self.indptr[i], self.indptr[i + 1])
+            matched = self.indices[segment][contributions[segment] > 0]
+            results.append({"Type": kind, "Élément": title, "Score": scores[i],
+                            "Termes communs": ", ".join(self.terms[matched])})
+        return pd.DataFrame(results, columns=["Type", "Élément", "Score", "Termes communs"]), relevant
+
+@profile_cache
+def tfidf_index(data_version, _experiences, _educations, _projects):
+    # Construit une fois par version des données, partagé entre les sessions du profil
+    return TfidfIndex(portfolio_documents(_experiences, _educations, _projects))
+
+# =====================================================
+# DATASETS DU DASHBOARD
+# =====================================================
+def build_monthly_data():
+    return pd.DataFrame({
+        "Mois": ["Jan", "Fév", "Mar", "Avr", "Mai", "Juin", "Juil", "Août", "Sep", "Oct", "Nov", "Déc"],
+        "Revenu": [180, 195, 210, 220, 240, 250, 260, 270, 280, 290, 300, 310],
+        "Coûts": [120, 115, 110, 115, 120, 125, 130, 135, 140, 145, 150, 155],
+        "Marge": [60, 80, 100, 105, 120, 125, 130, 135, 140, 145, 150, 155]
+    })
+
+def build_sector_data():
+    return pd.DataFrame({
+        "Secteur": ["Tech", "Finance", "Retail", "Health", "Manufacturing"],
+        "CA": [45, 30, 15, 25, 20],
+        "Croissance": [12, 8, 5, 15, 7]
+    })
+
+def build_detail_data():
+    return pd.DataFrame({
+        "Mois": ["Jan", "Fév", "Mar", "Avr", "Mai", "Juin", "Juil", "Août", "Sep", "Oct", "Nov", "Déc"],
+        "Revenu": [180, 195, 210, 220, 240, 250, 260, 270, 280, 290, 300, 310],
+        "Coûts": [120, 115, 110, 115, 120, 125, 130, 135, 140, 145, 150, 155],
+        "Marge %": [33, 41, 48, 48, 50, 50, 50, 50, 50, 50, 50, 50],
+        "NPS": [75, 78, 82, 83, 85, 85, 86, 84, 87, 88, 88, 89],
+        "Clients": [45, 48, 52, 55, 58, 60, 62, 65, 67, 70, 72, 75]
+    })
+
+SUB_SECTORS = {
+    "Tech": ["SaaS", "Cloud", "Cybersécurité"],
+    "Finance": ["Banque", "Assurance", "Fintech"],
+    "Retail": ["E-commerce", "Grande distribution", "Luxe"],
+    "Health": ["Pharma", "Medtech", "Hôpitaux"],
+    "Manufacturing": ["Automobile", "Aéronautique", "Énergie"]
+}
+CLIENTS_PER_SUB_SECTOR = 4
+
+def build_sales_data(seed=7):
+    """
+    Table de faits des ventes (secteur, sous-secteur, client, mois) dont les
+    totaux par secteur correspondent au dataset `secteurs`
+    """
+    sectors = build_sector_data().set_index("Secteur")["CA"]
+    months = build_monthly_data()["Mois"].tolist()
+    rows = [(sector, sub, f"{sub} #{i + 1}")
+            for sector, subs in SUB_SECTORS.items()
+            for sub in subs
+            for i in range(CLIENTS_PER_SUB_SECTOR)]
+    facts = pd.DataFrame(rows * len(months), columns=["Secteur", "Sous-secteur", "Client"])
+    facts["Mois"] = np.repeat(months, len(rows))
+    weights = np.random.default_rng(seed).gamma(2.0, size=len(facts))
+    totals = pd.Series(weights).groupby(facts["Secteur"]).transform("sum").to_numpy()
+    facts["CA"] = (weights / totals * facts["Secteur"].map(sectors).to_numpy()).round(3)
+    return facts
+
+def build_client_activity(seed=11, retention=0.9):
+    """
+    Activité mensuelle par client (une ligne par client actif et par mois),
+    cohérente avec la colonne `Clients` du dataset détaillé
+    """
+    details = build_detail_data()
+    rng = np.random.default_rng(seed)
+    active, next_id, frames = np.empty(0, dtype=np.int64), 0, []
+    for period, (clients, revenue) in enumerate(zip(details["Clients"], details["Revenu"])):
+        active = active[rng.random(len(active)) < retention][:clients]
+        new_clients = clients - len(active)
+        active = np.concatenate([active, np.arange(next_id, next_id + new_clients)])
+        next_id += new_clients
+        frames.append(pd.DataFrame({
+            "Client": active,
+            "Période": period,
+            "Mois": details["Mois"].iloc[period],
+            "CA": revenue / clients * rng.lognormal(0, 0.3, len(active))
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+DATASETS = {
+    "mensuel": build_monthly_data,
+    "secteurs": build_sector_data,
+    "details": build_detail_data,
+    "ventes": build_sales_data,
+    "clients": build_client_activity
+}
+
+# Filtres du Dashboard et nombre de mois couverts par chaque période
+FORECAST_MODELS = ["Aucune", "Holt (lissage exponentiel)", "Tendance + saisonnalité"]
+FORECAST_HORIZONS = ["6 mois", "3 mois", "12 mois"]
+DASHBOARD_FILTERS = {
+    "period": ["Année 2024", "Trimestre en cours", "Mois en cours"],
+    "metric": ["Revenu", "Marge", "NPS", "Coûts"],
+    "comparison": ["vs période précédente", "vs cible", "vs benchmark"],
+    "forecast": FORECAST_MODELS,
+    "horizon": FORECAST_HORIZONS
+}
+PERIOD_MONTHS = {"Année 2024": 12, "Trimestre en cours": 3, "Mois en cours": 1}
+
+# Versions des données gardées par les caches mémoire : la courante et la
+# précédente, encore affichée par les sessions ouvertes avant l'actualisation
+SNAPSHOT_VERSIONS_KEPT = 2
+# Graphiques d'exploration gardés par version (chemins récemment ouverts)
+DRILL_CHARTS_KEPT = 64
+
+def dashboard_filters_from_url():
+    """
+    Filtres du Dashboard lus depuis l'URL (?period=...&metric=...&comparison=...)
+    """
+    filters = {}
+    for name, options in DASHBOARD_FILTERS.items():
+        value = st.query_params.get(name)
+        filters[name] = value if value in options else options[0]
+    return filters
+
+# Version des données : clé du cache disque avec CODE_VERSION
+
+# =====================================================
+# PRÉVISIONS (MODÈLES VECTORISÉS)
+# =====================================================
+FORECAST_Z = 1.28  # bande de prévision à 80 %
+SEASON_LENGTH = 12
+
+def _fit_holt(Y, horizon):
+    """
+    Lissage exponentiel double (Holt) sur toutes les séries à la fois :
+    chaque couple (alpha, beta) de la grille est évalué pour chaque colonne
+    de Y en une seule boucle sur le temps
+    """
+    grid = np.linspace(0.1, 0.9, 9)
+    alphas, betas = (g.ravel()[:, None] for g in np.meshgrid(grid, grid))
+    level = np.broadcast_to(Y[0], (len(alphas), Y.shape[1])).copy()
+    trend = np.broadcast_to(Y[1] - Y[0], level.shape).copy()
+    sse = np.zeros_like(level)
+    for y in Y[1:]:
+        sse += (y - level - trend) ** 2
+        new_level = alphas * y + (1 - alphas) * (level + trend)
+        trend = betas * (new_level - level) + (1 - betas) * trend
+        level = new_level
+    best = sse.argmin(axis=0)
+    columns = np.arange(Y.shape[1])
+    sigma = np.sqrt(sse[best, columns] / max(len(Y) - 3, 1))
+    steps = np.arange(1, horizon + 1)[:, None]
+    mean = level[best, columns] + steps * trend[best, columns]
+    return mean, FORECAST_Z * sigma * np.sqrt(steps)
+
+def _fit_trend_seasonal(Y, horizon):
+    """
+    Tendance linéaire + saisonnalité de Fourier : un seul lstsq pour toutes
+    les séries (la saisonnalité n'est ajustée qu'avec deux cycles complets)
+    """
+    n = len(Y)
+    t = np.arange(n + horizon)
+    features = [np.ones_like(t, dtype=float), t.astype(float)]
+    if n >= 2 * SEASON_LENGTH:
+        angle = 2 * np.pi * t / SEASON_LENGTH
+        features += [np.sin(angle), np.cos(angle)]
+    X = np.column_stack(features)
+    coefs, *_ = np.linalg.lstsq(X[:n], Y, rcond=None)
+    residuals = Y - X[:n] @ coefs
+    sigma = np.sqrt((residuals ** 2).sum(axis=0) / max(n - X.shape[1], 1))
+    steps = np.arange(1, horizon + 1)[:, None]
+    return X[n:] @ coefs, FORECAST_Z * sigma * np.sqrt(1 + steps / n)
+
+# Une prévision par modèle (hors « Aucune ») et horizon, sur tout l'historique
+@st.cache_data(show_spinner=False,
+               max_entries=SNAPSHOT_VERSIONS_KEPT * len(FORECAST_HORIZONS) * (len(FORECAST_MODELS) - 1))
+def fit_forecasts(series_hash, horizon, model, _values):
+    """
+    Prévisions (moyenne, borne basse, borne haute) de chaque colonne de
+    `_values`, mémorisées par (hash des séries, horizon, modèle)
+    """
+    Y = np.asarray(_values, dtype=float)
+    fit = _fit_holt if model == FORECAST_MODELS[1] else _fit_trend_seasonal
+    mean, band = fit(Y, horizon)
+    return mean, mean - band, mean + band
+
+def forecast_frame(df, columns, horizon, model):
+    """
+    Prévisions des colonnes d'un DataFrame mensuel, une ligne par mois futur
+    """
+    values = df[columns].to_numpy(dtype=float)
+    mean, lower, upper = fit_forecasts(_cache_key(values.tobytes(), values.shape), horizon, model, values)
+    months = build_monthly_data()["Mois"].tolist()
+    result = pd.DataFrame({"Mois": [f"Prév. {months[i % 12]}" for i in range(len(df), len(df) + horizon)]})
+    for i, col in enumerate(columns):
+        result[col] = mean[:, i]
+        result[f"{col} bas"] = lower[:, i]
+        result[f"{col} haut"] = upper[:, i]
+    return result
+
+# =====================================================
+# GRAPHIQUES AMÉLIORÉS
+# =====================================================
+@profile_cache
+@disk_cache("figures", max_files=DISK_CACHE_FILES_KEPT)
+def radar_competences():
+    skills = skill_profile()["axes"]
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatterpolar(
+        r=list(skills.values()),
+        theta=list(skills.keys()),
+        fill="toself",
+        fillcolor="rgba(102, 126, 234, 0.6)",
+        line=dict(color="rgb(102, 126, 234)", width=2),
+        name="Compétences"
+    ))
+
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                tickfont=dict(size=10)
+            ),
+            bgcolor="rgba(245, 247, 255, 0.5)"
+        ),
+        showlegend=False,
+        margin=dict(l=40, r=40, t=40, b=40),
+        height=300,
+        paper_bgcolor="rgba(0,0,0,0)"
+    )
+
+    return fig
+
+@st.cache_data(show_spinner=False,
+               max_entries=SNAPSHOT_VERSIONS_KEPT * len(PERIOD_MONTHS) * len(FORECAST_HORIZONS) * len(FORECAST_MODELS))
+@disk_cache("figures", max_files=DISK_CACHE_FILES_KEPT)
+def create_revenue_chart(version, _snapshot, period="Année 2024", forecast=FORECAST_MODELS[0],
+                         horizon=FORECAST_HORIZONS[0]):
+    # Historique et anomalies lus dans le snapshot de `version`, jamais dans le
+    # snapshot courant, qui peut avoir changé entre-temps
+    history = _snapshot.datasets["mensuel"]
+    df = history.tail(PERIOD_MONTHS[period])
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=df["Mois"],
+        y=df["Revenu"],
+        name="Revenu",
+        marker_color="#667eea"
+    ))
+    fig.add_trace(go.Scatter(
+        x=df["Mois"],
+        y=df["Marge"],
+        name="Marge",
+        line=dict(color="#42be65", width=3),
+        yaxis="y2"
+    ))
+    
+    # Points anormaux
+    anomalies = _snapshot.anomalies["mensuel"].loc[df.index]
+    for col, axis in [("Revenu", "y"), ("Marge", "y2")]:
+        flagged = df[anomalies[col]]
+        if len(flagged):
+            fig.add_trace(go.Scatter(
+                x=flagged["Mois"],
+                y=flagged[col],
+                mode="markers",
+                name=f"Anomalie {col}",
+                marker=dict(color="#da1e28", size=12, symbol="x"),
+                yaxis=axis
+            ))
+    
+    # Prévision sur tout l'historique, superposée avec sa bande
+    if forecast != FORECAST_MODELS[0]:
+        future = forecast_frame(history, ["Revenu", "Marge"], int(horizon.split()[0]), forecast)
+        for col, color, fill, axis in [("Revenu", "#667eea", "rgba(102, 126, 234, 0.2)", "y"),
+                                       ("Marge", "#42be65", "rgba(66, 190, 101, 0.2)", "y2")]:
+            fig.add_trace(go.Scatter(
+                x=list(future["Mois"]) + list(future["Mois"])[::-1],
+                y=list(future[f"{col} haut"]) + list(future[f"{col} bas"])[::-1],
+                fill="toself",
+                fillcolor=fill,
+                line=dict(width=0),
+                hoverinfo="skip",
+                showlegend=False,
+                yaxis=axis
+            ))
+            fig.add_trace(go.Scatter(
+                x=future["Mois"],
+                y=future[col],
+                name=f"{col} (prévision)",
+                line=dict(color=color, width=2, dash="dash"),
+                yaxis=axis
+            ))
+    
+    fig.update_layout(
+        title="Évolution des revenus et marges",
+        xaxis_title="Mois",
+        yaxis_title="Revenu (K€)",
+        yaxis2=dict(
+            title="Marge (K€)",
+            overlaying="y",
+            side="right"
+        ),
+        height=400,
+        plot_bgcolor="rgba(245, 247, 255, 0.5)",
+        paper_bgcolor="rgba(0,0,0,0)"
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=SNAPSHOT_VERSIONS_KEPT)
+@disk_cache("figures", max_files=DISK_CACHE_FILES_KEPT)
+def create_sector_chart(version, _snapshot):
+    sector_data = _snapshot.datasets["secteurs"]
+    
+    fig = px.bar(sector_data, x="Secteur", y="CA", 
+                title="Chiffre d'affaires par secteur",
+                color="Croissance",
+                color_continuous_scale="Viridis")
+    fig.update_layout(height=400, plot_bgcolor="rgba(245, 247, 255, 0.5)")
+    return fig
+
+# Niveaux d'exploration du graphique sectoriel
+DRILL_LEVELS = ["Secteur", "Sous-secteur", "Client", "Mois"]
+
+@st.cache_resource(show_spinner=False, max_entries=SNAPSHOT_VERSIONS_KEPT)
+def drill_aggregates(version, _facts):
+    """
+    Hiérarchie d'agrégats calculée une fois par version et partagée sans copie :
+    pour chaque profondeur, le CA par chemin complet dans une série triée sur
+    le chemin parent (les enfants gardent l'ordre des données, les mois restent
+    chronologiques). Un clic = une lecture d'index (voir drill_children)
+    """
+    return {depth: (_facts.groupby(DRILL_LEVELS[:depth + 1], sort=False)["CA"].sum()
+                    .sort_index(level=list(range(depth)), sort_remaining=False))
+            for depth in range(1, len(DRILL_LEVELS))}
+
+def drill_children(version, facts, path):
+    """
+    CA des enfants du chemin `path` (tuple non vide)
+    """
+    return drill_aggregates(version, facts)[len(path)].loc[path].reset_index()
+
+@st.cache_data(show_spinner=False, max_entries=SNAPSHOT_VERSIONS_KEPT * DRILL_CHARTS_KEPT)
+def create_drill_chart(version, _snapshot, path):
+    """
+    Graphique du niveau `path` (tuple vide = vue par secteur)
+    """
+    if not path:
+        return create_sector_chart(version, _snapshot)
+    data = drill_children(_snapshot.versions["ventes"], _snapshot.datasets["ventes"], path)
+    level = DRILL_LEVELS[len(path)]
+    fig = px.bar(data, x=level, y="CA",
+                 title=f"Chiffre d'affaires – {' › '.join(path)}",
+                 color_discrete_sequence=["#667eea"])
+    fig.update_layout(height=400, plot_bgcolor="rgba(245, 247, 255, 0.5)")
+    return fig
+
+def set_drill_path(path):
+    st.session_state["drill_path"] = list(path)
+
+# =====================================================
+# COHORTES CLIENTS
+# =====================================================
+@st.cache_data(show_spinner=False, max_entries=SNAPSHOT_VERSIONS_KEPT)
+def cohort_analysis(version, _events):
+    """
+    Rétention (%), LTV cumulée par client et churn mensuel, par cohorte de
+    premier mois d'activité : uniquement des opérations de groupby/pivot et
+    cumulées, sans boucle par client
+    """
+    client = _events["Client"].to_numpy()
+    period = _events["Période"].to_numpy()
+    cohort = _events.groupby("Client")["Période"].transform("min").to_numpy()
+    age = period - cohort
+    frame = pd.DataFrame({"Cohorte": cohort, "Âge": age, "CA": _events["CA"].to_numpy()})
+    grouped = frame.groupby(["Cohorte", "Âge"])
+    active = grouped.size().unstack(fill_value=0)
+    sizes = active[0]
+    retention = active.div(sizes, axis=0) * 100
+    ltv = grouped["CA"].sum().unstack().cumsum(axis=1).div(sizes, axis=0)
+    # Churn : part des clients actifs au mois t absents au mois t+1
+    n_periods = int(period.max()) + 1
+    keys = client * n_periods + period
+    still_active = np.isin(keys + 1, keys)
+    churn = (1 - pd.Series(still_active).groupby(period).mean()) * 100
+    churn = churn.iloc[:-1]
+    months = _events.drop_duplicates("Période").set_index("Période")["Mois"]
+    retention.index = ltv.index = months.loc[retention.index].to_numpy()
+    churn.index = months.loc[churn.index].to_numpy()
+    # Les âges non encore observés restent vides plutôt qu'à 0 %
+    observable = np.arange(retention.shape[1])[None, :] <= (n_periods - 1 - sizes.index.to_numpy())[:, None]
+    return retention.where(observable), ltv.where(observable), churn
+
+def create_retention_heatmap(retention):
+    fig = px.imshow(
+        retention,
+        labels=dict(x="Mois depuis l'acquisition", y="Cohorte", color="Rétention %"),
+        color_continuous_scale="Blues",
+        text_auto=".0f",
+        aspect="auto",
+        title="Rétention par cohorte (%)"
+    )
+    fig.update_layout(height=450, paper_bgcolor="rgba(0,0,0,0)")
+    return fig
+
+# =====================================================
+# DÉTECTION D'ANOMALIES
+# =====================================================
+# Fenêtre et seuils choisis pour ~0,3 % de fausses alertes sur un bruit gaussien
+# (6 points et 2,5 / 3,5 en signalaient ~10 %) : deux ans d'historique mensuel
+# sont nécessaires avant la première alerte
+ANOMALY_WINDOW = 24
+ANOMALY_Z = 3.5     # seuil du score z glissant
+ANOMALY_MAD = 5.0   # seuil du score robuste (médiane / MAD)
+ANOMALY_MIN_SCALE = 0.01   # écart-type / MAD plancher, en fraction du niveau de la fenêtre
+
+# Définition des cartes KPI : colonne du dataset détaillé, agrégation sur
+# la période, cible, benchmark et sens favorable d'une hausse
+KPI_DEFINITIONS = {
+    "Revenu Mensuel": {"column": "Revenu", "agg": "mean", "unit": " K€", "target": 300, "benchmark": 250,
+                       "higher_is_better": True},
+    "Marge Brute": {"column": "Marge %", "agg": "mean", "unit": "%", "target": 50, "benchmark": 40,
+                    "higher_is_better": True},
+    "NPS Client": {"column": "NPS", "agg": "last", "unit": "", "target": 90, "benchmark": 80,
+                   "higher_is_better": True},
+    "Coûts Opérationnels": {"column": "Coûts", "agg": "mean", "unit": " K€", "target": 140, "benchmark": 150,
+                            "higher_is_better": False}
+}
+
+def _anomaly_flags(values, window):
+    """
+    Compare chaque point (à partir de `window`) à la fenêtre qui le précède,
+    pour toutes les colonnes à la fois : score z et score robuste MAD
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(values[:-1], window, axis=0)
+    current = values[window:]
+    mean = windows.mean(axis=-1)
+    median = np.median(windows, axis=-1)
+    # Fenêtre plate : sans plancher, le moindre écart donnerait un score infini
+    std = np.maximum(windows.std(axis=-1, ddof=1), ANOMALY_MIN_SCALE * np.abs(mean))
+    mad = np.maximum(np.median(np.abs(windows - median[..., None]), axis=-1), ANOMALY_MIN_SCALE * np.abs(median))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(std > 0, (current - mean) / std, 0)
+        robust = np.where(mad > 0, 0.6745 * (current - median) / mad, 0)
+    return (np.nan_to_num(np.abs(z)) > ANOMALY_Z) | (np.nan_to_num(np.abs(robust)) > ANOMALY_MAD)
+
+class AnomalyDetector:
+    """
+    Anomalies de séries KPI, mises à jour de façon incrémentale : seules les
+    lignes ajoutées (et la fenêtre qui les précède) sont recalculées. Si une
+    ligne déjà analysée a changé, toute la série est réanalysée
+    """
+    def __init__(self, window=ANOMALY_WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._columns = None
+        self._values = None
+        self._flags = None
+
+    def update(self, df):
+        values = df.to_numpy(dtype=float)
+        with self._lock:
+            rows = 0 if self._flags is None else len(self._flags)
+            # Comparaison vectorisée de tout le préfixe déjà analysé (pas seulement la
+            # dernière fenêtre) : une correction d'une ligne ancienne invalide ses drapeaux
+            append = (
+                self._columns == list(df.columns)
+                and self.window <= rows <= len(values)
+                and np.array_equal(values[:rows], self._values, equal_nan=True)
+            )
+            if not append:
+                self._flags = np.zeros(values.shape, dtype=bool)
+                if len(values) > self.window:
+                    self._flags[self.window:] = _anomaly_flags(values, self.window)
+            elif len(values) > rows:
+                new_flags = _anomaly_flags(values[rows - self.window:], self.window)
+                self._flags = np.vstack([self._flags, new_flags])
+            self._columns = list(df.columns)
+            self._values = values.copy()
+            return pd.DataFrame(self._flags, columns=df.columns, index=df.index)
+
+@st.cache_resource(show_spinner=False)
+def anomaly_detector(name):
+    return AnomalyDetector()
+
+# =====================================================
+# MOTEUR KPI (TENDANCES PAR PÉRIODE)
+# =====================================================
+def _aggregate(block, aggs):
+    # Toutes les agrégations calculées d'un coup, puis choisies par colonne
+    stacked = np.stack([block.mean(axis=0), block.sum(axis=0), block[-1]])
+    return stacked[aggs, np.arange(block.shape[1])]
+
+@st.cache_data(show_spinner=False, max_entries=SNAPSHOT_VERSIONS_KEPT * len(PERIOD_MONTHS))
+def compute_kpi_table(version, period, _df):
+    """
+    Valeur, écart vs période précédente, vs cible et vs benchmark, et données
+    de sparkline de tous les KPI en une passe, mémorisés par version du dataset
+    """
+    definitions = pd.DataFrame(KPI_DEFINITIONS).T
+    values = _df[definitions["column"]].to_numpy(dtype=float)
+    aggs = definitions["agg"].map({"mean": 0, "sum": 1, "last": 2}).to_numpy()
+    months = PERIOD_MONTHS[period]
+    current = _aggregate(values[-months:], aggs)
+    previous = (_aggregate(values[-2 * months:-months], aggs)
+                if len(values) >= 2 * months else np.full(len(aggs), np.nan))
+    targets = definitions["target"].to_numpy(dtype=float)
+    benchmarks = definitions["benchmark"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        table = pd.DataFrame({
+            "Valeur": current,
+            "vs période précédente": (current - previous) / np.abs(previous) * 100,
+            "vs cible": (current - targets) / np.abs(targets) * 100,
+            "vs benchmark": (current - benchmarks) / np.abs(benchmarks) * 100,
+            "Unité": definitions["unit"].to_numpy()
+        }, index=definitions.index)
+    table["Sparkline"] = list(values[-max(months, 6):].T)
+    return table
+
+def kpi_trend(table, title, comparison):
+    # Écart arrondi, ou None si non calculable (historique trop court)
+    value = table.loc[title, comparison]
+    return None if np.isnan(value) else round(float(value), 1)
+
+def kpi_display(table, title):
+    return f"{table.loc[title, 'Valeur']:.0f}{table.loc[title, 'Unité']}"
+
+def sparkline_svg(values, color="#667eea", width=120, height=30):
+    """
+    Mini-graphique SVG inline (aucune dépendance côté client)
+    """
+    values = np.asarray(values, dtype=float)
+    if len(values) < 2:
+        return ""
+    span = values.max() - values.min() or 1
+    xs = np.linspace(0, width, len(values))
+    ys = height - (values - values.min()) / span * (height - 4) - 2
+    points = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+    return (f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+            f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="2"/></svg>')
+
+# =====================================================
+# AGRÉGATS INCRÉMENTAUX
+# =====================================================
+AGGREGATE_STATS = ["sum", "count", "min", "max"]
+
+class IncrementalAggregates:
+    """
+    Sommes, comptes, min et max par (période, dimension) pour des données en
+    ajout seul : un lot ajouté est agrégé puis fusionné comme un delta. Si
+    l'historique a été modifié, tout est reconstruit
+    """
+    def __init__(self, keys, values):
+        self.keys = keys
+        self.values = values
+        self.rebuilds = 0
+        self.appends = 0
+        self._lock = threading.Lock()
+        self._rows = None
+        self._state = None
+
+    def _aggregate(self, df):
+        return df.groupby(self.keys)[self.values].agg(AGGREGATE_STATS)
+
+    def _merge(self, delta):
+        index = self._state.index.union(delta.index)
+        state = self._state.reindex(index)
+        delta = delta.reindex(index)
+        merged = {}
+        for value in self.values:
+            merged[(value, "sum")] = state[(value, "sum")].add(delta[(value, "sum")], fill_value=0)
+            merged[(value, "count")] = state[(value, "count")].add(delta[(value, "count")], fill_value=0)
+            merged[(value, "min")] = np.fmin(state[(value, "min")], delta[(value, "min")])
+            merged[(value, "max")] = np.fmax(state[(value, "max")], delta[(value, "max")])
+        return pd.DataFrame(merged, index=index)
+
+    def update(self, df):
+        df = df.reset_index(drop=True)
+        with self._lock:
+            known = 0 if self._rows is None else len(self._rows)
+            # Préfixe comparé colonne par colonne (vectorisé, sans hacher tout
+            # l'historique) ; seules les lignes ajoutées sont agrégées
+            if self._state is not None and known <= len(df) and df.iloc[:known].equals(self._rows):
+                if len(df) > known:
+                    self._state = self._merge(self._aggregate(df.iloc[known:]))
+                    self.appends += 1
+            else:
+                self._state = self._aggregate(df)
+                self.rebuilds += 1
+            self._rows = df.copy()
+            return self.frame()
+
+    def frame(self):
+        """
+        Agrégats courants, avec la moyenne dérivée de la somme et du compte
+        """
+        result = self._state.copy()
+        for value in self.values:
+            result[(value, "mean")] = result[(value, "sum")] / result[(value, "count")]
+        return result.sort_index(axis=1)
+
+@st.cache_resource(show_spinner=False)
+def incremental_aggregates(name, keys, values):
+    return IncrementalAggregates(list(keys), list(values))
+
+# Année du premier mois des datasets dont la colonne Mois n'a pas d'année ("Jan", "Fév"...)
+FIRST_MONTH_YEAR = 2024
+
+def month_periods(months, first_year=FIRST_MONTH_YEAR):
+    """
+    Mois de chaque ligne : dates ("2024-01") si la colonne en contient, sinon
+    noms de mois, l'année avançant à chaque retour en arrière dans le calendrier
+    """
+    names = [str(month).strip().lower().rstrip(".") for month in months]
+    if names and all(name in FRENCH_MONTHS for name in names):
+        numbers = np.array([FRENCH_MONTHS[name] for name in names])
+        years = first_year + np.concatenate([[0], np.cumsum(np.diff(numbers) <= 0)])
+        return pd.DatetimeIndex(pd.to_datetime({"year": years, "month": numbers, "day": 1})).to_period("M")
+    return pd.PeriodIndex(pd.to_datetime(list(months)), freq="M")
+
+def quarterly_aggregates(name, df):
+    """
+    Agrégats trimestriels d'un dataset mensuel, mis à jour par delta
+    """
+    periods = month_periods(df["Mois"])
+    quarters = [f"{year} T{quarter}" for year, quarter in zip(periods.year, periods.quarter)]
+    values = tuple(df.select_dtypes("number").columns)
+    return incremental_aggregates(name, ("Trimestre",), values).update(df.assign(Trimestre=quarters))
+
+# =====================================================
+# ACTUALISATION DES DONNÉES
+# =====================================================
+# Sources : data/<dataset>.csv si présent, sinon les données intégrées
+DATA_SOURCES_DIR = os.environ.get("PORTFOLIO_DATA_DIR", "data")
+REFRESH_INTERVAL_SECONDS = int(os.environ.get("PORTFOLIO_REFRESH_SECONDS", "900"))
+# Nouvel essai tant qu'aucune version n'a pu être construite
+REFRESH_RETRY_SECONDS = 30
+
+DataSnapshot = namedtuple(
+    "DataSnapshot",
+    ["version", "datasets", "versions", "kpis", "anomalies", "aggregates", "refreshed_at", "duration"]
+)
+
+def read_source(name):
+    path = os.path.join(DATA_SOURCES_DIR, f"{name}.csv")
+    if os.path.exists(path):
+        return pd.read_csv(path)
+    return DATASETS[name]()
+
+def build_snapshot():
+    """
+    Relit toutes les sources et recalcule les agrégats, anomalies, KPI et
+    prévisions : la version renvoyée est complète avant d'être publiée
+    """
+    started = time.perf_counter()
+    datasets, versions = {}, {}
+    for name in DATASETS:
+        datasets[name], versions[name] = store_dataset(name, read_source(name))
+    details = datasets["details"]
+    kpis = {period: compute_kpi_table(versions["details"], period, details) for period in PERIOD_MONTHS}
+    anomalies = {name: anomaly_detector(name).update(datasets[name].select_dtypes("number"))
+                 for name in ("mensuel", "details")}
+    aggregates = quarterly_aggregates("details", details)
+    cohort_analysis(versions["clients"], datasets["clients"])
+    for model in FORECAST_MODELS[1:]:
+        for horizon in FORECAST_HORIZONS:
+            forecast_frame(datasets["mensuel"], ["Revenu", "Marge"], int(horizon.split()[0]), model)
+    return DataSnapshot(
+        version=_cache_key(sorted(versions.items())),
+        datasets=datasets,
+        versions=versions,
+        kpis=kpis,
+        anomalies=anomalies,
+        aggregates=aggregates,
+        refreshed_at=datetime.now(),
+        duration=time.perf_counter() - started
+    )
+
+class RefreshScheduler:
+    """
+    Actualise les données en arrière-plan, à intervalles alignés sur l'horloge
+    (comme une entrée cron « toutes les N secondes »). La nouvelle version est
+    publiée par un simple échange de référence : les lecteurs voient
+    l'ancienne version ou la nouvelle, jamais un état partiel. Chaque worker a
+    son planificateur : N workers relisent N fois les sources, mais les
+    versions identiques ne sont écrites qu'une fois (dossier par hash du contenu).
+    La première version est construite par le thread lui-même : seules les
+    pages qui lisent les données l'attendent, et seulement si elle n'est pas prête
+    """
+    THREAD_NAME = "portfolio-refresh"
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.errors = 0
+        self._snapshot = None
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=self.THREAD_NAME, daemon=True)
+        # Arrêt appelable depuis le planificateur de l'exécution suivante
+        self._thread.stop = self.stop
+
+    def start(self):
+        # Un rechargement du script recrée le planificateur (nouveau code, nouveau
+        # cache_resource) : le thread de l'ancien est arrêté au lieu de continuer
+        for thread in threading.enumerate():
+            if thread.name == self.THREAD_NAME and hasattr(thread, "stop"):
+                thread.stop()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def snapshot(self):
+        self._ready.wait()
+        if self._snapshot is None:
+            raise RuntimeError("Données du Dashboard indisponibles (échec de la première lecture des sources)")
+        return self._snapshot
+
+    def next_run(self):
+        now = time.time()
+        return (now // self.interval + 1) * self.interval
+
+    def refresh(self):
+        self._snapshot = build_snapshot()
+
+    def _run(self):
+        delay = 0
+        while not self._stop.wait(delay):
+            try:
+                self.refresh()
+            except Exception:
+                self.errors += 1
+                logging.getLogger(__name__).exception("Échec de l'actualisation des données")
+            # Après un premier échec, les lecteurs voient l'erreur plutôt qu'une attente sans fin
+            self._ready.set()
+            delay = self.next_run() - time.time() if self._snapshot else REFRESH_RETRY_SECONDS
+
+@st.cache_resource(show_spinner=False)
+def refresh_scheduler():
+    return RefreshScheduler(REFRESH_INTERVAL_SECONDS).start()
+
+def current_snapshot():
+    return refresh_scheduler().snapshot
+
+# =====================================================
+# EXPLORATEUR SQL (DUCKDB)
+# =====================================================
+EXPLORER_ROW_CAP = int(os.environ.get("PORTFOLIO_EXPLORER_ROW_CAP", "10000"))
+EXPLORER_TIMEOUT_SECONDS = float(os.environ.get("PORTFOLIO_EXPLORER_TIMEOUT", "5"))
+EXPLORER_PAGE_SIZE = 50
+EXPLORER_MEMORY_LIMIT = os.environ.get("PORTFOLIO_EXPLORER_MEMORY_LIMIT", "256MB")
+EXPLORER_THREADS = int(os.environ.get("PORTFOLIO_EXPLORER_THREADS", "2"))
+
+def normalize_sql(sql):
+    """
+    Forme canonique d'une requête pour le cache : seuls les blancs et le
+    point-virgule de fin sont retirés, les retours à la ligne sont conservés
+    pour qu'un commentaire `--` ne déborde pas sur la suite de la requête
+    """
+    return sql.strip().rstrip(";").rstrip()
+
+@st.cache_data(show_spinner=False, max_entries=512)
+def run_explorer_query(sql, version, _snapshot, row_cap=EXPLORER_ROW_CAP, timeout=EXPLORER_TIMEOUT_SECONDS):
+    """
+    Exécute une requête en lecture seule sur les datasets du snapshot (vues
+    DuckDB sur les DataFrames, sans copie), mémorisée par (requête, version des
+    données). La requête doit être une seule instruction SELECT ; le résultat
+    est plafonné à la lecture et renvoyé avec un indicateur de troncature
+    """
+    statements = duckdb.extract_statements(sql)
+    if len(statements) != 1 or statements[0].type != duckdb.StatementType.SELECT:
+        raise ValueError("Seule une requête SELECT / WITH unique est autorisée.")
+    con = duckdb.connect()
+    try:
+        for name, df in _snapshot.datasets.items():
+            con.register(name, df)
+        # Pas d'accès aux fichiers ni au réseau depuis une requête ad hoc,
+        # et une empreinte bornée pour ne pas pénaliser les autres sessions
+        con.execute("SET enable_external_access = false")
+        con.execute(f"SET memory_limit = '{EXPLORER_MEMORY_LIMIT}'")
+        con.execute(f"SET threads = {EXPLORER_THREADS}")
+        timer = threading.Timer(timeout, con.interrupt)
+        timer.start()
+        try:
+            cursor = con.execute(statements[0].query)
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchmany(row_cap + 1)
+        finally:
+            timer.cancel()
+    finally:
+        con.close()
+    return pd.DataFrame(rows[:row_cap], columns=columns), len(rows) > row_cap
+
+# =====================================================
+# ENRICHISSEMENT GITHUB
+# =====================================================
+GITHUB_API = os.environ.get("PORTFOLIO_GITHUB_API", "https://api.github.com")
+GITHUB_TOKEN = os.environ.get("PORTFOLIO_GITHUB_TOKEN")
+GITHUB_TTL_SECONDS = float(os.environ.get("PORTFOLIO_GITHUB_TTL", "3600"))
+GITHUB_CONCURRENCY = int(os.environ.get("PORTFOLIO_GITHUB_CONCURRENCY", "4"))
+GITHUB_TIMEOUT_SECONDS = 10
+GITHUB_RETRY_SECONDS = float(os.environ.get("PORTFOLIO_GITHUB_RETRY", "300"))
+HTTP_IDLE_SECONDS = 5
+HTTP_MAX_REDIRECTS = 3
+GITHUB_REPO_PATTERN = re.compile(r"github\.com/([\w.-]+/[\w.-]+?)(?:\.git)?/?$")
+
+def github_repo(link):
+    """
+    « owner/repo » d'un lien GitHub, None pour les autres liens
+    """
+    match = GITHUB_REPO_PATTERN.search(link or "")
+    return match.group(1) if match else None
+
+class AsyncHttpPool:
+    """
+    Client HTTP/1.1 asyncio minimal : connexions keep-alive réutilisées entre
+    les requêtes (abandonnées après HTTP_IDLE_SECONDS d'inactivité), redirections
+    suivies sur le même hôte et nombre de requêtes simultanées borné par un sémaphore
+    """
+    def __init__(self, base_url, limit, headers=None):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.secure = parts.scheme == "https"
+        self.port = parts.port or (443 if self.secure else 80)
+        self.prefix = parts.path.rstrip("/")
+        self.headers = {"Host": parts.netloc, "User-Agent": "martin-portfolio", **(headers or {})}
+        self.limit = limit
+        self._idle = []
+        self._semaphore = None
+
+    async def _connect(self, fresh=False):
+        while self._idle and not fresh:
+            reader, writer, released_at = self._idle.pop()
+            if time.monotonic() - released_at < HTTP_IDLE_SECONDS and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        context = ssl.create_default_context() if self.secure else None
+        return await asyncio.open_connection(self.host, self.port, ssl=context)
+
+    async def _read_body(self, reader, status, headers):
+        """
+        Corps de la réponse, délimité selon RFC 9112 : chunked, Content-Length,
+        sinon jusqu'à la fermeture de la connexion (qui n'est alors pas réutilisable)
+        """
+        if status in (204, 304) or 100 <= status < 200:
+            return b""
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    return b"".join(chunks)
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+        if "content-length" in headers:
+            return await reader.readexactly(int(headers["content-length"]))
+        return await reader.read()
+
+    async def _request(self, path, fresh=False):
+        reader, writer = await self._connect(fresh)
+        try:
+            lines = [f"GET {self.prefix}{path} HTTP/1.1", *(f"{k}: {v}" for k, v in self.headers.items())]
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+            await writer.drain()
+            status_line = (await reader.readline()).split()
+            if len(status_line) < 2:
+                # Ligne de statut vide : le serveur a fermé la connexion keep-alive
+                raise ConnectionResetError("Connexion fermée par le serveur")
+            status = int(status_line[1])
+            headers = {}
+            while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                key, _, value = line.decode("latin-1").partition(":")
+                headers[key.strip().lower()] = value.strip()
+            body = await self._read_body(reader, status, headers)
+        except BaseException:
+            writer.close()
+            raise
+        if headers.get("connection", "").lower() == "close" or reader.at_eof():
+            writer.close()
+        else:
+            self._idle.append((reader, writer, time.monotonic()))
+        return status, headers, body
+
+    async def _send(self, path):
+        try:
+            return await asyncio.wait_for(self._request(path), GITHUB_TIMEOUT_SECONDS)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # Connexion keep-alive fermée par le serveur : une nouvelle tentative
+            # sur une connexion neuve
+            return await asyncio.wait_for(self._request(path, fresh=True), GITHUB_TIMEOUT_SECONDS)
+
+    async def get_json(self, path):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+        async with self._semaphore:
+            status, headers, body = await self._send(path)
+            for _ in range(HTTP_MAX_REDIRECTS):
+                if status not in (301, 302, 303, 307, 308) or "location" not in headers:
+                    break
+                # Dépôt renommé ou transféré : GitHub redirige vers la nouvelle URL
+                target = urlsplit(headers["location"])
+                if target.hostname not in (None, self.host) or not target.path.startswith(self.prefix):
+                    break
+                path = target.path[len(self.prefix):] + (f"?{target.query}" if target.query else "")
+                status, headers, body = await self._send(path)
+        if status != 200:
+            raise RuntimeError(f"GitHub {path} : HTTP {status}")
+        return json.loads(body)
+
+class GitHubStats:
+    """
+    Cache TTL des statistiques de dépôts, « stale-while-revalidate » :
+    get() répond immédiatement avec la dernière valeur connue (ou None) et
+    déclenche au besoin une actualisation sur la boucle asyncio d'arrière-plan
+    """
+    def __init__(self, base_url, ttl, limit, retry=GITHUB_RETRY_SECONDS):
+        headers = {"Accept": "application/vnd.github+json"}
+        if GITHUB_TOKEN:
+            headers["Authorization"] = f"Bearer {GITHUB_TOKEN}"
+        self.ttl = ttl
+        self.retry = retry
+        self.errors = 0
+        self._http = AsyncHttpPool(base_url, limit, headers)
+        self._entries = {}
+        self._pending = set()
+        self._retry_at = {}
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="portfolio-github", daemon=True).start()
+
+    async def _fetch(self, repo):
+        info, languages, commits = await asyncio.gather(
+            self._http.get_json(f"/repos/{repo}"),
+            self._http.get_json(f"/repos/{repo}/languages"),
+            self._http.get_json(f"/repos/{repo}/commits?per_page=1"),
+        )
+        total = sum(languages.values()) or 1
+        return {
+            "stars": info.get("stargazers_count", 0),
+            "forks": info.get("forks_count", 0),
+            "url": info.get("html_url", f"https://github.com/{repo}"),
+            "last_commit": commits[0]["commit"]["committer"]["date"][:10] if commits else None,
+            "languages": {name: size / total for name, size in languages.items()},
+        }
+
+    async def _revalidate(self, repo):
+        try:
+            stats = await self._fetch(repo)
+            with self._lock:
+                self._entries[repo] = (time.time(), stats)
+                self._retry_at.pop(repo, None)
+        except Exception:
+            self.errors += 1
+            logging.getLogger(__name__).warning("Statistiques GitHub indisponibles pour %s", repo, exc_info=True)
+            with self._lock:
+                # La valeur reste datée de son dernier succès : on retente après
+                # un délai plutôt qu'à chaque rendu
+                self._retry_at[repo] = time.time() + self.retry
+        finally:
+            with self._lock:
+                self._pending.discard(repo)
+
+    def get(self, repo):
+        with self._lock:
+            fetched_at, stats = self._entries.get(repo, (0, None))
+            now = time.time()
+            if (now - fetched_at >= self.ttl and now >= self._retry_at.get(repo, 0)
+                    and repo not in self._pending):
+                self._pending.add(repo)
+                asyncio.run_coroutine_threadsafe(self._revalidate(repo), self._loop)
+        return stats
+
+@st.cache_resource(show_spinner=False)
+def github_stats():
+    return GitHubStats(GITHUB_API, GITHUB_TTL_SECONDS, GITHUB_CONCURRENCY)
+
+def github_badges(stats):
+    """
+    Ligne de statistiques d'un dépôt (étoiles, dernier commit, langages)
+    """
+    languages = " · ".join(f"{name} {share:.0%}" for name, share in
+                           sorted(stats["languages"].items(), key=lambda item: -item[1])[:3])
+    parts = [f"⭐ {stats['stars']}", f"🍴 {stats['forks']}"]
+    if stats["last_commit"]:
+        parts.append(f"🕒 {stats['last_commit']}")
+    if languages:
+        parts.append(f"🧬 {languages}")
+    return " | ".join(parts)
+
+# =====================================================
+# SIMULATION MONTE CARLO
+# =====================================================
+SIMULATION_HORIZON = 12
+SIMULATION_CHUNK = 50_000
+SLIDER_STEP = 0.5
+
+def _quantize(value, step=SLIDER_STEP):
+    return round(round(value / step) * step, 4)
+
+def _simulate_chunk(seed, out, start, growth, inflation, churn, volatility):
+    """
+    Trajectoires mensuelles (revenu, coûts, marge) d'un bloc, tirées d'un coup
+    en tableaux (chemins × mois) et écrites dans `out` (3 × chemins × mois)
+    """
+    rng = np.random.default_rng(seed)
+    shape = out.shape[1:]
+    growth_draws = rng.normal(growth, volatility, shape)
+    churn_draws = np.clip(rng.normal(churn, churn / 2, shape), 0, 1)
+    inflation_draws = rng.normal(inflation / 12, volatility / 2, shape)
+    revenue = start["Revenu"] * np.cumprod((1 + growth_draws) * (1 - churn_draws), axis=1)
+    costs = start["Coûts"] * np.cumprod(1 + inflation_draws, axis=1)
+    out[0], out[1], out[2] = revenue, costs, revenue - costs
+
+@st.cache_resource(show_spinner=False)
+def simulation_pool():
+    # numpy libère le GIL sur les gros tableaux : des threads suffisent, et
+    # contrairement aux processus ils n'ont pas à pickler le script Streamlit
+    return ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="monte-carlo")
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def run_simulation(version, _snapshot, growth, inflation, churn, n_paths, seed=42):
+    """
+    Quantiles (P10/P50/P90 × revenu/coûts/marge × mois) des trajectoires,
+    mémorisés sur les valeurs quantifiées des curseurs. Les gros volumes sont
+    découpés en blocs calculés en parallèle dans un même tableau (float32), dont
+    les quantiles sont calculés une seule fois sur l'ensemble des trajectoires
+    """
+    history = _snapshot.datasets["mensuel"]
+    start = {"Revenu": float(history["Revenu"].iloc[-1]), "Coûts": float(history["Coûts"].iloc[-1])}
+    volatility = float(history["Revenu"].pct_change().std())
+    n_chunks = max(1, n_paths // SIMULATION_CHUNK)
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    bounds = np.linspace(0, n_paths, n_chunks + 1, dtype=int)
+    paths = np.empty((3, n_paths, SIMULATION_HORIZON), dtype=np.float32)
+    args = (start, growth / 100, inflation / 100, churn / 100, volatility)
+    blocks = [(s, paths[:, lo:hi]) for s, lo, hi in zip(seeds, bounds[:-1], bounds[1:])]
+    if n_chunks == 1:
+        _simulate_chunk(*blocks[0], *args)
+    else:
+        # list() attend la fin de tous les blocs (et propage leurs erreurs)
+        list(simulation_pool().map(lambda block: _simulate_chunk(*block, *args), blocks))
+    return np.percentile(paths, [10, 50, 90], axis=1, overwrite_input=True)
+
+def create_fan_chart(quantiles, series_index, name, color, fill):
+    months = [f"M+{i}" for i in range(1, SIMULATION_HORIZON + 1)]
+    p10, p50, p90 = quantiles[:, series_index, :]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=months + months[::-1],
+        y=list(p90) + list(p10[::-1]),
+        fill="toself",
+        fillcolor=fill,
+        line=dict(width=0),
+        name="P10 – P90",
+        hoverinfo="skip"
+    ))
+    fig.add_trace(go.Scatter(
+        x=months,
+        y=p50,
+        name="P50",
+        line=dict(color=color, width=3)
+    ))
+    fig.update_layout(
+        title=f"{name} simulé(e) sur {SIMULATION_HORIZON} mois",
+        yaxis_title=f"{name} (K€)",
+        height=400,
+        plot_bgcolor="rgba(245, 247, 255, 0.5)",
+        paper_bgcolor="rgba(0,0,0,0)"
+    )
+    return fig
+
+# =====================================================
+# CACHE MÉMOIRE PARTITIONNÉ
+# =====================================================
+def _approx_nbytes(obj):
+    """
+    Estimation de l'empreinte mémoire d'un objet (DataFrame, array, figure...)
+    """
+    if hasattr(obj, "memory_usage"):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if hasattr(obj, "nbytes"):
+        return int(obj.nbytes)
+    if isinstance(obj, (str, bytes)):
+        return len(obj)
+    try:
+        return len(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(obj)
+
+class PartitionedStore:
+    """
+    Objets calculés par partition, avec un budget mémoire par partition et une
+    éviction LRU des partitions entières quand le budget global est dépassé.
+    Un objet évincé est simplement recalculé au prochain accès.
+    """
+    def __init__(self, partition_budget, total_budget, label="Partition"):
+        self.label = label
+        self.partition_budget = partition_budget
+        self.total_budget = total_budget
+        self._lock = threading.Lock()
+        self._partitions = OrderedDict()
+        self._total = 0
+
+    def _touch(self, partition_id):
+        partition = self._partitions.get(partition_id)
+        if partition is None:
+            partition = {"objects": OrderedDict(), "nbytes": 0}
+            self._partitions[partition_id] = partition
+        partition["last_seen"] = time.monotonic()
+        self._partitions.move_to_end(partition_id)
+        return partition
+
+    def _drop(self, partition, key):
+        _, nbytes = partition["objects"].pop(key)
+        partition["nbytes"] -= nbytes
+        self._total -= nbytes
+
+    def _evict(self, current_id):
+        # Partitions les moins récemment consultées en premier
+        for partition_id in list(self._partitions):
+            if self._total <= self.total_budget:
+                break
+            if partition_id == current_id:
+                continue
+            partition = self._partitions.pop(partition_id)
+            for key in list(partition["objects"]):
+                self._drop(partition, key)
+
+    def get_or_build(self, partition_id, key, builder):
+        with self._lock:
+            partition = self._touch(partition_id)
+            if key in partition["objects"]:
+                partition["objects"].move_to_end(key)
+                return partition["objects"][key][0]
+        obj = builder()
+        nbytes = _approx_nbytes(obj)
+        with self._lock:
+            partition = self._touch(partition_id)
+            if key in partition["objects"]:
+                self._drop(partition, key)
+            if nbytes <= self.partition_budget:
+                partition["objects"][key] = (obj, nbytes)
+                partition["nbytes"] += nbytes
+                self._total += nbytes
+                while partition["nbytes"] > self.partition_budget:
+                    self._drop(partition, next(iter(partition["objects"])))
+            self._evict(partition_id)
+        return obj
+
+    def stats(self):
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    self.label: partition_id[:8],
+                    "Objets": len(partition["objects"]),
+                    "Mémoire (Ko)": round(partition["nbytes"] / 1024, 1),
+                    "Inactivité (s)": round(now - partition["last_seen"])
+                }
+                for partition_id, partition in self._partitions.items()
+            ]
+
+# =====================================================
+# STATISTIQUES DE VISITE
+# =====================================================
+ANALYTICS_DB = os.path.join(CACHE_DIR, "analytics.sqlite3")
+ANALYTICS_FLUSH_SECONDS = float(os.environ.get("PORTFOLIO_ANALYTICS_FLUSH_SECONDS", "5"))
+ANALYTICS_IDLE_SECONDS = 1800
+FUNNEL_STEPS = ["🏠 Accueil", "🏢 Expériences", "📂 Projets", "📄 Contact", "action:contact"]
+
+ANALYTICS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (ts REAL, session_id TEXT, profile TEXT, kind TEXT, name TEXT);
+CREATE TABLE IF NOT EXISTS page_daily (profile TEXT, day TEXT, page TEXT, views INTEGER, seconds REAL, timed INTEGER,
+                                       PRIMARY KEY (profile, day, page));
+CREATE TABLE IF NOT EXISTS visits (profile TEXT, day TEXT, session_id TEXT, PRIMARY KEY (profile, day, session_id));
+CREATE TABLE IF NOT EXISTS session_steps (profile TEXT, session_id TEXT, step TEXT, first_ts REAL,
+                                          PRIMARY KEY (profile, session_id, step));
+"""
+
+class AnalyticsWriter:
+    """
+    Statistiques de visite first-party. log() ne fait qu'ajouter un tuple à
+    une deque (quelques microsecondes) ; un thread vide la file par lots dans
+    SQLite (mode WAL) et met à jour les agrégats lus par la page Statistiques
+    """
+    def __init__(self, path, interval):
+        self.path = path
+        self.interval = interval
+        self.logged = 0
+        self.log_seconds = 0.0
+        self.flushed = 0
+        self._queue = deque()
+        self._last_view = {}
+        self._stop = threading.Event()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.executescript(ANALYTICS_SCHEMA)
+        threading.Thread(target=self._run, name="portfolio-analytics", daemon=True).start()
+        atexit.register(self.flush)
+
+    def _connect(self):
+        con = sqlite3.connect(self.path, timeout=30)
+        con.execute("PRAGMA synchronous=NORMAL")
+        return con
+
+    def log(self, session_id, profile, kind, name):
+        started = time.perf_counter()
+        self._queue.append((time.time(), session_id, profile, kind, name))
+        self.logged += 1
+        self.log_seconds += time.perf_counter() - started
+
+    def _rollups(self, events):
+        views, seconds, timed = Counter(), Counter(), Counter()
+        visits, steps = set(), {}
+        for ts, session_id, profile, kind, name in events:
+            day = datetime.fromtimestamp(ts).date().isoformat()
+            visits.add((profile, day, session_id))
+            step = name if kind == "page" else f"{kind}:{name}"
+            steps.setdefault((profile, session_id, step), ts)
+            if kind != "page":
+                continue
+            views[(profile, day, name)] += 1
+            # Temps passé sur une page : jusqu'à la page vue suivante de la session
+            previous = self._last_view.get((profile, session_id))
+            if previous and ts - previous[1] <= ANALYTICS_IDLE_SECONDS:
+                previous_day = datetime.fromtimestamp(previous[1]).date().isoformat()
+                seconds[(profile, previous_day, previous[0])] += ts - previous[1]
+                timed[(profile, previous_day, previous[0])] += 1
+            self._last_view[(profile, session_id)] = (name, ts)
+        return views, seconds, timed, visits, steps
+
+    def flush(self):
+        events = []
+        while self._queue:
+            events.append(self._queue.popleft())
+        if not events:
+            return
+        views, seconds, timed, visits, steps = self._rollups(events)
+        keys = set(views) | set(seconds)
+        with self._connect() as con:
+            con.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?)", events)
+            con.executemany(
+                "INSERT INTO page_daily VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (profile, day, page) DO UPDATE SET "
+                "views = views + excluded.views, seconds = seconds + excluded.seconds, timed = timed + excluded.timed",
+                [(*key, views[key], seconds[key], timed[key]) for key in keys]
+            )
+            con.executemany("INSERT OR IGNORE INTO visits VALUES (?, ?, ?)", visits)
+            con.executemany("INSERT OR IGNORE INTO session_steps VALUES (?, ?, ?, ?)",
+                            [(*key, ts) for key, ts in steps.items()])
+        self.flushed += len(events)
+        cutoff = time.time() - ANALYTICS_IDLE_SECONDS
+        self._last_view = {key: view for key, view in self._last_view.items() if view[1] >= cutoff}
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:
+                logging.getLogger(__name__).exception("Échec de l'écriture des statistiques de visite")
+
+@st.cache_resource(show_spinner=False)
+def analytics():
+    return AnalyticsWriter(ANALYTICS_DB, ANALYTICS_FLUSH_SECONDS)
+
+def track(kind, name):
+    """
+    Enregistre un événement (page vue ou interaction) de la session courante
+    """
+    session_id = st.session_state.setdefault("session_id", uuid.uuid4().hex)
+    analytics().log(session_id, PROFILE["slug"], kind, name)
+
+def track_page(page):
+    # Une page vue par changement de page, pas à chaque rerun
+    if st.session_state.get("analytics_page") != page:
+        st.session_state["analytics_page"] = page
+        track("page", page)
+
+@st.cache_data(show_spinner=False, ttl=30)
+def analytics_rollups(profile, days=30):
+    """
+    Agrégats des statistiques de visite d'un profil sur la période (lecture seule)
+    """
+    since = date.fromordinal(date.today().toordinal() - days + 1).isoformat()
+    con = sqlite3.connect(f"file:{ANALYTICS_DB}?mode=ro", uri=True, timeout=30)
+    try:
+        pages = pd.read_sql_query(
+            "SELECT page AS Page, SUM(views) AS Vues, SUM(seconds) / MAX(SUM(timed), 1) AS \"Temps moyen (s)\" "
+            "FROM page_daily WHERE profile = ? AND day >= ? GROUP BY page ORDER BY Vues DESC", con,
+            params=(profile, since))
+        daily = pd.read_sql_query(
+            "SELECT day AS Jour, COUNT(*) AS Visites FROM visits WHERE profile = ? AND day >= ? "
+            "GROUP BY day ORDER BY day", con, params=(profile, since))
+        steps = pd.read_sql_query(
+            f"SELECT session_id, step, first_ts FROM session_steps WHERE profile = ? "
+            f"AND step IN ({','.join('?' * len(FUNNEL_STEPS))}) "
+            "AND session_id IN (SELECT session_id FROM visits WHERE profile = ? AND day >= ?)", con,
+            params=(profile, *FUNNEL_STEPS, profile, since))
+    finally:
+        con.close()
+    # Entonnoir : chaque étape doit suivre la précédente dans la même session
+    first = steps.pivot(index="session_id", columns="step", values="first_ts").reindex(columns=FUNNEL_STEPS)
+    reached = np.full(len(first), True)
+    previous = np.full(len(first), -np.inf)
+    funnel = []
+    for step in FUNNEL_STEPS:
+        ts = first[step].to_numpy()
+        reached &= ts >= previous
+        previous = np.where(reached, ts, previous)
+        funnel.append(int(reached.sum()))
+    return pages, daily, funnel
+
+# =====================================================
+# PROFILS (PLUSIEURS PORTFOLIOS PAR INSTANCE)
+# =====================================================
+PROFILES_DIR = os.environ.get("PORTFOLIO_PROFILES_DIR", "profiles")
+PROFILE_SLUG_PATTERN = re.compile(r"[a-z0-9][a-z0-9-]{0,63}")
+
+DEFAULT_PROFILE = {
+    "slug": "martin-alquier",
+    "name": "Martin Alquier",
+    "page_title": "Martin Alquier – Business Analyst",
+    "headline": "🎯 Business Analyst • Data & IA",
+    "tagline": "Transforme la donnée en décisions mesurables",
+    "photo": "photo.jpeg",
+    "mission": ("Business Analyst spécialisé en Data & IA, je combine expertise métier et technique pour transformer "
+                "la donnée en décisions stratégiques et en valeur business mesurable."),
+    "about": """
+        Avec un double parcours **Business / Data Engineering**, j'accompagne les entreprises dans leur 
+        transformation digitale par la data. Mon approche allie rigueur analytique, vision stratégique 
+        et innovation technologique.
+        
+        **Valeur ajoutée :**
+        - 🎯 Alignement data-stratégie business
+        - 📊 Création de dashboards actionnables
+        - 🤖 Intégration solutions IA/ML
+        - 🔄 Automatisation des processus
+        - 📈 Mesure d'impact ROI
+        """,
+    "highlights": [
+        {"title": "Projets Data", "value": "15+", "subtitle": "Dashboards & Automations", "icon": "📈"},
+        {"title": "Start-ups accompagnées", "value": "12", "subtitle": "Accélérateur Kryptosphere", "icon": "🚀"}
+    ],
+    "recent_achievements": [
+        {"title": "Gain d'efficacité", "value": "+30%", "subtitle": "Automatisation reporting", "icon": "⚡"},
+        {"title": "Satisfaction client", "value": "95%", "subtitle": "NPS augmenté", "icon": "😊"},
+        {"title": "Réduction coûts", "value": "-18%", "subtitle": "Optimisation supply chain", "icon": "💰"}
+    ],
+    "experience_highlights": [
+        {"title": "Projets majeurs", "value": "20+", "subtitle": "Data & Innovation", "icon": "🚀"}
+    ],
+    "kpi_subtitles": {"years": "Data & Consulting", "companies": "Consulting & Startup", "years_detail": "Data & Digital",
+                      "diplomas": "Master & Bachelor", "certifications": "Techniques & Métier",
+                      "study_years": "Business & Data"},
+    "supervisor": {
+        "name": "Mano Joseph Mathew",
+        "title": "Professeur",
+        "contact": {
+            "linkedin": "https://www.linkedin.com/in/manomathew/",
+            "github": "https://github.com",
+            "email": "contact@example.com"
+        }
+    },
+    "course": {"title": "Cours Business Intelligence Efrei", "logo": "efrei_logo.png", "school": "EFREI Paris"},
+    "links": {
+        "repository": "https://github.com/martmartin1103-cyber/martin-portfolio-data",
+        "demo": "https://martin-portfolio-data.streamlit.app"
+    },
+    "contact": {
+        "email": "martin.alquier@business.com",
+        "phone": "+33 6 XX XX XX XX",
+        "location": "Paris, France",
+        "linkedin": "https://www.linkedin.com/in/martin-alquier/",
+        "github": "https://github.com/martmartin1103-cyber",
+        "tableau": "https://public.tableau.com/"
+    },
+    "testimonials": [
+        {"quote": "Martin a transformé notre approche data avec des dashboards qui sont devenus indispensables à notre prise de décision quotidienne.",
+         "author": "Directeur Général, INETUM"},
+        {"quote": "Une vision stratégique exceptionnelle couplée à une expertise technique solide. Un partenaire idéal pour nos projets d'innovation.",
+         "author": "CEO, Zigourrat"}
+    ],
+    "certifications": [
+        {"name": "Microsoft Certified", "detail": "Data Analyst Associate", "year": "2023"},
+        {"name": "Google Analytics", "detail": "Individual Qualification", "year": "2022"},
+        {"name": "Scrum Master", "detail": "Certified ScrumMaster®", "year": "2021"}
+    ],
+    "experiences": EXPERIENCES,
+    "educations": EDUCATIONS,
+    "projects": PROJECTS,
+    "skills": SKILLS_DATA
+}
+
+# Champs facultatifs d'un fichier profiles/<slug>.json ("name" est le seul obligatoire)
+PROFILE_DEFAULTS = {
+    "page_title": None, "headline": "", "tagline": "", "photo": None, "mission": "", "about": "",
+    "highlights": [], "recent_achievements": [], "experience_highlights": [], "contact": {},
+    "supervisor": {}, "course": {},
+    "testimonials": [], "certifications": [], "experiences": [], "educations": [], "projects": [],
+    "skills": {}, "links": {}
+}
+KPI_SUBTITLE_DEFAULTS = {"years": "", "companies": "", "years_detail": "", "diplomas": "", "certifications": "",
+                         "study_years": ""}
+
+# Éléments de liste d'un profil : champs obligatoires (et leur type), valeurs par
+# défaut des champs facultatifs. Une liste dont le nom figure ici est validée
+# récursivement (achievements, honors) ; les autres listes sont des listes de textes
+PROFILE_ITEMS = {
+    "experiences": ({"company": str, "role": str, "duration": str},
+                    {"location": "", "description": "", "image_filename": None, "company_color": "#667eea",
+                     "tags": [], "achievements": []}),
+    "educations": ({"diploma": str, "school": str, "duration": str},
+                   {"location": "", "description": "", "image_filename": None, "specialities": [], "honors": []}),
+    "projects": ({"title": str}, {"client": "", "description": "", "technologies": [], "link": "#",
+                                  "image_filename": None, "chart": None}),
+    "achievements": ({"title": str, "description": str}, {"metrics": [], "impact": None}),
+    "honors": ({"title": str, "description": str}, {}),
+    "highlights": ({"title": str, "value": str}, {"subtitle": "", "icon": "⭐"}),
+    "recent_achievements": ({"title": str, "value": str}, {"subtitle": "", "icon": "⭐"}),
+    "experience_highlights": ({"title": str, "value": str}, {"subtitle": "", "icon": "⭐"}),
+    "certifications": ({"name": str}, {"detail": "", "year": ""}),
+    "testimonials": ({"quote": str, "author": str}, {}),
+}
+
+def _validate_items(items, key, path):
+    """
+    Éléments validés et complétés de la liste `key` ; ValueError indique le
+    chemin de l'élément fautif (ex. experiences[0].achievements[1].title)
+    """
+    required, defaults = PROFILE_ITEMS[key]
+    checked = []
+    for i, item in enumerate(items):
+        where = f"{path}[{i}]"
+        if not isinstance(item, dict):
+            raise ValueError(f"{where} : objet attendu, {type(item).__name__} reçu")
+        for field, kind in required.items():
+            if not isinstance(item.get(field), kind):
+                raise ValueError(f"{where}.{field} : champ obligatoire de type {kind.__name__}")
+        item = {**defaults, **item}
+        for field, default in defaults.items():
+            if default is None or item[field] is None:
+                continue
+            if not isinstance(item[field], type(default)):
+                raise ValueError(f"{where}.{field} : {type(default).__name__} attendu")
+            if field in PROFILE_ITEMS:
+                item[field] = _validate_items(item[field], field, f"{where}.{field}")
+            elif isinstance(default, list) and not all(isinstance(value, str) for value in item[field]):
+                raise ValueError(f"{where}.{field} : liste de textes attendue")
+        if "duration" in required:
+            try:
+                parse_date_range(item["duration"])
+            except ValueError as e:
+                raise ValueError(f"{where}.duration : {e}") from None
+        checked.append(item)
+    return checked
+
+def _validate_texts(mapping, path, lists=False):
+    # Dictionnaire texte -> texte (contact, liens) ou texte -> liste de textes (compétences)
+    for name, value in mapping.items():
+        texts = value if lists and isinstance(value, list) else [value]
+        if (lists and not isinstance(value, list)) or not all(isinstance(text, str) for text in texts):
+            raise ValueError(f"{path}.{name} : {'liste de textes attendue' if lists else 'texte attendu'}")
+
+def validate_profile(profile):
+    """
+    Complète un profil chargé avec les valeurs par défaut et vérifie sa
+    structure, éléments imbriqués compris ; ValueError décrit le premier
+    champ invalide et son chemin
+    """
+    if not isinstance(profile, dict):
+        raise ValueError("objet JSON attendu à la racine")
+    if not isinstance(profile.get("name"), str) or not profile["name"].strip():
+        raise ValueError("name : champ obligatoire")
+    profile = {**PROFILE_DEFAULTS, **profile}
+    for key, default in PROFILE_DEFAULTS.items():
+        if default is not None and not isinstance(profile[key], type(default)):
+            raise ValueError(f"{key} : {type(default).__name__} attendu")
+    profile["page_title"] = profile["page_title"] or profile["name"]
+    if not isinstance(profile.get("kpi_subtitles", {}), dict):
+        raise ValueError("kpi_subtitles : dict attendu")
+    profile["kpi_subtitles"] = {**KPI_SUBTITLE_DEFAULTS, **profile.get("kpi_subtitles", {})}
+    for key in ("kpi_subtitles", "contact", "links"):
+        _validate_texts(profile[key], key)
+    _validate_texts(profile["skills"], "skills", lists=True)
+    if profile["supervisor"]:
+        if not isinstance(profile["supervisor"].get("name"), str):
+            raise ValueError("supervisor.name : champ obligatoire")
+        _validate_texts(profile["supervisor"].get("contact", {}), "supervisor.contact")
+    if profile["course"] and not isinstance(profile["course"].get("title"), str):
+        raise ValueError("course.title : champ obligatoire")
+    for key in PROFILE_ITEMS:
+        if key in PROFILE_DEFAULTS:
+            profile[key] = _validate_items(profile[key], key, key)
+    return profile
+
+def read_profile(slug):
+    """
+    Charge et valide profiles/<slug>.json (même structure que DEFAULT_PROFILE) ;
+    ValueError nomme le fichier et le chemin du champ invalide
+    """
+    path = os.path.join(PROFILES_DIR, f"{slug}.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {**validate_profile(json.load(f)), "slug": slug}
+    except ValueError as e:
+        # json.JSONDecodeError est aussi une ValueError
+        raise ValueError(f"{path} : {e}") from e
+
+def active_profile():
+    """
+    Profil demandé par ?profile=<slug> (ou /p/<slug> derrière le reverse proxy),
+    chargé à la première visite seulement
+    """
+    slug = st.query_params.get("profile", DEFAULT_PROFILE["slug"])
+    if slug == DEFAULT_PROFILE["slug"]:
+        return DEFAULT_PROFILE
+    if not PROFILE_SLUG_PATTERN.fullmatch(slug) or not os.path.exists(os.path.join(PROFILES_DIR, f"{slug}.json")):
+        st.warning(f"Profil « {slug} » introuvable : affichage du portfolio par défaut.")
+        return DEFAULT_PROFILE
+    try:
+        return profile_store().get_or_build(slug, "bundle", lambda: read_profile(slug))
+    except ValueError as e:
+        st.warning(f"Profil « {slug} » invalide ({e}) : affichage du portfolio par défaut.")
+        return DEFAULT_PROFILE
+
+# Les données du profil demandé remplacent les données intégrées pour cette exécution
+PROFILE = active_profile()
+st.set_page_config(page_title=PROFILE["page_title"])
+EXPERIENCES = PROFILE["experiences"]
+EDUCATIONS = PROFILE["educations"]
+PROJECTS = PROFILE["projects"]
+SKILLS_DATA = PROFILE["skills"]
+DATA_VERSION = _cache_key(EXPERIENCES, EDUCATIONS, PROJECTS, SKILLS_DATA)
+
+# =====================================================
+# APERÇUS STATIQUES DES GRAPHIQUES
+# =====================================================
+PREVIEW_DIR = os.path.join(CACHE_DIR, "previews")
+PREVIEW_SIZE = (480, 270)
+# static/ à côté du script : c'est le dossier que Streamlit sert sous /app/static/
+OG_IMAGE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "og-image.png")
+PREVIEW_PALETTE = ["#667eea", "#42be65", "#f1c21b", "#da1e28", "#8a3ffc"]
+
+def _dashboard_figure(name):
+    snapshot = current_snapshot()
+    if name == "revenus":
+        return create_revenue_chart(snapshot.version, snapshot, DASHBOARD_FILTERS["period"][0],
+                                    FORECAST_MODELS[1], FORECAST_HORIZONS[0])
+    if name == "secteurs":
+        return create_sector_chart(snapshot.version, snapshot)
+    retention, _, _ = cohort_analysis(snapshot.versions["clients"], snapshot.datasets["clients"])
+    return create_retention_heatmap(retention)
+
+# Graphiques du Dashboard avec aperçu (clé facultative "chart" d'un projet)
+PREVIEW_CHARTS = {
+    "revenus": "Évolution des revenus et marges",
+    "secteurs": "Chiffre d'affaires par secteur",
+    "cohortes": "Rétention par cohorte"
+}
+
+def _color(value, index):
+    from PIL import ImageColor
+    try:
+        return ImageColor.getrgb(value)[:3]
+    except (TypeError, ValueError, AttributeError):
+        return ImageColor.getrgb(PREVIEW_PALETTE[index % len(PREVIEW_PALETTE)])
+
+def _render_preview(fig, size):
+    """
+    Rendu PNG minimal d'une figure avec PIL, quand kaleido n'est pas disponible :
+    barres, courbes, points et heatmaps, chaque série à sa propre échelle
+    """
+    from PIL import Image, ImageDraw, ImageFont
+    width, height = size
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    title = fig.layout.title.text or ""
+    try:
+        font = ImageFont.truetype("DejaVuSans.ttf", 15)
+    except OSError:
+        # Police intégrée sans accents
+        font = ImageFont.load_default(size=15)
+        title = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode()
+    draw.text((12, 8), title, fill=(51, 51, 51), font=font)
+    left, top, right, bottom = 12, 34, width - 12, height - 12
+    draw.line([(left, bottom), (right, bottom)], fill=(220, 220, 220))
+    traces = [trace for trace in fig.data if trace.hoverinfo != "skip"]
+    # Axe des abscisses commun : l'historique et la prévision se suivent
+    categories = {}
+    for trace in traces:
+        if trace.type != "heatmap" and trace.x is not None:
+            for x in _trace_values(trace.x):
+                categories.setdefault(str(x), len(categories))
+    slot = (right - left) / max(len(categories), 1)
+    # Échelle commune aux séries d'un même axe des ordonnées (historique et prévision)
+    ranges = {}
+    for trace in traces:
+        if trace.type in ("bar", "scatter"):
+            values = np.asarray(_trace_values(trace.y), dtype=float)
+            if trace.type == "bar":
+                values = np.append(values, 0)
+            low, high = ranges.get(trace.yaxis or "y", (np.inf, -np.inf))
+            ranges[trace.yaxis or "y"] = (min(low, np.nanmin(values)), max(high, np.nanmax(values)))
+    for index, trace in enumerate(traces):
+        if trace.type == "heatmap":
+            z = np.asarray(_trace_values(trace.z), dtype=float)
+            low, span = np.nanmin(z), (np.nanmax(z) - np.nanmin(z)) or 1
+            cell_w, cell_h = (right - left) / z.shape[1], (bottom - top) / z.shape[0]
+            for (i, j), value in np.ndenumerate(z):
+                if not np.isnan(value):
+                    shade = int(235 - 170 * (value - low) / span)
+                    draw.rectangle([left + j * cell_w, top + i * cell_h,
+                                    left + (j + 1) * cell_w - 1, top + (i + 1) * cell_h - 1],
+                                   fill=(shade, shade + 10, 255))
+            continue
+        try:
+            values = np.asarray(_trace_values(trace.y), dtype=float)
+        except (TypeError, ValueError):
+            continue
+        if len(values) == 0 or np.isnan(values).all():
+            continue
+        low, high = ranges.get(trace.yaxis or "y", (np.nanmin(values), np.nanmax(values)))
+        scale = (bottom - top) / ((high - low) or 1)
+        ys = bottom - (values - low) * scale
+        if trace.x is None:
+            starts = left + slot * np.arange(len(values))
+        else:
+            starts = left + slot * np.array([categories[str(x)] for x in _trace_values(trace.x)])
+        if trace.type == "bar":
+            color = _color(trace.marker.color, index)
+            for x, y in zip(starts, ys):
+                draw.rectangle([x + 2, y, x + slot - 2, bottom], fill=color)
+            continue
+        dash = "dash" in str(trace.line.dash)
+        points = [(x + slot / 2, y) for x, y in zip(starts, ys) if not np.isnan(y)]
+        if trace.mode == "markers":
+            for x, y in points:
+                draw.ellipse([x - 4, y - 4, x + 4, y + 4], outline=_color(trace.marker.color, index), width=2)
+        elif len(points) > 1:
+            draw.line(points, fill=_color(trace.line.color, index), width=2 if dash else 3)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+def figure_png(fig, size=PREVIEW_SIZE):
+    """
+    PNG d'une figure : export kaleido s'il est installé, rendu PIL sinon
+    """
+    if importlib.util.find_spec("kaleido") is not None:
+        try:
+            return fig.to_image(format="png", width=size[0], height=size[1])
+        except Exception:
+            logging.getLogger(__name__).warning("Export kaleido indisponible, rendu PIL", exc_info=True)
+    return _render_preview(fig, size)
+
+def chart_preview(name, lang=DEFAULT_LANGUAGE, size=PREVIEW_SIZE):
+    """
+    Chemin de l'aperçu PNG d'un graphique du Dashboard, par version des données
+    et par langue : un aperçu déjà rendu est relu sans construire la figure
+    """
+    key = _cache_key(CODE_VERSION, current_snapshot().version, name, lang, size)
+    path = os.path.join(PREVIEW_DIR, f"{name}-{key}.png")
+    if not os.path.exists(path):
+        _atomic_write(path, figure_png(translate_figure(_dashboard_figure(name), lang), size))
+    return path
+
+def chart_card(name, key):
+    """
+    Aperçu statique d'un graphique ; la figure Plotly n'est chargée qu'à la demande
+    """
+    if st.toggle(_("📊 Graphique interactif"), key=key, disabled=LITE):
+        plotly_chart(_dashboard_figure(name), use_container_width=True)
+    else:
+        show_image(chart_preview(name, LANG), caption=_(PREVIEW_CHARTS[name]), use_container_width=True)
+
+RADAR_PREVIEW_SIZE = (320, 260)
+
+def _render_radar(axes, size):
+    """
+    Radar des compétences dessiné avec PIL à partir des scores : ni plotly
+    ni numpy, pour la barre latérale de toutes les pages
+    """
+    from PIL import Image, ImageDraw, ImageFont
+    width, height = size
+    image = Image.new("RGBA", size, "white")
+    overlay = Image.new("RGBA", size, (0, 0, 0, 0))
+    draw, fill = ImageDraw.Draw(image), ImageDraw.Draw(overlay)
+    labels = list(axes)
+    try:
+        font = ImageFont.truetype("DejaVuSans.ttf", 11)
+    except OSError:
+        font = ImageFont.load_default(size=11)
+        labels = [unicodedata.normalize("NFKD", label).encode("ascii", "ignore").decode() for label in labels]
+    # Libellés longs sur deux lignes ; le rayon laisse la place au plus large
+    labels = [label.replace(" & ", " &\n", 1).replace(" / ", " /\n", 1) if len(label) > 12 else label
+              for label in labels]
+    cx, cy = width / 2, height / 2
+    angles = [math.pi / 2 - 2 * math.pi * i / len(axes) for i in range(len(axes))]
+    radius = cy - 30
+    for angle, label in zip(angles, labels):
+        reach = abs(math.cos(angle))
+        if reach > 0.1:
+            label_width = max(font.getlength(line) for line in label.split("\n"))
+            radius = min(radius, (cx - 8 - label_width) / reach - 6)
+    point = lambda angle, r: (cx + r * math.cos(angle), cy - r * math.sin(angle))
+    for level in (25, 50, 75, 100):
+        draw.polygon([point(a, radius * level / 100) for a in angles], outline=(220, 220, 220))
+    for angle, label in zip(angles, labels):
+        draw.line([(cx, cy), point(angle, radius)], fill=(220, 220, 220))
+        x, y = point(angle, radius + 6)
+        align = "left" if x > cx + 1 else "right" if x < cx - 1 else "center"
+        anchor = {"left": "l", "right": "r", "center": "m"}[align] + ("d" if y < cy - 1 else "a")
+        draw.multiline_text((x, y), label, fill=(80, 80, 80), font=font, anchor=anchor, align=align, spacing=1)
+    shape = [point(a, radius * min(score, 100) / 100) for a, score in zip(angles, axes.values())]
+    fill.polygon(shape, fill=(102, 126, 234, 153), outline=(102, 126, 234, 255))
+    image = Image.alpha_composite(image, overlay).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+def radar_preview(lang=DEFAULT_LANGUAGE, size=RADAR_PREVIEW_SIZE):
+    """
+    Chemin de l'image du radar, par version des données et par langue : relue
+    depuis le cache disque sans construire la figure Plotly
+    """
+    path = os.path.join(PREVIEW_DIR, f"radar-{_cache_key(CODE_VERSION, DATA_VERSION, lang, size)}.png")
+    if not os.path.exists(path):
+        table = catalog(lang)
+        axes = {table.get(_catalog_key(axis), axis): score for axis, score in skill_profile()["axes"].items()}
+        _atomic_write(path, _render_radar(axes, size))
+    return path
+
+def initials_avatar(name, size=240):
+    """
+    Avatar aux initiales, pour un profil sans photo
+    """
+    path = os.path.join(PREVIEW_DIR, f"avatar-{_cache_key(name, size)}.png")
+    if not os.path.exists(path):
+        from PIL import Image, ImageDraw, ImageFont
+        initials = "".join(word[0] for word in name.split()[:2]).upper()
+        image = Image.new("RGB", (size, size), "white")
+        draw = ImageDraw.Draw(image)
+        draw.ellipse([0, 0, size - 1, size - 1], fill=(102, 126, 234))
+        try:
+            font = ImageFont.truetype("DejaVuSans.ttf", size // 3)
+        except OSError:
+            font = ImageFont.load_default(size=size // 3)
+            initials = unicodedata.normalize("NFKD", initials).encode("ascii", "ignore").decode()
+        draw.text((size / 2, size / 2), initials, fill="white", font=font, anchor="mm")
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG", optimize=True)
+        _atomic_write(path, buffer.getvalue())
+    return path
+
+def publish_og_image():
+    """
+    Copie l'aperçu du graphique des revenus dans static/ (servi par Streamlit
+    sous /app/static/), pour la balise og:image injectée par le reverse proxy
+    """
+    os.makedirs(os.path.dirname(OG_IMAGE_PATH), exist_ok=True)
+    shutil.copyfile(chart_preview("revenus"), OG_IMAGE_PATH)
+
+# =====================================================
+# CV PDF
+# =====================================================
+CV_PAGE_SIZE = (595, 842)       # A4 en points
+CV_MARGIN = 50
+CV_POLL_SECONDS = 2
+# Symboles hors WinAnsi (cp1252) remplacés par un équivalent ASCII dans le PDF
+PDF_TRANSLITERATIONS = str.maketrans({
+    "→": "->", "←": "<-", "↔": "<->", "⇒": "=>", "≥": ">=", "≤": "<=", "≈": "~", "≠": "!=",
+    "−": "-", "✓": "v", "✔": "v", "✗": "x", "★": "*", "⭐": "*", "\u202f": " ", "\u2009": " "
+})
+
+def _cp1252(char):
+    try:
+        char.encode("cp1252")
+        return True
+    except UnicodeEncodeError:
+        return False
+
+class PdfDocument:
+    """
+    Générateur PDF minimal (texte seul, Helvetica en WinAnsi/cp1252) : pas de
+    dépendance pour un CV de quelques pages. Retour à la ligne sur une largeur
+    moyenne de glyphe, volontairement prudente
+    """
+    FONTS = {"regular": "F1", "bold": "F2"}
+
+    def __init__(self, page_size=CV_PAGE_SIZE, margin=CV_MARGIN):
+        self.width, self.height = page_size
+        self.margin = margin
+        self.pages = []
+        self._new_page()
+
+    def _new_page(self):
+        self.pages.append([])
+        self.y = self.height - self.margin
+
+    @staticmethod
+    def _encode(text):
+        text = text.translate(PDF_TRANSLITERATIONS)
+        # Icône en tête de texte (emoji des titres de l'app) : décorative, retirée
+        while text and not _cp1252(text[0]) and unicodedata.category(text[0]) in ("So", "Mn", "Cf"):
+            text = text[1:].lstrip()
+        chars = []
+        for char in text:
+            if not _cp1252(char):
+                # Lettre accentuée hors WinAnsi : lettre de base ; sinon « ? » visible
+                char = unicodedata.normalize("NFKD", char).encode("cp1252", errors="ignore").decode("cp1252") or "?"
+            chars.append(char)
+        data = "".join(chars).encode("cp1252").strip()
+        return data.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+    def text(self, text, size=10, font="regular", color=(0.2, 0.2, 0.2), indent=0, spacing=1.35):
+        max_chars = max(int((self.width - 2 * self.margin - indent) / (size * 0.5)), 10)
+        lines, line = [], ""
+        for word in text.split():
+            if line and len(line) + 1 + len(word) > max_chars:
+                lines.append(line)
+                line = word
+            else:
+                line = f"{line} {word}" if line else word
+        lines.append(line)
+        for line in lines:
+            if self.y - size < self.margin:
+                self._new_page()
+            self.y -= size * spacing
+            self.pages[-1].append(
+                b"BT %.3f %.3f %.3f rg /%s %d Tf %.1f %.1f Td (%s) Tj ET" % (
+                    *color, self.FONTS[font].encode(), size, self.margin + indent, self.y, self._encode(line))
+            )
+
+    def space(self, points):
+        self.y -= points
+
+    def rule(self, color=(0.4, 0.494, 0.918)):
+        self.space(4)
+        self.pages[-1].append(b"%.3f %.3f %.3f RG 1 w %d %.1f m %d %.1f l S" % (
+            *color, self.margin, self.y, self.width - self.margin, self.y))
+        self.space(4)
+
+    def to_bytes(self):
+        # Objets : 1 catalogue, 2 arbre des pages, 3-4 polices, puis (page, contenu) par page
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+                b" ".join(b"%d 0 R" % (5 + 2 * i) for i in range(len(self.pages))), len(self.pages)),
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        ]
+        for i, commands in enumerate(self.pages):
+            stream = b"\n".join(commands)
+            objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+                           b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>" % (
+                               self.width, self.height, 6 + 2 * i))
+            objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        output = bytearray(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(output))
+            output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        xref = len(output)
+        output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+        return bytes(output)
+
+def build_cv_pdf(profile):
+    """
+    CV PDF : expériences (réalisations, métriques, impact), formations, compétences
+    """
+    pdf = PdfDocument()
+    accent = (0.4, 0.494, 0.918)
+    pdf.text(profile["name"], size=22, font="bold", color=(0.1, 0.1, 0.1))
+    pdf.text(profile["headline"], size=12, font="bold", color=accent)
+    contact = profile["contact"]
+    pdf.text(" | ".join(contact[key] for key in ("email", "phone", "location", "linkedin") if contact.get(key)),
+             size=9, color=(0.4, 0.4, 0.4))
+    if profile["mission"]:
+        pdf.space(6)
+        pdf.text(profile["mission"], size=10)
+
+    pdf.space(10)
+    pdf.text("Expériences professionnelles", size=14, font="bold", color=accent)
+    pdf.rule()
+    for exp in profile["experiences"]:
+        pdf.space(4)
+        pdf.text(f"{exp['role']} – {exp['company']}", size=11, font="bold")
+        pdf.text(f"{exp['duration']} · {exp['location']}", size=9, color=(0.4, 0.4, 0.4))
+        pdf.text(exp["description"], size=10)
+        for achievement in exp["achievements"]:
+            details = ", ".join(achievement.get("metrics", []))
+            impact = f" – impact {achievement['impact']}%" if achievement.get("impact") else ""
+            pdf.text(f"• {achievement['title']} : {achievement['description']}"
+                     + (f" ({details})" if details else "") + impact, size=9, indent=12)
+
+    pdf.space(10)
+    pdf.text("Formation", size=14, font="bold", color=accent)
+    pdf.rule()
+    for edu in profile["educations"]:
+        pdf.space(4)
+        pdf.text(f"{edu['diploma']} – {edu['school']}", size=11, font="bold")
+        pdf.text(f"{edu['duration']} · {edu['location']}", size=9, color=(0.4, 0.4, 0.4))
+        if edu["specialities"]:
+            pdf.text(", ".join(edu["specialities"]), size=9, indent=12)
+
+    pdf.space(10)
+    pdf.text("Compétences", size=14, font="bold", color=accent)
+    pdf.rule()
+    for category, skills in profile["skills"].items():
+        pdf.text(f"{category} : {', '.join(skills)}", size=10)
+    return pdf.to_bytes()
+
+CV_FIELDS = ("name", "headline", "contact", "mission", "experiences", "educations", "skills")
+
+class CvBuilder:
+    """
+    Construit les CV dans un worker d'arrière-plan, une fois par hash du
+    contenu : fichier sur disque partagé entre workers, et futur partagé entre
+    les téléchargements simultanés d'une même version
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="portfolio-cv")
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def _build(self, key, profile):
+        path = os.path.join(self.directory, f"{key}.pdf")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+        data = build_cv_pdf(profile)
+        _atomic_write(path, data)
+        return data
+
+    def get(self, profile):
+        key = _cache_key(CODE_VERSION, [profile[field] for field in CV_FIELDS])
+        with self._lock:
+            # Les CV terminés des autres versions sont relus depuis le disque
+            for done in [k for k, f in self._futures.items() if k != key and f.done()]:
+                del self._futures[done]
+            future = self._futures.get(key)
+            if future is None or (future.done() and future.exception() is not None):
+                future = self._executor.submit(self._build, key, profile)
+                self._futures[key] = future
+        return future
+
+@st.cache_resource(show_spinner=False)
+def cv_builder():
+    return CvBuilder(os.path.join(CACHE_DIR, "cv"))
+
+@st.fragment(run_every=CV_POLL_SECONDS)
+def cv_pending(future):
+    # Seul ce fragment est réexécuté en attendant le CV ; la page est relancée quand il est prêt
+    if future.done():
+        st.rerun()
+    st.caption(_("⏳ CV en cours de préparation…"))
+
+def cv_download_button():
+    """
+    Bouton de téléchargement du CV, sans attendre sa construction : légende
+    « en cours » tant que le worker n'a pas terminé
+    """
+    future = cv_builder().get(PROFILE)
+    if not future.done():
+        cv_pending(future)
+        return
+    if future.exception() is not None:
+        # Reconstruit à la prochaine exécution (voir CvBuilder.get)
+        st.caption(_("⚠️ CV indisponible pour le moment."))
+        return
+    st.download_button(_("📄 Télécharger mon CV"), data=future.result(), file_name=f"CV_{PROFILE['slug']}.pdf",
+                       mime="application/pdf", use_container_width=True)
+
+# =====================================================
+# PRÉCHAUFFAGE DES CACHES
+# =====================================================
+def warm_up(state=None):
+    """
+    Précalcule les graphiques et cartes. Après un redémarrage, tout est relu
+    depuis le cache disque (clé code + données)
+    """
+    started = time.perf_counter()
+    snapshot = current_snapshot()
+    version = snapshot.version
+    radar_competences()
+    for lang in LANGUAGES:
+        radar_preview(lang)
+    create_sector_chart(version, snapshot)
+    # Toutes les combinaisons de filtres du Dashboard (les figures sont traduites à l'affichage)
+    for period in DASHBOARD_FILTERS["period"]:
+        for forecast in FORECAST_MODELS:
+            for horizon in FORECAST_HORIZONS:
+                create_revenue_chart(version, snapshot, period, forecast, horizon)
+    create_drill_chart(version, snapshot, ())
+    create_cooccurrence_chart(DATA_VERSION)
+    for name in PREVIEW_CHARTS:
+        for lang in LANGUAGES:
+            chart_preview(name, lang)
+    publish_og_image()
+    cv_builder().get(PROFILE).result()
+    # Cartes en cache par langue : mêmes arguments traduits que sur les pages
+    for lang in LANGUAGES:
+        for exp in EXPERIENCES:
+            experience_header_html(exp["company"], translate(exp["role"], lang), translate(exp["duration"], lang),
+                                   translate(exp["location"], lang), exp["company_color"])
+        for edu in EDUCATIONS:
+            education_header_html(translate(edu["diploma"], lang), edu["school"], translate(edu["duration"], lang),
+                                  translate(edu["location"], lang))
+    duration = time.perf_counter() - started
+    if state is not None:
+        state["duration"] = duration
+    return duration
+
+# Préchauffage dans chaque processus Streamlit : désactivé par défaut, il importe
+# pandas et plotly au démarrage. Sans étape de déploiement (`--warm-up`), le
+# réactiver pour que le premier visiteur trouve les caches disque remplis
+WARM_UP_AT_BOOT = os.environ.get("PORTFOLIO_WARM_UP_AT_BOOT") == "1"
+
+@st.cache_resource(show_spinner=False)
+def start_warm_up():
+    """
+    Lance le préchauffage une fois par processus, en arrière-plan : le premier
+    rendu n'attend pas les imports lourds
+    """
+    state = {"duration": None}
+    threading.Thread(target=warm_up, args=(state,), name="portfolio-warm-up", daemon=True).start()
+    return state
+
+# `python app.py --warm-up` : préchauffage au déploiement, avant le premier visiteur
+if "--warm-up" in sys.argv:
+    print(f"✅ Caches préchauffés en {warm_up():.2f}s dans {CACHE_DIR}")
+    sys.exit(0)
+
+# Première lecture des données lancée en arrière-plan dès la première exécution :
+# les pages sans données ne l'attendent pas, le Dashboard la trouve le plus souvent prête
+refresh_scheduler()
+warm_up_state = start_warm_up() if WARM_UP_AT_BOOT else None
+
+# =====================================================
+# DIAGNOSTICS
+# =====================================================
+HEAVY_MODULES = ("numpy", "pandas", "plotly.graph_objects", "plotly.express")
+# `-X importtime` lance un sous-processus : réservé aux instances qui l'activent
+IMPORTTIME_REPORT = os.environ.get("PORTFOLIO_IMPORTTIME_REPORT") == "1"
+
+@st.cache_data(show_spinner=False)
+def import_time_report(modules=HEAVY_MODULES):
+    """
+    Détail par module de `python -X importtime` pour les imports lourds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+        capture_output=True, text=True, timeout=120
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append({
+            "Module": module.strip(),
+            "Niveau": (len(module) - len(module.lstrip()) - 1) // 2,
+            "Propre (ms)": int(self_us) / 1000,
+            "Cumulé (ms)": int(cumulative_us) / 1000
+        })
+    return pd.DataFrame(rows).sort_values("Cumulé (ms)", ascending=False)
+
+# =====================================================
+# SIDEBAR – PROFIL
+# =====================================================
+with st.sidebar:
+    # Photo de profil avec effet
+    profile_image = (load_image(PROFILE["photo"], alt_text=PROFILE["name"]) if PROFILE["photo"]
+                     else initials_avatar(PROFILE["name"]))
+    # st.markdown('<div class="profile-circle">', unsafe_allow_html=True)
+    show_image(profile_image, use_container_width=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown(f"""
+        <h3 style='text-align:center;margin-bottom:0;color:#333;'>{PROFILE["name"]}</h3>
+        <p style='text-align:center;color:#667eea;margin-top:4px;font-weight:600;'>
+        {_(PROFILE["headline"])}
+        </p>
+        <p style='text-align:center;color:#666;font-size:0.9rem;'>
+        {_(PROFILE["tagline"])}
+        </p>
+    """, unsafe_allow_html=True)
+    
+    st.divider()
+    
+    # Navigation
+    st.markdown(_("### 🔍 Navigation"))
+    page = st.radio(
+        "",
         [
             "🏠 Accueil",
             "🏢 Expériences",
             "📂 Projets",
             "📈 Dashboard",
+            "🔎 Explorer",
+            "🎲 Simulation",
             "🛠️ Compétences",
+            "🎯 Matching",
             "🎓 Formation",
-            "📄 Contact"
+            "📄 Contact",
+            "📊 Statistiques"
         ],
+        format_func=_,
         label_visibility="collapsed"
     )
+    track_page(page)
     
     st.divider()
     
-    # Compétences radar
-    st.markdown("### 📊 Compétences")
-    st.plotly_chart(radar_competences(), use_container_width=True, config={'displayModeBar': False})
+    # Compétences radar : image statique (le radar interactif est sur la page Compétences)
+    st.markdown(_("### 📊 Compétences"))
+    show_image(radar_preview(LANG), use_container_width=True)
     
     # Tags compétences
-    st.markdown("#### 🔧 Technologies")
+    st.markdown(_("#### 🔧 Technologies"))
     cols = st.columns(3)
-    tech_skills = ["Python", "SQL", "Power BI", "Tableau", "Excel", "Git"]
+    tech_scores = skill_profile()["techniques"]
+    tech_skills = sorted(tech_scores, key=tech_scores.get, reverse=True)
     for i, skill in enumerate(tech_skills):
         with cols[i % 3]:
             st.markdown(f'<span class="skill-tag">{skill}</span>', unsafe_allow_html=True)
@@ -872,112 +3797,129 @@ with st.sidebar:
     st.divider()
     
      # Contact sidebar
-    st.markdown("### 📱 Mon Contact")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown("[![LinkedIn](https://img.shields.io/badge/LinkedIn-0077B5?style=for-the-badge&logo=linkedin&logoColor=white)](https://www.linkedin.com/in/martin-alquier/)")
-    with col2:
-        st.markdown("[![GitHub](https://img.shields.io/badge/GitHub-100000?style=for-the-badge&logo=github&logoColor=white)](https://github.com/martmartin1103-cyber)")
-    with col3:
-        st.markdown("[![Email](https://img.shields.io/badge/Email-D14836?style=for-the-badge&logo=gmail&logoColor=white)](mailto:contact@example.com)")
+    st.markdown(_("### 📱 Mon Contact"))
+    contact_badges(PROFILE["contact"])
+    cv_download_button()
 
     st.divider()
     
-    # Contact sidebar
-    st.markdown("### 📱 Mano Joseph Mathew (Proffesseur)")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown("[![LinkedIn](https://img.shields.io/badge/LinkedIn-0077B5?style=for-the-badge&logo=linkedin&logoColor=white)](https://www.linkedin.com/in/manomathew/)")
-    with col2:
-        st.markdown("[![GitHub](https://img.shields.io/badge/GitHub-100000?style=for-the-badge&logo=github&logoColor=white)](https://github.com)")
-    with col3:
-        st.markdown("[![Email](https://img.shields.io/badge/Email-D14836?style=for-the-badge&logo=gmail&logoColor=white)](mailto:contact@example.com)")
+    # Encadrant (facultatif)
+    supervisor = PROFILE["supervisor"]
+    if supervisor:
+        title = f" ({_(supervisor['title'])})" if supervisor.get("title") else ""
+        st.markdown(f"### 📱 {supervisor['name']}{title}")
+        contact_badges(supervisor.get("contact", {}))
+        st.divider()
     
-    st.divider()
+    # Logo école (facultatif)
+    course = PROFILE["course"]
+    if course:
+        try:
+            st.markdown(_(f"### 📱 {course['title']}"))
+            if course.get("logo"):
+                show_image(load_image(course["logo"], alt_text=course.get("school", course["title"])),
+                           use_container_width=True)
+        except:
+            pass
     
-    # Logo école
-    try:
-        st.markdown("### 📱 Cours Business Intelligence Efrei")
-        efrei_logo = load_image("efrei_logo.png", alt_text="EFREI Paris")
-        st.image(efrei_logo, use_container_width=True)
-    except:
-        pass
+    # Diagnostics (?diagnostics=1)
+    if st.query_params.get("diagnostics") == "1":
+        st.divider()
+        with st.expander("⚙️ Diagnostics", expanded=False):
+            if warm_up_state is None:
+                st.caption("Préchauffage au démarrage désactivé (PORTFOLIO_WARM_UP_AT_BOOT)")
+            elif warm_up_state["duration"] is None:
+                st.caption("Préchauffage des caches en cours…")
+            else:
+                st.caption(f"Préchauffage des caches : {warm_up_state['duration']:.2f}s")
+            st.markdown("**Imports différés (processus)**")
+            for module in HEAVY_MODULES:
+                elapsed = _import_timings().get(module)
+                status = f"{elapsed * 1000:.0f} ms" if elapsed is not None else "non chargé"
+                st.markdown(f"- `{module}` : {status}")
+            st.markdown(f"**Caches des profils** (budget {PROFILE_BUDGET_MB:g} Mo / profil, "
+                        f"{PROFILES_BUDGET_MB:g} Mo au total)")
+            st.dataframe(pd.DataFrame(profile_store().stats()), use_container_width=True, hide_index=True)
+            if IMPORTTIME_REPORT and st.button("Mesurer -X importtime"):
+                report = import_time_report()
+                st.dataframe(report.head(25), use_container_width=True, hide_index=True)
 
 # =====================================================
 # PAGES
 # =====================================================
 
 if page == "🏠 Accueil":
-    st.title("👋 Bienvenue sur mon Portfolio Data")
-    
-    st.markdown("""
-    <div class="card">
-        <h3 style="color:white;margin:0;">🎯 Mission</h3>
-        <p style="color:white;opacity:0.9;">
-        Business Analyst spécialisé en Data & IA, je combine expertise métier et technique pour transformer 
-        la donnée en décisions stratégiques et en valeur business mesurable.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.title(_("👋 Bienvenue sur mon Portfolio Data"))
+    
+    if PROFILE["mission"]:
+        st.markdown(f"""
+        <div class="card">
+            <h3 style="color:white;margin:0;">{_("🎯 Mission")}</h3>
+            <p style="color:white;opacity:0.9;">
+            {_(PROFILE["mission"])}
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
     
     col1, col2 = st.columns([2, 1])
     with col1:
-        st.markdown("""
-        ### 📖 À propos
-        
-        Avec un double parcours **Business / Data Engineering**, j'accompagne les entreprises dans leur 
-        transformation digitale par la data. Mon approche allie rigueur analytique, vision stratégique 
-        et innovation technologique.
-        
-        **Valeur ajoutée :**
-        - 🎯 Alignement data-stratégie business
-        - 📊 Création de dashboards actionnables
-        - 🤖 Intégration solutions IA/ML
-        - 🔄 Automatisation des processus
-        - 📈 Mesure d'impact ROI
-        """)
+        st.markdown(_("### 📖 À propos"))
+        st.markdown(_(PROFILE["about"]))
     
     with col2:
         st.markdown('<div class="section-header">🚀 Highlights</div>', unsafe_allow_html=True)
-        st.markdown(kpi_card("Années d'expérience", "4+", "Data & Consulting", "#667eea", "💼"), 
-                   unsafe_allow_html=True)
-        st.markdown(kpi_card("Projets Data", "15+", "Dashboards & Automations", "#42be65", "📈"), 
-                   unsafe_allow_html=True)
-        st.markdown(kpi_card("Start-ups accompagnées", "12", "Accélérateur Kryptosphere", "#f1c21b", "🚀"), 
+        experience_years = total_years(exp["duration"] for exp in EXPERIENCES)
+        st.markdown(kpi_card(_("Années d'expérience"), f"{int(experience_years)}+",
+                             _(PROFILE["kpi_subtitles"]["years"]), "#667eea", "💼"), 
                    unsafe_allow_html=True)
+        for highlight, color in zip(PROFILE["highlights"], ["#42be65", "#f1c21b", "#ff6b6b"]):
+            st.markdown(kpi_card(_(highlight["title"]), highlight["value"], _(highlight.get("subtitle", "")), color,
+                                 highlight.get("icon", "⭐")), 
+                       unsafe_allow_html=True)
     
     st.divider()
     
     # Dernières réalisations
-    st.markdown("### 🌟 Dernières réalisations")
-    cols = st.columns(3)
-    with cols[0]:
-        st.markdown(kpi_card("Gain d'efficacité", "+30%", "Automatisation reporting", "#667eea", "⚡", 12), 
-                   unsafe_allow_html=True)
-    with cols[1]:
-        st.markdown(kpi_card("Satisfaction client", "95%", "NPS augmenté", "#42be65", "😊", 15), 
-                   unsafe_allow_html=True)
-    with cols[2]:
-        st.markdown(kpi_card("Réduction coûts", "-18%", "Optimisation supply chain", "#f1c21b", "💰", -8), 
-                   unsafe_allow_html=True)
+    if PROFILE["recent_achievements"]:
+        st.markdown(_("### 🌟 Dernières réalisations"))
+        cols = st.columns(len(PROFILE["recent_achievements"]))
+        colors = ["#667eea", "#42be65", "#f1c21b"]
+        for i, (col, achievement) in enumerate(zip(cols, PROFILE["recent_achievements"])):
+            color = colors[i % len(colors)]
+            with col:
+                st.markdown(kpi_card(_(achievement["title"]), achievement["value"], _(achievement.get("subtitle", "")),
+                                     color, achievement.get("icon", "⭐")), 
+                           unsafe_allow_html=True)
 
 # -----------------------------------------------------
 elif page == "🏢 Expériences":
-    st.title("🏢 Parcours Professionnel")
+    st.title(_("🏢 Parcours Professionnel"))
     
     # Introduction avec statistiques
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.markdown(kpi_card("Entreprises", "3", "Consulting & Startup", "#667eea", "🏢"), 
-                   unsafe_allow_html=True)
-    with col2:
-        st.markdown(kpi_card("Années exp.", "4+", "Data & Digital", "#42be65", "📅"), 
+    cols = st.columns(2 + len(PROFILE["experience_highlights"]))
+    with cols[0]:
+        st.markdown(kpi_card(_("Entreprises"), str(len(EXPERIENCES)), _(PROFILE["kpi_subtitles"]["companies"]),
+                             "#667eea", "🏢"), 
                    unsafe_allow_html=True)
-    with col3:
-        st.markdown(kpi_card("Projets majeurs", "20+", "Data & Innovation", "#f1c21b", "🚀"), 
+    with cols[1]:
+        experience_years = total_years(exp["duration"] for exp in EXPERIENCES)
+        st.markdown(kpi_card(_("Années exp."), f"{int(experience_years)}+", _(PROFILE["kpi_subtitles"]["years_detail"]),
+                             "#42be65", "📅"), 
                    unsafe_allow_html=True)
+    colors = ["#f1c21b", "#ff6b6b"]
+    for i, (col, highlight) in enumerate(zip(cols[2:], PROFILE["experience_highlights"])):
+        color = colors[i % len(colors)]
+        with col:
+            st.markdown(kpi_card(_(highlight["title"]), highlight["value"], _(highlight.get("subtitle", "")),
+                                 color, highlight.get("icon", "⭐")), 
+                       unsafe_allow_html=True)
+    
+    # Frise chronologique
+    if EXPERIENCES or EDUCATIONS:
+        plotly_chart(create_career_timeline(DATA_VERSION, date.today(), EXPERIENCES, EDUCATIONS),
+                        use_container_width=True)
     
-    st.markdown("### 📍 Mes expériences en détail")
+    st.markdown(_("### 📍 Mes expériences en détail"))
     
     # Timeline des expériences avec images
     for exp in EXPERIENCES:
@@ -994,206 +3936,372 @@ elif page == "🏢 Expériences":
         )
     
     # Section témoignages ou références
-    st.markdown("### 💬 Témoignages")
-    with st.expander("Voir les recommandations", expanded=False):
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("""
-            <div style="
-                background: #f8f9fa;
-                padding: 1.5rem;
-                border-radius: 10px;
-                margin: 1rem 0;
-                border-left: 4px solid #667eea;
-            ">
-                <p style="font-style: italic; color: #555;">
-                "Martin a transformé notre approche data avec des dashboards qui sont devenus indispensables à notre prise de décision quotidienne."
-                </p>
-                <p style="text-align: right; font-weight: bold; color: #333;">
-                — Directeur Général, INETUM
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
-        with col2:
-            st.markdown("""
-            <div style="
-                background: #f8f9fa;
-                padding: 1.5rem;
-                border-radius: 10px;
-                margin: 1rem 0;
-                border-left: 4px solid #42be65;
-            ">
-                <p style="font-style: italic; color: #555;">
-                "Une vision stratégique exceptionnelle couplée à une expertise technique solide. Un partenaire idéal pour nos projets d'innovation."
-                </p>
-                <p style="text-align: right; font-weight: bold; color: #333;">
-                — CEO, Zigourrat
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+    if PROFILE["testimonials"]:
+        st.markdown(_("### 💬 Témoignages"))
+        with st.expander(_("Voir les recommandations"), expanded=False):
+            cols = st.columns(2)
+            for i, testimonial in enumerate(PROFILE["testimonials"]):
+                with cols[i % 2]:
+                    st.markdown(f"""
+                    <div style="
+                        background: #f8f9fa;
+                        padding: 1.5rem;
+                        border-radius: 10px;
+                        margin: 1rem 0;
+                        border-left: 4px solid {["#667eea", "#42be65"][i % 2]};
+                    ">
+                        <p style="font-style: italic; color: #555;">
+                        "{_(testimonial["quote"])}"
+                        </p>
+                        <p style="text-align: right; font-weight: bold; color: #333;">
+                        — {_(testimonial["author"])}
+                        </p>
+                    </div>
+                    """, unsafe_allow_html=True)
 
 # -----------------------------------------------------
 elif page == "📂 Projets":
-    st.title("📂 Portfolio de Projets")
+    st.title(_("📂 Portfolio de Projets"))
     
     # Filtres
     col1, col2, col3 = st.columns(3)
     with col1:
-        category = st.selectbox("Filtrer par catégorie", ["Tous", "Data Science", "Business Intelligence", "IA/ML", "Stratégie"])
+        category = st.selectbox(_("Filtrer par catégorie"), ["Tous", "Data Science", "Business Intelligence", "IA/ML", "Stratégie"],
+                                format_func=_)
     with col2:
-        year = st.selectbox("Année", ["Toutes", "2024", "2023", "2022"])
+        year = st.selectbox(_("Année"), ["Toutes", "2024", "2023", "2022"], format_func=_)
     with col3:
         st.markdown("<br>", unsafe_allow_html=True)
-        show_details = st.checkbox("Afficher détails", value=True)
+        show_details = st.checkbox(_("Afficher détails"), value=True)
     
     # Grille de projets
-    st.markdown("### 🚀 Projets récents")
-    for project in PROJECTS:
+    st.markdown(_("### 🚀 Projets récents"))
+    for i, project in enumerate(PROJECTS):
         with st.container():
-            st.markdown(f"#### {project['title']}")
-            st.markdown(f"**Client :** {project['client']}")
-            st.markdown(project['description'])
+            st.markdown(f"#### {_(project['title'])}")
+            st.markdown(_("**Client :** {client}").format(client=project['client']))
+            st.markdown(_(project['description']))
             
-            st.markdown("**Technologies :**")
+            st.markdown(_("**Technologies :**"))
             for tech in project['technologies']:
                 st.markdown(f'<span class="skill-tag">{tech}</span>', unsafe_allow_html=True)
             
             if project['link'] != "#":
-                st.markdown(f"[🔗 Voir le projet]({project['link']})")
+                st.markdown(f"[{_('🔗 Voir le projet')}]({project['link']})")
+            
+            repo = github_repo(project['link'])
+            if repo:
+                stats = github_stats().get(repo)
+                st.caption(github_badges(stats) if stats else _("⏳ Statistiques GitHub en cours de chargement..."))
+            
+            # Graphique du Dashboard si le projet en désigne un, sinon son image
+            if project.get("chart") in PREVIEW_CHARTS:
+                chart_card(project["chart"], key=f"project_chart_{i}")
+            elif project.get("image_filename"):
+                show_image(load_image(project["image_filename"], alt_text=project["title"]),
+                           use_container_width=True)
             
             st.divider()
+    
+    # Aperçus des graphiques du Dashboard : une image statique par graphique
+    st.markdown(_("### 📊 Aperçus du Dashboard"))
+    cols = st.columns(len(PREVIEW_CHARTS))
+    for col, name in zip(cols, PREVIEW_CHARTS):
+        with col:
+            chart_card(name, key=f"preview_chart_{name}")
 
 # -----------------------------------------------------
 elif page == "📈 Dashboard":
-    st.title("📈 Tableau de Bord Business")
+    st.title(_("📈 Tableau de Bord Business"))
     
-    # Filtres période
-    col1, col2, col3 = st.columns(3)
+    # Version des données publiée par l'actualisation en arrière-plan
+    snapshot = current_snapshot()
+    next_refresh = datetime.fromtimestamp(refresh_scheduler().next_run())
+    st.caption(_("🔄 Données actualisées le {refreshed:%d/%m/%Y à %H:%M:%S} en {ms:.0f} ms · "
+                 "prochaine actualisation à {next:%H:%M}").format(refreshed=snapshot.refreshed_at,
+                                                                ms=snapshot.duration * 1000, next=next_refresh))
+    
+    # Filtres période : appliqués ensemble (un seul rerun) et synchronisés
+    # avec l'URL pour que les liens partagés ouvrent la bonne vue
+    filters = dashboard_filters_from_url()
+    with st.form("dashboard_filters", border=False):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            period = st.selectbox(_("Période"), DASHBOARD_FILTERS["period"], format_func=_,
+                                  index=DASHBOARD_FILTERS["period"].index(filters["period"]))
+        with col2:
+            metric = st.selectbox(_("Métrique principale"), DASHBOARD_FILTERS["metric"], format_func=_,
+                                  index=DASHBOARD_FILTERS["metric"].index(filters["metric"]))
+        with col3:
+            comparison = st.selectbox(_("Comparaison"), DASHBOARD_FILTERS["comparison"], format_func=_,
+                                      index=DASHBOARD_FILTERS["comparison"].index(filters["comparison"]))
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            forecast = st.selectbox(_("Prévision"), FORECAST_MODELS, format_func=_,
+                                    index=FORECAST_MODELS.index(filters["forecast"]))
+        with col2:
+            horizon = st.selectbox(_("Horizon"), FORECAST_HORIZONS, format_func=_,
+                                   index=FORECAST_HORIZONS.index(filters["horizon"]))
+        if st.form_submit_button(_("🔄 Appliquer les filtres")):
+            track("action", "filtres")
+            st.query_params.update(period=period, metric=metric, comparison=comparison,
+                                   forecast=forecast, horizon=horizon)
+    
+    # KPI Principaux, calculés depuis les données (badge si anomalie sur la période)
+    st.markdown(_("### 🎯 Indicateurs Clés"))
+    kpis = snapshot.kpis[period]
+    anomaly_counts = snapshot.anomalies["details"].tail(PERIOD_MONTHS[period]).sum()
+    kpi_styles = [("#667eea", "💰"), ("#42be65", "📈"), ("#f1c21b", "😊"), ("#da1e28", "📉")]
+    for col, (title, definition), (color, icon) in zip(st.columns(4), KPI_DEFINITIONS.items(), kpi_styles):
+        anomalies = anomaly_counts[definition["column"]]
+        with col:
+            st.markdown(kpi_card(_(title), kpi_display(kpis, title), _(comparison), color, icon,
+                                 kpi_trend(kpis, title, comparison), higher_is_better=definition["higher_is_better"],
+                                 badge=_("{count} anomalie(s)").format(count=anomalies) if anomalies else None,
+                                 sparkline=sparkline_svg(kpis.loc[title, "Sparkline"], color)), 
+                       unsafe_allow_html=True)
+    
+    # Graphiques
+    col1, col2 = st.columns(2)
     with col1:
-        period = st.selectbox("Période", ["Année 2024", "Trimestre en cours", "Mois en cours"])
+        plotly_chart(create_revenue_chart(snapshot.version, snapshot, period, forecast, horizon),
+                     use_container_width=True)
+    
     with col2:
-        metric = st.selectbox("Métrique principale", ["Revenu", "Marge", "NPS", "Coûts"])
-    with col3:
-        comparison = st.selectbox("Comparaison", ["vs année précédente", "vs cible", "vs benchmark"])
+        # Exploration : secteur › sous-secteur › client › mois
+        path = tuple(st.session_state.get("drill_path", []))
+        crumbs = st.columns(len(path) + 1)
+        for depth, (col, label) in enumerate(zip(crumbs, (_("Tous secteurs"),) + path)):
+            with col:
+                st.button(label, key=f"drill_crumb_{depth}", on_click=set_drill_path, args=(path[:depth],),
+                          disabled=depth == len(path), use_container_width=True)
+        can_drill = len(path) < len(DRILL_LEVELS) - 1
+        event = plotly_chart(
+            create_drill_chart(snapshot.version, snapshot, path), use_container_width=True,
+            on_select="rerun" if can_drill else "ignore", selection_mode="points",
+            key=f"sector_drill_{'/'.join(path)}"
+        )
+        if can_drill and event and event.selection.points:
+            set_drill_path(path + (event.selection.points[0]["x"],))
+            st.rerun()
     
-    # KPI Principaux
-    st.markdown("### 🎯 Indicateurs Clés")
-    col1, col2, col3, col4 = st.columns(4)
+    # Tableau détaillé
+    st.markdown(_("### 📊 Données détaillées"))
+    df = snapshot.datasets["details"].tail(PERIOD_MONTHS[period]).reset_index(drop=True)
+    
+    table = translate_columns(df.assign(Mois=df["Mois"].map(_)))
+    st.dataframe(table.style.background_gradient(subset=[_("Marge %")], cmap="YlGn"), 
+                use_container_width=True)
+    
+    # Agrégats trimestriels (maintenus de façon incrémentale)
+    with st.expander(_("📅 Agrégats trimestriels"), expanded=False):
+        aggregates = snapshot.aggregates
+        st.dataframe(translate_columns(aggregates.xs("mean", axis=1, level=1).round(1)), use_container_width=True)
+        st.caption(_("Moyennes par trimestre ; sommes, min et max maintenus par delta à chaque ajout de lignes."))
+    
+    # Cohortes clients
+    st.markdown(_("### 👥 Cohortes clients"))
+    retention, ltv, churn = cohort_analysis(snapshot.versions["clients"], snapshot.datasets["clients"])
+    col1, col2, col3 = st.columns(3)
     with col1:
-        st.markdown(kpi_card("Revenu Mensuel", "210 K€", "+12% vs M-1", "#667eea", "💰", 12), 
+        st.markdown(kpi_card(_("Churn mensuel moyen"), f"{churn.mean():.1f}%", "", "#da1e28", "🚪"),
                    unsafe_allow_html=True)
     with col2:
-        st.markdown(kpi_card("Marge Brute", "32%", "+4 pts", "#42be65", "📈", 4), 
+        st.markdown(kpi_card(_("Rétention à 3 mois"), f"{retention[3].mean():.0f}%", "", "#42be65", "🔁"),
                    unsafe_allow_html=True)
     with col3:
-        st.markdown(kpi_card("NPS Client", "85", "+5 pts", "#f1c21b", "😊", 5), 
-                   unsafe_allow_html=True)
-    with col4:
-        st.markdown(kpi_card("Coûts Opérationnels", "110 K€", "-8%", "#da1e28", "📉", -8), 
+        st.markdown(kpi_card(_("LTV à 6 mois"), f"{ltv[5].mean():.1f} K€", "", "#667eea", "💎"),
                    unsafe_allow_html=True)
+    plotly_chart(create_retention_heatmap(retention), use_container_width=True)
+    with st.expander(_("💎 LTV cumulée par client (K€)"), expanded=False):
+        st.dataframe(translate_columns(ltv.round(2)), use_container_width=True)
+
+# -----------------------------------------------------
+elif page == "🔎 Explorer":
+    st.title(_("🔎 Explorateur SQL"))
+    snapshot = current_snapshot()
+    st.markdown(_("Requêtes SQL ad hoc (DuckDB) sur les datasets du Dashboard : ")
+                + ", ".join(f"`{name}`" for name in snapshot.datasets))
     
-    # Graphiques
-    col1, col2 = st.columns(2)
-    with col1:
-        st.plotly_chart(create_revenue_chart(), use_container_width=True)
+    with st.expander(_("📋 Schéma des tables"), expanded=False):
+        for name, df in snapshot.datasets.items():
+            st.markdown(f"**{name}** : " + ", ".join(f'`{col}`' for col in df.columns))
     
+    with st.form("explorer_query"):
+        sql = st.text_area(_("Requête"), height=120, value=(
+            'SELECT Mois, Revenu, "Coûts", Revenu - "Coûts" AS Marge\n'
+            "FROM details\n"
+            "ORDER BY Revenu DESC"
+        ))
+        submitted = st.form_submit_button(_("▶️ Exécuter"))
+    
+    if submitted:
+        track("action", "requete_sql")
+        st.session_state["explorer_sql"] = normalize_sql(sql)
+        st.session_state["explorer_page"] = 1
+    
+    query = st.session_state.get("explorer_sql")
+    if query:
+        started = time.perf_counter()
+        try:
+            result, truncated = run_explorer_query(query, snapshot.version, snapshot)
+        except duckdb.InterruptException:
+            st.error(_("⏱️ Requête interrompue après {seconds:g}s.").format(seconds=EXPLORER_TIMEOUT_SECONDS))
+        except (duckdb.Error, ValueError) as e:
+            st.error(f"❌ {e}")
+        else:
+            elapsed = (time.perf_counter() - started) * 1000
+            pages = max(1, -(-len(result) // EXPLORER_PAGE_SIZE))
+            st.caption(_("{rows} ligne(s) en {ms:.0f} ms").format(rows=len(result), ms=elapsed)
+                       + (_(" · résultat limité à {cap} lignes").format(cap=EXPLORER_ROW_CAP) if truncated else ""))
+            page_number = st.number_input("Page", min_value=1, max_value=pages, key="explorer_page")
+            start = (page_number - 1) * EXPLORER_PAGE_SIZE
+            st.dataframe(result.iloc[start:start + EXPLORER_PAGE_SIZE], use_container_width=True, hide_index=True)
+            st.download_button(_("⬇️ Exporter en CSV"), result.to_csv(index=False).encode("utf-8"),
+                               file_name="explorer.csv", mime="text/csv")
+
+# -----------------------------------------------------
+elif page == "🎲 Simulation":
+    st.title(_("🎲 Simulation What-if"))
+    st.markdown(_("Simulation Monte Carlo du revenu, des coûts et de la marge à partir du dernier mois du Dashboard."))
+    
+    # Hypothèses
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        growth = st.slider(_("Croissance mensuelle (%)"), -5.0, 10.0, 3.0, SLIDER_STEP)
     with col2:
-        # Données sectorielles
-        sector_data = pd.DataFrame({
-            "Secteur": ["Tech", "Finance", "Retail", "Health", "Manufacturing"],
-            "CA": [45, 30, 15, 25, 20],
-            "Croissance": [12, 8, 5, 15, 7]
-        })
-        
-        fig = px.bar(sector_data, x="Secteur", y="CA", 
-                    title="Chiffre d'affaires par secteur",
-                    color="Croissance",
-                    color_continuous_scale="Viridis")
-        fig.update_layout(height=400, plot_bgcolor="rgba(245, 247, 255, 0.5)")
-        st.plotly_chart(fig, use_container_width=True)
+        inflation = st.slider(_("Inflation des coûts (%/an)"), 0.0, 20.0, 4.0, SLIDER_STEP)
+    with col3:
+        churn = st.slider(_("Churn mensuel (%)"), 0.0, 10.0, 1.5, SLIDER_STEP)
+    with col4:
+        n_paths = st.selectbox(_("Trajectoires"), [10_000, 100_000, 500_000], index=1,
+                               format_func=lambda n: f"{n:,}".replace(",", " "))
     
-    # Tableau détaillé
-    st.markdown("### 📊 Données détaillées")
-    df = pd.DataFrame({
-        "Mois": ["Jan", "Fév", "Mar", "Avr", "Mai", "Juin"],
-        "Revenu": [180, 195, 210, 220, 240, 250],
-        "Coûts": [120, 115, 110, 115, 120, 125],
-        "Marge %": [33, 41, 48, 48, 50, 50],
-        "NPS": [75, 78, 82, 83, 85, 85],
-        "Clients": [45, 48, 52, 55, 58, 60]
-    })
+    with st.spinner(_("Simulation en cours...")):
+        snapshot = current_snapshot()
+        quantiles = run_simulation(snapshot.version, snapshot, _quantize(growth), _quantize(inflation),
+                                   _quantize(churn), n_paths)
     
-    st.dataframe(df.style.background_gradient(subset=["Marge %"], cmap="YlGn"), 
-                use_container_width=True)
+    # KPI P10 / P50 / P90 de la marge à 12 mois
+    st.markdown(_("### 🎯 Marge mensuelle à {months} mois").format(months=SIMULATION_HORIZON))
+    margin = quantiles[:, 2, -1]
+    cols = st.columns(3)
+    for col, label, value, color, icon in zip(cols, map(_, ["P10 (pessimiste)", "P50 (médian)", "P90 (optimiste)"]),
+                                              margin, ["#da1e28", "#667eea", "#42be65"], ["📉", "🎯", "📈"]):
+        with col:
+            st.markdown(kpi_card(label, f"{value:.0f} K€", "", color, icon), unsafe_allow_html=True)
+    
+    # Graphiques en éventail
+    col1, col2 = st.columns(2)
+    with col1:
+        plotly_chart(create_fan_chart(quantiles, 0, "Revenu", "#667eea", "rgba(102, 126, 234, 0.25)"),
+                        use_container_width=True)
+    with col2:
+        plotly_chart(create_fan_chart(quantiles, 2, "Marge", "#42be65", "rgba(66, 190, 101, 0.25)"),
+                        use_container_width=True)
 
 # -----------------------------------------------------
 elif page == "🛠️ Compétences":
-    st.title("🛠️ Compétences & Expertise")
+    st.title(_("🛠️ Compétences & Expertise"))
     
     # Radar des compétences
     col1, col2 = st.columns([2, 1])
     with col1:
-        st.plotly_chart(radar_competences(), use_container_width=True)
+        plotly_chart(radar_competences(), use_container_width=True)
     with col2:
-        st.markdown("### 📊 Niveau d'expertise")
-        st.metric("Data Analysis", "Expert", "+2%")
-        st.metric("Business Strategy", "Avancé", "+5%")
-        st.metric("Data Visualization", "Expert", "+3%")
-        st.metric("Machine Learning", "Intermédiaire", "+8%")
+        st.markdown(_("### 📊 Niveau d'expertise"))
+        profile = skill_profile()
+        for label, axis in SKILL_METRICS.items():
+            score = profile["axes"][axis]
+            delta = score - profile["axes_last_year"][axis]
+            st.metric(_(label), _(skill_level(score)), _("{delta:+.0f} pts sur 1 an").format(delta=delta),
+                      help=_("Score calculé : {score:.0f}/100").format(score=score))
+    
+    # Réseau des technologies
+    st.markdown(_("### 🕸️ Réseau des technologies"))
+    plotly_chart(create_cooccurrence_chart(DATA_VERSION), use_container_width=True)
     
     # Grille des compétences
     for category, skills in SKILLS_DATA.items():
-        st.markdown(f'<div class="section-header">{category}</div>', unsafe_allow_html=True)
+        st.markdown(f'<div class="section-header">{_(category)}</div>', unsafe_allow_html=True)
         cols = st.columns(6)
         for i, skill in enumerate(skills):
             with cols[i % 6]:
-                st.markdown(f'<div style="text-align:center;padding:0.5rem;background:#f8f9fa;border-radius:8px;margin:0.2rem;">{skill}</div>', unsafe_allow_html=True)
+                st.markdown(f'<div style="text-align:center;padding:0.5rem;background:#f8f9fa;border-radius:8px;margin:0.2rem;">{_(skill)}</div>', unsafe_allow_html=True)
     
     # Certifications
-    st.markdown("### 🏆 Certifications")
+    st.markdown(_("### 🏆 Certifications"))
     certs = st.columns(3)
-    with certs[0]:
-        st.markdown("""
-        <div style="background:white;padding:1rem;border-radius:10px;box-shadow:0 4px 12px rgba(0,0,0,0.08);">
-            <h4 style="color:#333;">Microsoft Certified</h4>
-            <p style="color:#666;font-size:0.9rem;">Data Analyst Associate</p>
-            <p style="color:#667eea;font-size:0.8rem;">Obtenu : 2023</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with certs[1]:
-        st.markdown("""
-        <div style="background:white;padding:1rem;border-radius:10px;box-shadow:0 4px 12px rgba(0,0,0,0.08);">
-            <h4 style="color:#333;">Google Analytics</h4>
-            <p style="color:#666;font-size:0.9rem;">Individual Qualification</p>
-            <p style="color:#667eea;font-size:0.8rem;">Obtenu : 2022</p>
-        </div>
-        """, unsafe_allow_html=True)
-    with certs[2]:
-        st.markdown("""
-        <div style="background:white;padding:1rem;border-radius:10px;box-shadow:0 4px 12px rgba(0,0,0,0.08);">
-            <h4 style="color:#333;">Scrum Master</h4>
-            <p style="color:#666;font-size:0.9rem;">Certified ScrumMaster®</p>
-            <p style="color:#667eea;font-size:0.8rem;">Obtenu : 2021</p>
-        </div>
-        """, unsafe_allow_html=True)
+    for i, cert in enumerate(PROFILE["certifications"]):
+        with certs[i % 3]:
+            st.markdown(f"""
+            <div style="background:white;padding:1rem;border-radius:10px;box-shadow:0 4px 12px rgba(0,0,0,0.08);">
+                <h4 style="color:#333;">{cert["name"]}</h4>
+                <p style="color:#666;font-size:0.9rem;">{_(cert["detail"])}</p>
+                <p style="color:#667eea;font-size:0.8rem;">{_("Obtenu : {year}").format(year=cert["year"])}</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+# -----------------------------------------------------
+elif page == "🎯 Matching":
+    st.title(_("🎯 Adéquation à une offre"))
+    st.markdown(_("Collez une offre d'emploi : les expériences, réalisations, projets et formations "
+                  "les plus pertinents sont classés par similarité TF-IDF."))
+    
+    with st.form("job_matching"):
+        job_description = st.text_area(_("Offre d'emploi"), height=200,
+                                       placeholder=_("Ex : Data Analyst Power BI / SQL, reporting KPI pour la direction..."))
+        submitted = st.form_submit_button(_("🔍 Analyser l'adéquation"))
+    
+    if submitted and job_description.strip():
+        track("action", "matching")
+        started = time.perf_counter()
+        index = tfidf_index(DATA_VERSION, EXPERIENCES, EDUCATIONS, PROJECTS)
+        matches, relevant = index.search(job_description)
+        elapsed = (time.perf_counter() - started) * 1000
+        
+        if matches.empty:
+            st.warning(_("Aucun terme de l'offre ne figure dans le portfolio."))
+        else:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.markdown(kpi_card(_("Score d'adéquation"), f"{matches['Score'].head(3).mean() * 100:.0f}/100",
+                                     "", "#667eea", "🎯"), unsafe_allow_html=True)
+            with col2:
+                st.markdown(kpi_card(_("Éléments pertinents"), str(relevant), "", "#42be65", "📌"),
+                           unsafe_allow_html=True)
+            with col3:
+                st.markdown(kpi_card(_("Meilleur élément"), _(matches["Type"].iloc[0]), "", "#f1c21b", "🏆"),
+                           unsafe_allow_html=True)
+            st.caption(_("Calculé en {ms:.1f} ms").format(ms=elapsed))
+            st.dataframe(
+                translate_columns(matches.assign(Type=matches["Type"].map(_))),
+                column_config={_("Score"): st.column_config.ProgressColumn(_("Score"), min_value=0, max_value=1,
+                                                                            format="%.2f")},
+                use_container_width=True, hide_index=True
+            )
 
 # -----------------------------------------------------
 elif page == "🎓 Formation":
-    st.title("🎓 Formation & Éducation")
+    st.title(_("🎓 Formation & Éducation"))
     
     # Introduction avec statistiques
+    subtitles = PROFILE["kpi_subtitles"]
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.markdown(kpi_card("Diplômes", "2", "Master & Bachelor", "#42be65", "🎓"), 
+        st.markdown(kpi_card(_("Diplômes"), str(len(EDUCATIONS)), _(subtitles["diplomas"]), "#42be65", "🎓"), 
                    unsafe_allow_html=True)
     with col2:
-        st.markdown(kpi_card("Certifications", "5+", "Techniques & Métier", "#667eea", "📜"), 
+        st.markdown(kpi_card(_("Certifications"), str(len(PROFILE["certifications"])), _(subtitles["certifications"]),
+                             "#667eea", "📜"), 
                    unsafe_allow_html=True)
     with col3:
-        st.markdown(kpi_card("Années d'études", "5", "Business & Data", "#f1c21b", "📚"), 
+        study_years = total_years(edu["duration"] for edu in EDUCATIONS)
+        st.markdown(kpi_card(_("Années d'études"), str(int(study_years)), _(subtitles["study_years"]),
+                             "#f1c21b", "📚"), 
                    unsafe_allow_html=True)
     
-    st.markdown("### 🏫 Mon parcours académique")
+    st.markdown(_("### 🏫 Mon parcours académique"))
     
     # Timeline des formations avec images
     for edu in EDUCATIONS:
@@ -1210,78 +4318,149 @@ elif page == "🎓 Formation":
 
 # -----------------------------------------------------
 elif page == "📄 Contact":
-    st.title("📄 Contactez-moi")
+    st.title(_("📄 Contactez-moi"))
     
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        st.markdown("""
+        st.markdown(_("""
         ### 💬 Discutons de votre projet
         
         Vous avez un projet data, besoin d'un dashboard, ou souhaitez optimiser vos processus ?
         Prenons le temps d'échanger sur vos besoins.
-        """)
+        """))
         
         with st.form("contact_form"):
-            name = st.text_input("Nom complet")
+            name = st.text_input(_("Nom complet"))
             email = st.text_input("Email")
-            company = st.text_input("Entreprise")
-            subject = st.selectbox("Sujet", [
+            company = st.text_input(_("Entreprise"))
+            subject = st.selectbox(_("Sujet"), [
                 "Demande de conseil",
                 "Projet Data/BI",
                 "Opportunité professionnelle",
                 "Autre"
-            ])
+            ], format_func=_)
             message = st.text_area("Message", height=150)
             
-            submitted = st.form_submit_button("📤 Envoyer le message")
+            submitted = st.form_submit_button(_("📤 Envoyer le message"))
             if submitted:
-                st.success("✅ Message envoyé ! Je vous répondrai dans les 24h.")
+                track("action", "contact")
+                st.success(_("✅ Message envoyé ! Je vous répondrai dans les 24h."))
     
     with col2:
-        st.markdown("""
-        ### 📍 Informations de contact
+        contact = PROFILE["contact"]
+        st.markdown(f"""
+        ### {_("📍 Informations de contact")}
         
-        **Email professionnel**  
-        martin.alquier@business.com
+        **{_("Email professionnel")}**  
+        {contact.get("email", "–")}
         
-        **Téléphone**  
-        +33 6 XX XX XX XX
+        **{_("Téléphone")}**  
+        {contact.get("phone", "–")}
         
-        **Localisation**  
-        📍 Paris, France
+        **{_("Localisation")}**  
+        📍 {_(contact.get("location", "–"))}
         
-        **Disponibilité**  
-        🟢 Disponible pour de nouvelles opportunités
+        **{_("Disponibilité")}**  
+        🟢 {_("Disponible pour de nouvelles opportunités")}
         """)
         
         st.divider()
         
-        st.markdown("### 🔗 Liens")
-        st.markdown("""
-        [![LinkedIn](https://img.shields.io/badge/-LinkedIn-0077B5?style=for-the-badge&logo=linkedin&logoColor=white)](https://linkedin.com/in/martinalquier)
-        [![GitHub](https://img.shields.io/badge/-GitHub-181717?style=for-the-badge&logo=github&logoColor=white)](https://github.com/martinalquier)
-        [![Tableau Public](https://img.shields.io/badge/-Tableau-E97627?style=for-the-badge&logo=tableau&logoColor=white)](https://public.tableau.com/)
-        """)
+        st.markdown(_("### 🔗 Liens"))
+        badges = {
+            "linkedin": "[![LinkedIn](https://img.shields.io/badge/-LinkedIn-0077B5?style=for-the-badge&logo=linkedin&logoColor=white)]",
+            "github": "[![GitHub](https://img.shields.io/badge/-GitHub-181717?style=for-the-badge&logo=github&logoColor=white)]",
+            "tableau": "[![Tableau Public](https://img.shields.io/badge/-Tableau-E97627?style=for-the-badge&logo=tableau&logoColor=white)]"
+        }
+        st.markdown("\n".join(badge(markdown_image, key.capitalize(), contact[key])
+                               for key, markdown_image in badges.items() if contact.get(key)))
+
+# -----------------------------------------------------
+elif page == "📊 Statistiques":
+    st.title(_("📊 Statistiques de visite"))
+    writer = analytics()
+    st.caption(_("Statistiques first-party, écrites par lots toutes les {seconds:g}s ({logged} événements "
+                 "reçus par ce worker, {us:.1f} µs par enregistrement).").format(
+                   seconds=ANALYTICS_FLUSH_SECONDS, logged=writer.logged,
+                   us=writer.log_seconds / max(writer.logged, 1) * 1e6))
+    
+    days = st.selectbox(_("Période"), [7, 30, 90], index=1,
+                        format_func=lambda d: _("{days} derniers jours").format(days=d))
+    pages, daily, funnel = analytics_rollups(PROFILE["slug"], days)
+    
+    if pages.empty:
+        st.info(_("Aucune visite enregistrée sur la période."))
+    else:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown(kpi_card(_("Visites"), str(int(daily["Visites"].sum())), _("{days} derniers jours").format(days=days),
+                                 "#667eea", "👥"), unsafe_allow_html=True)
+        with col2:
+            st.markdown(kpi_card(_("Pages vues"), str(int(pages["Vues"].sum())), _("Changements de page"),
+                                 "#42be65", "📄"), unsafe_allow_html=True)
+        with col3:
+            top_page = pages["Page"].iloc[0]
+            st.markdown(kpi_card(_("Page la plus vue"), _(top_page), _("{views} vues").format(views=pages['Vues'].iloc[0]),
+                                 "#f1c21b", "🏆"), unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown(_("### 📈 Visites par jour"))
+            fig = px.bar(daily, x="Jour", y="Visites", color_discrete_sequence=["#667eea"])
+            fig.update_layout(height=320, plot_bgcolor="white", margin=dict(t=20, b=20))
+            plotly_chart(fig, use_container_width=True)
+        with col2:
+            st.markdown(_("### 🔻 Entonnoir de conversion"))
+            fig = go.Figure(go.Funnel(
+                y=[step.replace("action:contact", "✉️ Message envoyé") for step in FUNNEL_STEPS],
+                x=funnel, textinfo="value+percent initial", marker={"color": "#42be65"}
+            ))
+            fig.update_layout(height=320, margin=dict(t=20, b=20))
+            plotly_chart(fig, use_container_width=True)
+        
+        st.markdown(_("### ⏱️ Vues et temps par page"))
+        st.caption(_("Temps moyen : jusqu'à la page suivante de la même session (la dernière page n'est pas chronométrée)."))
+        st.dataframe(translate_columns(pages.round({"Temps moyen (s)": 1}).assign(Page=pages["Page"].map(_))),
+                     use_container_width=True, hide_index=True)
+
+# =====================================================
+# POIDS DE LA PAGE
+# =====================================================
+# Interrupteur plutôt qu'expander : le contenu d'un expander fermé s'exécute
+# quand même, et la pesée des graphiques n'est due que si elle est affichée
+if st.toggle(_("📏 Poids de la page"), key="page_weight_open"):
+    full_total = sum(full for full, _lite in PAGE_WEIGHT.values()) / 1024
+    lite_total = sum(lite for _full, lite in PAGE_WEIGHT.values()) / 1024
+    st.caption(_("Estimation pour la page actuelle : {full:,.0f} Ko en mode complet, {lite:,.0f} Ko en mode léger "
+                 "(-{saving:.0%}). Tailles non compressées des CSS, images, badges (estimés à {badge:g} Ko) et "
+                 "graphiques ; textes et tableaux, identiques dans les deux modes, ne sont pas comptés.").format(
+        full=full_total, lite=lite_total, saving=1 - lite_total / max(full_total, 1e-9), badge=BADGE_BYTES / 1024))
+    st.markdown("\n".join([
+        f"| {_('Contenu')} | {_('Mode complet (Ko, estim.)')} | {_('Mode léger (Ko, estim.)')} |",
+        "|---|---:|---:|",
+        *(f"| {_(category)} | {full / 1024:,.1f} | {lite / 1024:,.1f} |" for category, (full, lite) in PAGE_WEIGHT.items())
+    ]))
 
 # =====================================================
 # FOOTER
 # =====================================================
 st.divider()
+links = PROFILE["links"]
+repo = github_repo(links.get("repository"))
+repo_stats = github_stats().get(repo) if repo else None
+footer_links = " | ".join(
+    f'<a href="{url}" style="color:#667eea;text-decoration:none;">{label}</a>'
+    for label, url in [("📂 GitHub Repository", links.get("repository")), ("🌐 Live Demo", links.get("demo"))] if url
+)
 col1, col2, col3 = st.columns(3)
 with col2:
     st.markdown(
-        """
+        f"""
         <div style="text-align:center;color:#666;font-size:0.9rem;padding:2rem 0;">
-            <p>© 2024 Martin Alquier – Business Analyst Data & IA</p>
-            <p style="font-size:0.8rem;">
-            <a href="https://github.com/martmartin1103-cyber/martin-portfolio-data" style="color:#667eea;text-decoration:none;">
-                📂 GitHub Repository
-            </a> | 
-            <a href="https://martin-portfolio-data.streamlit.app" style="color:#667eea;text-decoration:none;">
-                🌐 Live Demo
-            </a>
-            </p>
+            <p>© 2024 {PROFILE["name"]}</p>
+            <p style="font-size:0.8rem;">{footer_links}</p>
+            <p style="font-size:0.75rem;">{github_badges(repo_stats) if repo_stats else ""}</p>
         </div>
         """,
         unsafe_allow_html=True
@@ -0,0 +1,22 @@
+#!/usr/bin/env bash
+# Lance plusieurs workers Streamlit partageant le même cache disque.
+# Usage : ./deploy/run_workers.sh [nombre_de_workers] [port_de_base]
+# Le bloc upstream de deploy/nginx.conf liste 4 workers (ports 8501 à 8504) :
+# changer le nombre de workers ou le port de base impose de l'ajuster aussi.
+set -euo pipefail
+
+WORKERS="${1:-4}"
+BASE_PORT="${2:-8501}"
+export PORTFOLIO_CACHE_DIR="${PORTFOLIO_CACHE_DIR:-/var/tmp/portfolio_cache}"
+mkdir -p "$PORTFOLIO_CACHE_DIR"
+
+cd "$(dirname "$0")/.."
+for i in $(seq 0 $((WORKERS - 1))); do
+    port=$((BASE_PORT + i))
+    echo "▶ Worker $i sur le port $port"
+    streamlit run app.py \
+        --server.port "$port" \
+        --server.address 127.0.0.1 \
+        --server.headless true &
+done
+wait
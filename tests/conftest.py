@@ -0,0 +1,23 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Cache disque isolé : les tests ne lisent ni n'écrivent celui d'une instance locale
+os.environ.setdefault("PORTFOLIO_CACHE_DIR", tempfile.mkdtemp(prefix="portfolio-tests-"))
+# Pas d'appel réseau vers l'API GitHub pendant les tests
+os.environ.setdefault("PORTFOLIO_GITHUB_API", "http://127.0.0.1:9")
+
+
+@pytest.fixture(scope="session")
+def app():
+    """
+    Module app.py importé hors de `streamlit run` (mode « bare ») : le script
+    s'exécute une fois, ses fonctions sont ensuite appelées directement
+    """
+    import app as module
+    return module
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def sample(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Trimestre": [f"2024 T{i % 4 + 1}" for i in range(rows)],
+        "Revenu": rng.normal(200, 20, rows).round(1),
+        "Clients": rng.integers(10, 80, rows),
+    })
+
+
+def full(app, df):
+    return app.IncrementalAggregates(["Trimestre"], ["Revenu", "Clients"]).update(df)
+
+
+def test_appended_rows_are_merged_as_a_delta(app):
+    df = sample(40)
+    aggregates = app.IncrementalAggregates(["Trimestre"], ["Revenu", "Clients"])
+    aggregates.update(df.iloc[:25])
+    result = aggregates.update(df)
+    assert (aggregates.rebuilds, aggregates.appends) == (1, 1)
+    pd.testing.assert_frame_equal(result, full(app, df), check_dtype=False)
+
+
+def test_new_group_in_appended_rows(app):
+    df = pd.concat([sample(12), sample(3, seed=1).assign(Trimestre="2025 T1")], ignore_index=True)
+    aggregates = app.IncrementalAggregates(["Trimestre"], ["Revenu", "Clients"])
+    aggregates.update(df.iloc[:12])
+    result = aggregates.update(df)
+    assert aggregates.appends == 1
+    assert result.loc["2025 T1", ("Clients", "count")] == 3
+    pd.testing.assert_frame_equal(result, full(app, df), check_dtype=False)
+
+
+def test_modified_history_triggers_a_rebuild(app):
+    df = sample(20)
+    aggregates = app.IncrementalAggregates(["Trimestre"], ["Revenu", "Clients"])
+    aggregates.update(df)
+    corrected = df.copy()
+    corrected.loc[3, "Revenu"] = 10_000
+    result = aggregates.update(corrected)
+    assert (aggregates.rebuilds, aggregates.appends) == (2, 0)
+    assert result[("Revenu", "max")].max() == 10_000
+    pd.testing.assert_frame_equal(result, full(app, corrected), check_dtype=False)
+
+
+def test_unchanged_data_is_not_reaggregated(app):
+    df = sample(8)
+    aggregates = app.IncrementalAggregates(["Trimestre"], ["Revenu", "Clients"])
+    first = aggregates.update(df)
+    second = aggregates.update(df.copy())
+    assert (aggregates.rebuilds, aggregates.appends) == (1, 0)
+    pd.testing.assert_frame_equal(first, second)
+    assert second[("Revenu", "mean")].to_numpy() == pytest.approx(
+        df.groupby("Trimestre")["Revenu"].mean().to_numpy())
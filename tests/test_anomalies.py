@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+
+def test_false_positive_rate_on_gaussian_noise(app):
+    noise = np.random.default_rng(0).normal(size=(20_000, 4))
+    flags = app.AnomalyDetector().update(pd.DataFrame(noise)).to_numpy()
+    rate = flags[app.ANOMALY_WINDOW:].mean()
+    assert rate < 0.01
+
+
+def test_spike_is_flagged(app):
+    values = 100 + np.random.default_rng(1).normal(size=60)
+    values[50] += 15
+    flags = app.AnomalyDetector().update(pd.DataFrame({"Revenu": values}))["Revenu"]
+    assert flags[50]
+    assert flags.sum() <= 2
+
+
+def test_incremental_update_matches_full_analysis(app):
+    values = 100 + np.random.default_rng(2).normal(size=(80, 2))
+    values[70, 1] -= 20
+    full = app.AnomalyDetector().update(pd.DataFrame(values))
+    detector = app.AnomalyDetector()
+    detector.update(pd.DataFrame(values[:40]))
+    incremental = detector.update(pd.DataFrame(values))
+    pd.testing.assert_frame_equal(full, incremental)
+    assert full.iloc[70, 1]
@@ -0,0 +1,50 @@
+import re
+
+
+def page_text(pdf):
+    """
+    Textes des opérateurs Tj, décodés depuis WinAnsi (cp1252)
+    """
+    strings = re.findall(rb"\((.*?)(?<!\\)\) Tj", pdf)
+    return [s.replace(b"\\(", b"(").replace(b"\\)", b")").replace(b"\\\\", b"\\").decode("cp1252") for s in strings]
+
+
+def test_cv_pdf_structure(app):
+    pdf = app.build_cv_pdf(app.DEFAULT_PROFILE)
+    assert pdf.startswith(b"%PDF-1.4\n") and pdf.endswith(b"%%EOF\n")
+    # Table xref : chaque offset pointe sur son objet
+    xref = int(re.search(rb"startxref\n(\d+)\n", pdf).group(1))
+    assert pdf[xref:].startswith(b"xref\n")
+    offsets = [int(offset) for offset in re.findall(rb"^(\d{10}) 00000 n $", pdf, re.M)]
+    for number, offset in enumerate(offsets, start=1):
+        assert pdf[offset:].startswith(b"%d 0 obj\n" % number)
+    # Longueur déclarée de chaque flux de contenu
+    for length, stream in re.findall(rb"<< /Length (\d+) >>\nstream\n(.*?)\nendstream", pdf, re.S):
+        assert int(length) == len(stream)
+
+
+def test_cv_pdf_content(app):
+    profile = app.DEFAULT_PROFILE
+    text = "\n".join(page_text(app.build_cv_pdf(profile)))
+    assert profile["name"] in text
+    for section in ("Expériences professionnelles", "Formation", "Compétences"):
+        assert section in text
+    for exp in profile["experiences"]:
+        assert exp["company"] in text
+
+
+def test_cv_pdf_encoding_keeps_text_visible(app):
+    encode = app.PdfDocument._encode
+    assert encode("Café – (test)") == "Café – \\(test\\)".encode("cp1252")
+    # Icône de titre retirée, caractère hors WinAnsi remplacé de façon visible
+    assert encode("📄 CV") == b"CV"
+    assert encode("ĉ → ✓") == b"c -> v"
+    assert encode("Œuvre … « x »") == "Œuvre … « x »".encode("cp1252")
+    assert encode("x ∑ y") == b"x ? y"
+
+
+def test_cv_pdf_paginates_long_profiles(app):
+    profile = {**app.DEFAULT_PROFILE, "experiences": app.DEFAULT_PROFILE["experiences"] * 10}
+    pdf = app.build_cv_pdf(profile)
+    pages = int(re.search(rb"/Type /Pages /Kids \[.*?\] /Count (\d+)", pdf).group(1))
+    assert pages > 1
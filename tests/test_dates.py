@@ -0,0 +1,33 @@
+from datetime import date
+
+import pytest
+
+
+@pytest.mark.parametrize("duration, expected", [
+    ("Sept 2022 - Présent", (date(2022, 9, 1), None)),
+    ("Janv. 2020 – Août 2022", (date(2020, 1, 1), date(2022, 9, 1))),
+    ("Mars 2021 à Déc 2021", (date(2021, 3, 1), date(2022, 1, 1))),
+    # Année seule : la fin inclut toute l'année nommée
+    ("2021 - 2023", (date(2021, 1, 1), date(2024, 1, 1))),
+    ("2019-2020", (date(2019, 1, 1), date(2021, 1, 1))),
+    ("Oct 2023 - en cours", (date(2023, 10, 1), None)),
+])
+def test_parse_date_range(app, duration, expected):
+    assert app.parse_date_range(duration) == expected
+
+
+@pytest.mark.parametrize("duration", ["Bientôt", "Printemps 2021 - 2022", "2021 - demain"])
+def test_parse_date_range_rejects_unknown_dates(app, duration):
+    with pytest.raises(ValueError, match="Date non reconnue"):
+        app.parse_date_range(duration)
+
+
+def test_total_years_counts_overlaps_once(app):
+    years = app.total_years(["2020 - 2021", "Juil 2021 - 2022", "Janv 2024 - Présent"], today=date(2025, 1, 1))
+    assert years == pytest.approx(4, abs=0.01)
+
+
+def test_duration_years_of_an_inclusive_year_range(app):
+    start, end, years = app._duration_years("2021 - 2023", current_year=2025)
+    assert (start, end) == (2021, 2023)
+    assert years == pytest.approx(3, abs=0.01)
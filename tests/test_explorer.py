@@ -0,0 +1,56 @@
+import itertools
+
+import pytest
+
+# Version fictive propre à chaque appel : run_explorer_query est mémorisé par (requête, version)
+_versions = itertools.count()
+
+
+@pytest.fixture(scope="module")
+def query(app):
+    snapshot = app.current_snapshot()
+
+    def run(sql, **kwargs):
+        return app.run_explorer_query(app.normalize_sql(sql), f"test-{next(_versions)}", snapshot, **kwargs)
+    return run
+
+
+def test_select_on_registered_datasets(query):
+    df, truncated = query("SELECT Mois, Revenu FROM mensuel ORDER BY Revenu DESC LIMIT 3;")
+    assert list(df.columns) == ["Mois", "Revenu"]
+    assert len(df) == 3 and not truncated
+
+
+def test_with_query_is_allowed(query):
+    df, _ = query("WITH t AS (SELECT Secteur, SUM(CA) AS ca FROM ventes GROUP BY Secteur) SELECT COUNT(*) AS n FROM t")
+    assert df["n"].iloc[0] == 5
+
+
+def test_result_is_capped(query):
+    df, truncated = query("SELECT * FROM range(100)", row_cap=10)
+    assert len(df) == 10 and truncated
+
+
+@pytest.mark.parametrize("sql", [
+    "DROP TABLE details",
+    "SELECT 1; SELECT 2",
+    "SELECT 1; DROP TABLE details",
+    "CREATE TABLE t AS SELECT * FROM details",
+    "COPY details TO 'out.csv'",
+    "ATTACH 'other.db'",
+    "INSTALL httpfs",
+    "SET threads = 64",
+])
+def test_only_a_single_select_is_allowed(query, sql):
+    with pytest.raises(ValueError, match="SELECT"):
+        query(sql)
+
+
+def test_no_file_access(query, app):
+    with pytest.raises(app.duckdb.Error):
+        query("SELECT * FROM read_csv_auto('/etc/hostname')")
+
+
+def test_long_query_is_interrupted(query, app):
+    with pytest.raises(app.duckdb.Error):
+        query("SELECT COUNT(*) FROM range(100000000) a, range(100000000) b", timeout=0.2)
@@ -0,0 +1,158 @@
+import asyncio
+import http.server
+import json
+import socketserver
+import threading
+import time
+
+import pytest
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Faux serveur de l'API GitHub : chaque chemin simule un cas de transport
+    """
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _json(self, payload, status=200, length=True):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        if length:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        server.hits.append((self.path, self.client_address[1]))
+        if self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for part in (b'{"chunked": ', b"true}"):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(part), part))
+            self.wfile.write(b"0\r\n\r\n")
+        elif self.path == "/eof":
+            # Ni Content-Length ni chunked : le corps s'arrête à la fermeture
+            self.close_connection = True
+            self._json({"eof": True}, length=False)
+        elif self.path == "/silent-close":
+            # Keep-alive annoncé, puis connexion fermée sans prévenir
+            self.close_connection = True
+            self._json({"closed": True})
+        elif self.path.startswith("/moved"):
+            self.send_response(301)
+            self.send_header("Location", f"http://127.0.0.1:{server.server_address[1]}/repos{self.path[6:]}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/elsewhere":
+            self.send_response(302)
+            self.send_header("Location", "http://example.invalid/repos/x")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/repos/owner/repo":
+            if server.fail:
+                self._json({"message": "rate limited"}, status=403)
+            else:
+                self._json({"stargazers_count": server.stars, "forks_count": 1, "html_url": "https://github.com/owner/repo"})
+        elif self.path == "/repos/owner/repo/languages":
+            self._json({"Python": 3, "SQL": 1})
+        elif self.path == "/repos/owner/repo/commits?per_page=1":
+            self._json([{"commit": {"committer": {"date": "2024-05-01T10:00:00Z"}}}])
+        else:
+            self._json({"path": self.path})
+
+
+class StubServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server():
+    srv = StubServer(("127.0.0.1", 0), StubHandler)
+    srv.hits, srv.stars, srv.fail = [], 1, False
+    threading.Thread(target=srv.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def fetch(app, server, *paths):
+    pool = app.AsyncHttpPool(f"http://127.0.0.1:{server.server_address[1]}", 2)
+
+    async def run():
+        return [await pool.get_json(path) for path in paths]
+    return asyncio.run(run())
+
+
+def ports(server):
+    return [port for _, port in server.hits]
+
+
+def test_keep_alive_reuses_connection(app, server):
+    assert fetch(app, server, "/a", "/b") == [{"path": "/a"}, {"path": "/b"}]
+    assert len(set(ports(server))) == 1
+
+
+def test_chunked_body(app, server):
+    assert fetch(app, server, "/chunked", "/a") == [{"chunked": True}, {"path": "/a"}]
+    assert len(set(ports(server))) == 1
+
+
+def test_body_without_length_is_read_to_eof(app, server):
+    assert fetch(app, server, "/eof", "/a") == [{"eof": True}, {"path": "/a"}]
+    # Connexion terminée par le corps : la requête suivante en ouvre une autre
+    assert len(set(ports(server))) == 2
+
+
+def test_silently_closed_keep_alive_is_retried(app, server):
+    assert fetch(app, server, "/silent-close", "/a") == [{"closed": True}, {"path": "/a"}]
+    assert [path for path, _ in server.hits].count("/a") >= 1
+
+
+def test_same_host_redirect_is_followed(app, server):
+    assert fetch(app, server, "/moved/x?page=2") == [{"path": "/repos/x?page=2"}]
+
+
+def test_cross_host_redirect_is_not_followed(app, server):
+    with pytest.raises(RuntimeError, match="HTTP 302"):
+        fetch(app, server, "/elsewhere")
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_stale_while_revalidate(app, server):
+    stats = app.GitHubStats(f"http://127.0.0.1:{server.server_address[1]}", ttl=0.2, limit=2, retry=60)
+    # Premier accès : rien en cache, l'actualisation part en arrière-plan
+    assert stats.get("owner/repo") is None
+    assert wait_for(lambda: stats.get("owner/repo") is not None)
+    first = stats.get("owner/repo")
+    assert first["stars"] == 1
+    assert first["languages"] == {"Python": 0.75, "SQL": 0.25}
+    assert first["last_commit"] == "2024-05-01"
+
+    # Valeur périmée : servie immédiatement pendant l'actualisation
+    server.stars = 2
+    time.sleep(0.25)
+    assert stats.get("owner/repo")["stars"] == 1
+    assert wait_for(lambda: stats.get("owner/repo")["stars"] == 2)
+
+    # Échec : la dernière valeur reste servie et n'est pas retentée avant `retry`
+    server.fail = True
+    time.sleep(0.25)
+    stats.get("owner/repo")
+    assert wait_for(lambda: stats.errors == 1)
+    requests = len(server.hits)
+    assert stats.get("owner/repo")["stars"] == 2
+    time.sleep(0.1)
+    assert len(server.hits) == requests